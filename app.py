@@ -1,16 +1,41 @@
 import asyncio
 import aiohttp
 import time
+import math
 import logging
 import statistics
 import sys
 import json
-from collections import defaultdict
+from collections import defaultdict, deque
+from enum import IntEnum
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple, Union, NamedTuple
+from urllib.parse import urlsplit
+from typing import List, Dict, Any, Optional, Tuple, Union, NamedTuple, Deque, Callable, Awaitable
+import re
 import random # User-Agent ve URL seçimi için
 import os # Dosya yolu işlemleri için
-import ssl # SSL context oluşturmak için (opsiyonel, aiohttp None/False ile halleder)
+import contextlib
+import socket
+import errno
+import gc
+import heapq
+import tracemalloc
+import ssl # Paylaşılan SSL context'i ve TLS el sıkışması ölçümleri için
+
+try:
+    import httpx # HTTP/2 motoru için opsiyonel bağımlılık (pip install "httpx[http2]")
+except ImportError:
+    httpx = None
+
+try:
+    import resource # Bellek (RSS) ölçümü için; Windows'ta bulunmaz
+except ImportError:
+    resource = None
+
+try:
+    import uvloop # Daha hızlı event loop için opsiyonel bağımlılık (pip install uvloop)
+except ImportError:
+    uvloop = None
 
 # --- Logger Kurulumu ---
 # Uygulama genelinde kullanılacak logger nesnesi
@@ -177,6 +202,89 @@ def get_yes_no_input(prompt: str, default_yes: bool = False) -> bool:
             print("Hata: Lütfen sadece 'E' (Evet) veya 'H' (Hayır) girin.")
 
 # --- Test Konfigürasyonu ---
+class CapacitySearchConfig(NamedTuple):
+    """Kapasite (maksimum sürdürülebilir RPS) arama modunun parametreleri."""
+    start_rps: float = 10.0          # İlk adımda uygulanacak hedef RPS
+    max_rps: float = 1000.0          # Aramanın çıkılabileceği en yüksek hedef RPS
+    growth_factor: float = 2.0       # SLO ihlal edilene kadar her adımda RPS'nin çarpılacağı katsayı
+    step_duration: int = 10          # Her adımın (yük seviyesinin) süresi (saniye)
+    resolution_rps: float = 5.0      # İkili arama, alt/üst sınır farkı bu değerin altına inince durur
+    slo_percentile: float = 95.0     # SLO için kullanılacak gecikme yüzdeliği (örn: 95 => p95)
+    slo_latency: float = 0.5         # Yüzdelik gecikme için üst sınır (saniye)
+    slo_error_rate: float = 1.0      # Kabul edilebilir en yüksek başarısızlık oranı (yüzde)
+    min_achieved_ratio: float = 0.9  # Gerçekleşen RPS'nin hedefe oranı bunun altındaysa yük sürdürülemiyor sayılır
+
+class BaselineConfig(NamedTuple):
+    """Önceki bir testle karşılaştırma (regresyon tespiti) ve baseline kaydetme ayarları."""
+    save_path: Optional[str] = None         # Testin sonucu bu dosyaya baseline olarak kaydedilir
+    compare_path: Optional[str] = None      # Test sonucu bu baseline dosyası ile karşılaştırılır
+    max_regression_percent: float = 10.0    # Gecikme artışı / RPS düşüşü için izin verilen en yüksek yüzde
+    significance_level: float = 0.05        # KS testi için anlamlılık düzeyi (p < alfa => anlamlı fark)
+    max_failure_rate_increase: float = 1.0  # Başarısızlık oranında izin verilen en yüksek artış (yüzde puanı)
+
+class EndpointStatsConfig(NamedTuple):
+    """URL dosyası modunda uç nokta (endpoint) bazlı istatistik ayarları."""
+    grouping: str = "url"         # "url", "path" (yol şablonu, kimlikler {id}), "host" veya "regex"
+    pattern: Optional[str] = None # grouping="regex" ise: ilk yakalama grubu (yoksa tüm eşleşme) grup anahtarı olur
+    max_groups: int = 50          # Ayrı tutulacak en fazla grup; fazlası "(diğer)" kovasına katlanır
+    top_n: int = 5                # Özette gösterilecek en yavaş / en çok hata alan grup sayısı
+
+class TransportConfig(NamedTuple):
+    """İstekleri gönderecek HTTP istemci motorunun (transport) seçimi ve ayarları."""
+    engine: str = "aiohttp"               # "aiohttp" (HTTP/1.1), "http2" (httpx + h2, stream çoklama) veya "raw" (asyncio.Protocol)
+    http2_connections: int = 1            # HTTP/2 motorunda açılacak bağlantı sayısı (stream'ler bunlara dağıtılır)
+    http2_prior_knowledge: bool = False   # http:// hedeflerde doğrudan HTTP/2 (h2c) kullan
+    raw_pipeline_depth: int = 1           # "raw" motorunda bağlantı başına yanıt bekleyebilecek istek sayısı (1 = pipelining yok)
+
+class TlsConfig(NamedTuple):
+    """Tüm motorların paylaştığı, test başında bir kez oluşturulan SSLContext'in ayarları."""
+    session_resumption: bool = True       # TLS oturum devamı (session ticket / session ID) kullanılsın mı
+    ca_bundle: Optional[str] = None       # Sunucu sertifikasını doğrulamak için özel CA dosyası (None = sistem CA'ları)
+    client_cert: Optional[str] = None     # mTLS için istemci sertifikası (PEM)
+    client_key: Optional[str] = None      # İstemci sertifikasının özel anahtarı (None = client_cert içinde)
+    min_version: Optional[str] = None     # En düşük TLS sürümü ("1.0", "1.1", "1.2", "1.3"; None = OpenSSL varsayılanı)
+
+# TlsConfig.min_version değerlerinin ssl.TLSVersion karşılıkları
+TLS_MIN_VERSIONS = {
+    "1.0": ssl.TLSVersion.TLSv1,
+    "1.1": ssl.TLSVersion.TLSv1_1,
+    "1.2": ssl.TLSVersion.TLSv1_2,
+    "1.3": ssl.TLSVersion.TLSv1_3,
+}
+
+class TargetRoutingConfig(NamedTuple):
+    """İsteklerin URL'deki host yerine bağlanacağı yerel hedef (ağ yığını gürültüsü olmadan ölçüm için)."""
+    unix_socket: Optional[str] = None             # Tüm istekler bu Unix domain socket üzerinden gönderilir (URL yalnızca Host/yol için)
+    host_overrides: Optional[Dict[str, str]] = None # "host[:port]" -> "adres[:port]" (örn: "api.example.com:443" -> "127.0.0.1:15001")
+
+class ResponseCheckConfig(NamedTuple):
+    """Yanıtların bir örneklem üzerinde durum kodu dışındaki ölçütlerle doğrulanması (örn. '200 OK' içinde hata JSON'u)."""
+    sample_rate: float = 1.0                        # Gövdesi alınıp kontrol edilecek yanıtların oranı (0-1)
+    expected_statuses: Optional[Tuple[int, ...]] = None # Kabul edilen durum kodları (None = kontrol yok)
+    headers: Optional[Dict[str, str]] = None        # Başlık adı -> değerde aranacak düzenli ifade
+    body_contains: Optional[str] = None             # Gövdede bulunması gereken metin
+    body_regex: Optional[str] = None                # Gövdede eşleşmesi gereken düzenli ifade
+    json_path: Optional[str] = None                 # JSON gövdede bulunması gereken alan (örn: "data.items[0].status")
+    json_value: Optional[str] = None                # json_path değerinin eşit olması gereken değer (None = yalnızca varlık)
+    min_size: Optional[int] = None                  # En küçük gövde boyutu (bayt)
+    max_size: Optional[int] = None                  # En büyük gövde boyutu (bayt)
+
+class GcTuningConfig(NamedTuple):
+    """Uzun ve yüksek RPS'li testlerde üreticinin kendi GC duraklamalarını azaltma ayarları."""
+    mode: str = "default"                 # "default" (Python varsayılanı), "tuned" (yüksek nesil-0 eşiği) veya "disabled" (otomatik GC kapalı)
+    freeze: bool = True                   # Başlangıçta oluşan nesneleri gc.freeze ile kalıcı nesle taşı (taramalara girmez)
+    gen0_threshold: int = 50000           # "tuned" modunda nesil-0 eşiği (Python varsayılanı 700)
+    collect_interval: float = 1.0         # "disabled" modunda kontrollü (nesil 0-1) toplamaların aralığı (saniye)
+    allocation_sample_interval: float = 0.0 # tracemalloc örnekleme pencereleri arasındaki süre (saniye, 0 = örnekleme yok)
+    allocation_sample_window: float = 0.5 # Her tracemalloc örnekleme penceresinin süresi (saniye)
+
+GC_TUNING_MODES = ("default", "tuned", "disabled")
+
+class WarmupConfig(NamedTuple):
+    """Ölçümden önce, yapılandırılan yükle uygulanan ve istatistiklere dahil edilmeyen ısınma aşaması."""
+    duration: float = 10.0                # Isınma süresi (saniye); requests > 0 ise kullanılmaz
+    requests: int = 0                     # Isınma için gönderilecek istek sayısı (0 = süreye göre)
+
 class TestConfig(NamedTuple):
     """Testin tüm parametrelerini içeren yapı."""
     target_url: Optional[str] # Tek URL modu için kullanılır (url_file varsa None olabilir)
@@ -194,48 +302,405 @@ class TestConfig(NamedTuple):
     target_rps: float         # Hedeflenen toplam Saniye Başına İstek (RPS) (0 = limitsiz)
     verify_ssl: bool          # SSL/TLS sertifikalarının doğrulanıp doğrulanmayacağı
     assertions: Dict[str, float] # Test sonu kontrolleri (örn: max ortalama gecikme, max hata oranı)
+    capacity_search: Optional[CapacitySearchConfig] = None # Kapasite arama modu (varsa duration/total_requests kullanılmaz)
+    baseline: Optional[BaselineConfig] = None # Baseline kaydetme/karşılaştırma ayarları (varsa)
+    co_correction: bool = False # Rate limit aktifken gecikmeleri koordineli ihmale karşı düzelt (HdrHistogram tarzı)
+    transport: TransportConfig = TransportConfig() # HTTP istemci motoru (aiohttp / HTTP/2 / ham soket)
+    tls: TlsConfig = TlsConfig() # Paylaşılan SSLContext ayarları (oturum devamı, mTLS, CA, en düşük sürüm)
+    response_checks: Optional[ResponseCheckConfig] = None # Örneklenmiş yanıt doğrulaması (varsa)
+    routing: Optional[TargetRoutingConfig] = None # Unix domain socket veya host -> yerel adres sabitleme (varsa)
+    endpoint_stats: Optional[EndpointStatsConfig] = None # Uç nokta bazlı istatistikler (varsa)
+    gc_tuning: Optional[GcTuningConfig] = None # GC ayarı ve bellek ayırma örneklemesi (varsa)
+    warmup: Optional[WarmupConfig] = None # Ölçüm öncesi ısınma aşaması (varsa)
+    drain_timeout: Optional[float] = None # Test sonunda süren isteklerin tamamlanması için beklenecek en uzun süre (None = istek zaman aşımı kadar)
 
 # --- İstatistik Toplama Sınıfı ---
+# Özette raporlanan yanıt süresi yüzdelikleri
+SUMMARY_PERCENTILES = (50, 90, 95, 99)
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Sıralı bir listeden en yakın sıra (nearest-rank) yöntemiyle yüzdelik değeri döndürür."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(pct / 100.0 * len(sorted_values)) - 1 # 1 tabanlı sıradan 0 tabanlı indekse
+    return sorted_values[min(max(rank, 0), len(sorted_values) - 1)]
+
+class LatencyHistogram:
+    """
+    HdrHistogram benzeri, logaritmik-doğrusal kovalı kompakt gecikme histogramı.
+    Değerler mikrosaniye tamsayısı olarak tutulur; her ikinin kuvveti aralığı SUB_BUCKETS
+    doğrusal alt kovaya bölündüğünden göreli hata ~%3'ün altındadır. Kovalar seyrek
+    (dict) saklanır, böylece milyonlarca ölçüm birkaç KB ile ifade edilir.
+    """
+    SUB_BUCKETS = 32     # Her ikinin kuvveti aralığındaki doğrusal alt kova sayısı
+    _SUB_BITS = 5        # log2(SUB_BUCKETS)
+    UNIT = 1_000_000     # Saniye -> mikrosaniye
+
+    def __init__(self):
+        self.counts: Dict[int, int] = defaultdict(int) # Kova indeksi -> ölçüm sayısı
+        self.total_count: int = 0
+        self.max_value: int = 0 # Mikrosaniye
+
+    @classmethod
+    def _index_for(cls, value: int) -> int:
+        shift = max(value.bit_length() - cls._SUB_BITS - 1, 0)
+        return shift * cls.SUB_BUCKETS + (value >> shift)
+
+    @classmethod
+    def _value_for(cls, index: int) -> int:
+        """Kovanın temsil ettiği değer aralığının orta noktasını (mikrosaniye) döndürür."""
+        if index < 2 * cls.SUB_BUCKETS:
+            return index
+        shift = index // cls.SUB_BUCKETS - 1
+        mantissa = index - shift * cls.SUB_BUCKETS
+        return (mantissa << shift) + ((1 << shift) >> 1)
+
+    def record(self, seconds: float, count: int = 1):
+        """Bir gecikme değerini (saniye) histograma ekler."""
+        value = int(seconds * self.UNIT)
+        if value < 0:
+            value = 0
+        self.counts[self._index_for(value)] += count
+        self.total_count += count
+        if value > self.max_value:
+            self.max_value = value
+
+    def record_with_expected_interval(self, seconds: float, expected_interval: float):
+        """
+        Gecikmeyi koordineli ihmal (coordinated omission) düzeltmesiyle kaydeder
+        (HdrHistogram'ın recordValueWithExpectedInterval karşılığı): değer beklenen aralıktan
+        büyükse, gecikme süresince gönderilmesi gerekip gönderilemeyen isteklerin
+        yaşayacağı gecikmeler (değer - k * aralık) de histograma eklenir.
+        """
+        self.record(seconds)
+        if expected_interval <= 0:
+            return
+        missing = seconds - expected_interval
+        while missing >= expected_interval:
+            self.record(missing)
+            missing -= expected_interval
+
+    def merge(self, other: "LatencyHistogram"):
+        """Başka bir histogramın sayımlarını bu histograma ekler."""
+        for index, count in other.counts.items():
+            self.counts[index] += count
+        self.total_count += other.total_count
+        self.max_value = max(self.max_value, other.max_value)
+
+    def percentile(self, pct: float) -> float:
+        """İstenen yüzdeliği (0-100) saniye cinsinden döndürür (veri yoksa 0.0)."""
+        if self.total_count == 0:
+            return 0.0
+        target = max(math.ceil(pct / 100.0 * self.total_count), 1)
+        running = 0
+        for index in sorted(self.counts):
+            running += self.counts[index]
+            if running >= target:
+                return min(self._value_for(index), self.max_value) / self.UNIT
+        return self.max_value / self.UNIT
+
+    def mean(self) -> float:
+        """Histogramdan yaklaşık ortalamayı (saniye) hesaplar."""
+        if self.total_count == 0:
+            return 0.0
+        return sum(self._value_for(i) * c for i, c in self.counts.items()) / self.total_count / self.UNIT
+
+    def cdf_points(self) -> List[Tuple[int, float]]:
+        """(kova indeksi, kümülatif oran) çiftlerini kova sırasına göre döndürür."""
+        points = []
+        running = 0
+        for index in sorted(self.counts):
+            running += self.counts[index]
+            points.append((index, running / self.total_count))
+        return points
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Histogramı JSON'a yazılabilir kompakt bir sözlüğe dönüştürür."""
+        return {
+            "unit": "us",
+            "sub_buckets": self.SUB_BUCKETS,
+            "max_value": self.max_value,
+            "counts": {str(i): c for i, c in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """to_dict ile üretilmiş sözlükten histogramı yeniden oluşturur."""
+        if data.get("sub_buckets") != cls.SUB_BUCKETS:
+            raise ValueError(f"Histogram kova yapısı uyumsuz (sub_buckets={data.get('sub_buckets')}).")
+        histogram = cls()
+        for index, count in data.get("counts", {}).items():
+            histogram.counts[int(index)] = int(count)
+            histogram.total_count += int(count)
+        histogram.max_value = int(data.get("max_value", 0))
+        return histogram
+
+# --- Hata Sınıflandırması ---
+class ErrorCode(IntEnum):
+    """
+    Başarısız isteklerin yapılandırılmış hata kategorileri. İstisnanın türü ve errno
+    değerinden doğrudan hesaplanır; hata mesajı biçimlendirme/ayrıştırma gerektirmez.
+    """
+    TIMEOUT = 0              # İstek zaman aşımına uğradı
+    CONNECTION_REFUSED = 1   # Sunucu bağlantıyı reddetti (ECONNREFUSED)
+    CONNECTION_RESET = 2     # Bağlantı karşı taraf tarafından kapatıldı/sıfırlandı (ECONNRESET, EPIPE, kopma)
+    DNS_FAILURE = 3          # Host adı çözümlenemedi
+    SSL_CERTIFICATE = 4      # Sertifika doğrulama hatası
+    SSL_ERROR = 5            # Diğer SSL/TLS hataları (el sıkışma vb.)
+    CONNECTION_ERROR = 6     # Diğer ağ/işletim sistemi hataları (EHOSTUNREACH, ENETUNREACH vb.)
+    PROTOCOL_ERROR = 7       # Geçersiz/eksik HTTP yanıtı
+    CLIENT_ERROR = 8         # İstemci kütüphanesinin diğer hataları (yönlendirme vb.)
+    UNEXPECTED = 9           # Beklenmeyen (programlama) hataları
+    VALIDATION_FAILED = 10   # Yanıt alındı ancak örneklenmiş yanıt kontrollerinden geçemedi
+
+ERROR_CODE_DESCRIPTIONS = {
+    ErrorCode.TIMEOUT: "Zaman aşımı",
+    ErrorCode.CONNECTION_REFUSED: "Bağlantı reddedildi",
+    ErrorCode.CONNECTION_RESET: "Bağlantı sıfırlandı/koptu",
+    ErrorCode.DNS_FAILURE: "DNS çözümleme hatası",
+    ErrorCode.SSL_CERTIFICATE: "SSL sertifika doğrulama hatası",
+    ErrorCode.SSL_ERROR: "SSL/TLS hatası",
+    ErrorCode.CONNECTION_ERROR: "Diğer bağlantı hatası",
+    ErrorCode.PROTOCOL_ERROR: "Geçersiz HTTP yanıtı",
+    ErrorCode.CLIENT_ERROR: "İstemci hatası",
+    ErrorCode.UNEXPECTED: "Beklenmedik hata",
+    ErrorCode.VALIDATION_FAILED: "Yanıt doğrulaması başarısız",
+}
+ERROR_SAMPLES_PER_CODE = 3 # Her kategori için saklanacak en fazla farklı tam hata mesajı örneği
+ERROR_SAMPLE_ATTEMPTS_PER_CODE = 30 # Örnek aramak için kategori başına en fazla kaç hatanın mesajı biçimlendirilir
+
+_RESET_ERRNOS = {errno.ECONNRESET, errno.EPIPE, errno.ECONNABORTED}
+
+class HttpProtocolError(Exception):
+    """Sunucudan gelen yanıt HTTP/1.1 olarak ayrıştırılamadığında (ham soket motoru) fırlatılır."""
+
+class UnansweredRequestError(ConnectionResetError):
+    """Bağlantı, isteğin yanıtı hiç başlamadan kapandığında (ham soket motoru) fırlatılır; istek yeniden gönderilebilir."""
+
+class ResponseValidationError(Exception):
+    """Örneklenen yanıt bir kontrolden geçemediğinde hata örneği olarak kaydedilir (fırlatılmaz)."""
+
+def _exception_chain(exc: BaseException):
+    """İstisnayı ve onu tetikleyen (__cause__/__context__) istisnaları sırayla döndürür."""
+    seen = 0
+    while exc is not None and seen < 6:
+        yield exc
+        seen += 1
+        exc = exc.__cause__ or exc.__context__
+
+def classify_exception(exc: BaseException) -> ErrorCode:
+    """Bir istek istisnasını türüne ve errno değerine göre ErrorCode'a eşler (mesaj biçimlendirmeden)."""
+    for current in _exception_chain(exc):
+        if isinstance(current, asyncio.TimeoutError) or (httpx is not None and isinstance(current, httpx.TimeoutException)):
+            return ErrorCode.TIMEOUT
+        if isinstance(current, (ssl.SSLCertVerificationError, aiohttp.ClientConnectorCertificateError)):
+            return ErrorCode.SSL_CERTIFICATE
+        if isinstance(current, (ssl.SSLError, aiohttp.ClientSSLError)):
+            return ErrorCode.SSL_ERROR
+        if isinstance(current, socket.gaierror):
+            return ErrorCode.DNS_FAILURE
+        if isinstance(current, aiohttp.ClientConnectorError) and isinstance(current.os_error, socket.gaierror):
+            return ErrorCode.DNS_FAILURE
+        if isinstance(current, ConnectionRefusedError):
+            return ErrorCode.CONNECTION_REFUSED
+        if isinstance(current, (ConnectionResetError, BrokenPipeError, ConnectionAbortedError, aiohttp.ServerDisconnectedError)):
+            return ErrorCode.CONNECTION_RESET
+        if isinstance(current, (HttpProtocolError, aiohttp.ClientPayloadError)) or (httpx is not None and isinstance(current, httpx.RemoteProtocolError)):
+            return ErrorCode.PROTOCOL_ERROR
+        if isinstance(current, OSError) and current.errno is not None:
+            if current.errno == errno.ECONNREFUSED:
+                return ErrorCode.CONNECTION_REFUSED
+            if current.errno in _RESET_ERRNOS:
+                return ErrorCode.CONNECTION_RESET
+    # Zincirde daha spesifik bir neden bulunamadı: en dıştaki istisnanın genel türüne bak
+    if isinstance(exc, OSError) or (httpx is not None and isinstance(exc, httpx.TransportError)):
+        return ErrorCode.CONNECTION_ERROR
+    if isinstance(exc, aiohttp.ClientError) or (httpx is not None and isinstance(exc, httpx.HTTPError)):
+        return ErrorCode.CLIENT_ERROR
+    return ErrorCode.UNEXPECTED
+
+# --- Uç Nokta (Endpoint) Bazlı İstatistikler ---
+OTHER_ENDPOINT_GROUP = "(diğer)" # Sınır aşıldığında nadir grupların toplandığı kova
+ENDPOINT_GROUPINGS = ("url", "path", "host", "regex")
+# Yol şablonu üretirken {id} ile değiştirilen segmentler: sayılar, UUID'ler ve uzun hex kimlikler
+_PATH_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[0-9a-fA-F]{16,})$")
+
+def path_template(url: str) -> str:
+    """URL'yi kimlik içeren segmentleri {id} ile değiştirilmiş 'host/yol' şablonuna çevirir (sorgu atılır)."""
+    parts = urlsplit(url)
+    segments = ["{id}" if _PATH_ID_SEGMENT.match(segment) else segment for segment in parts.path.split("/")]
+    return parts.netloc + ("/".join(segments) or "/")
+
+class EndpointGrouper:
+    """
+    URL'leri raporlama gruplarına eşler (tam URL, yol şablonu, host veya regex grubu).
+    Eşleme URL listesi üzerinden bir kez hesaplanır; grup sayısı max_groups'u aşarsa
+    listede en seyrek görülen (dolayısıyla en az istek alacak) gruplar tek bir
+    "(diğer)" kovasına katlanır. Böylece istek başına yalnızca bir dict araması yapılır.
+    """
+    def __init__(self, url_list: List[str], grouping: str = "url", pattern: Optional[str] = None, max_groups: int = 50):
+        if grouping not in ENDPOINT_GROUPINGS:
+            raise ValueError(f"Bilinmeyen gruplama: '{grouping}' (seçenekler: {', '.join(ENDPOINT_GROUPINGS)})")
+        self._regex = None
+        if grouping == "regex":
+            try:
+                self._regex = re.compile(pattern or "")
+            except re.error as e:
+                raise ValueError(f"Geçersiz gruplama regex'i ({pattern}): {e}")
+        self.grouping = grouping
+
+        frequency: Dict[str, int] = defaultdict(int)
+        url_keys: Dict[str, str] = {}
+        for url in url_list:
+            key = url_keys.get(url)
+            if key is None:
+                key = url_keys[url] = self._key_for(url)
+            frequency[key] += 1
+        if len(frequency) > max_groups:
+            # Bir yer "(diğer)" kovasına ayrılır
+            kept = set(sorted(frequency, key=frequency.__getitem__, reverse=True)[:max(max_groups - 1, 1)])
+        else:
+            kept = set(frequency)
+        self.folded_groups = len(frequency) - len(kept) # "(diğer)" kovasına katlanan grup sayısı
+        self._url_to_group: Dict[str, str] = {url: (key if key in kept else OTHER_ENDPOINT_GROUP) for url, key in url_keys.items()}
+
+    def _key_for(self, url: str) -> str:
+        if self.grouping == "path":
+            return path_template(url)
+        if self.grouping == "host":
+            return urlsplit(url).netloc
+        if self.grouping == "regex":
+            match = self._regex.search(url)
+            if not match:
+                return OTHER_ENDPOINT_GROUP
+            return match.group(1) if match.groups() else match.group(0)
+        return url
+
+    def group_for(self, url: str) -> str:
+        """URL'nin ait olduğu grubu döndürür (listede olmayan URL'ler "(diğer)" kovasına gider)."""
+        return self._url_to_group.get(url, OTHER_ENDPOINT_GROUP)
+
+class EndpointStats:
+    """Tek bir uç nokta grubunun sayaçları ve kompakt gecikme histogramı."""
+    __slots__ = ("requests_sent", "requests_failed", "histogram", "status_codes", "errors")
+
+    def __init__(self):
+        self.requests_sent = 0
+        self.requests_failed = 0
+        self.histogram = LatencyHistogram() # Başarılı isteklerin gecikmeleri
+        self.status_codes: Dict[int, int] = defaultdict(int)
+        self.errors: Dict[ErrorCode, int] = defaultdict(int)
+
+    def to_summary(self, group: str) -> Dict[str, Any]:
+        return {
+            "group": group,
+            "requests_sent": self.requests_sent,
+            "failed_requests": self.requests_failed,
+            "failure_rate_percent": self.requests_failed / self.requests_sent * 100 if self.requests_sent else 0.0,
+            "p50_response_time": self.histogram.percentile(50),
+            "p95_response_time": self.histogram.percentile(95),
+            "p99_response_time": self.histogram.percentile(99),
+            "max_response_time": self.histogram.max_value / LatencyHistogram.UNIT,
+            "status_code_distribution": dict(self.status_codes),
+            "error_distribution": {code.name: count for code, count in self.errors.items()},
+        }
+
 class StatsCollector:
     """HTTP isteklerinin sonuçlarını (başarı, hata, süre) toplar, saklar ve özetler."""
-    def __init__(self):
-        self.start_time: float = time.monotonic() # İstatistik toplamanın başladığı an
+    def __init__(self, expected_interval: float = 0.0, endpoint_grouper: Optional[EndpointGrouper] = None):
+        self.start_time: float = time.monotonic() # İstatistik toplamanın (ölçüm penceresinin) başladığı an
+        self.window_end: Optional[float] = None # Ölçüm penceresinin bittiği an (yeni istek gönderimi durdurulduğunda ayarlanır)
+        self.requests_outside_window: int = 0 # Başlangıcı ölçüm penceresi dışında kaldığı için sayılmayan istekler
         self.requests_sent: int = 0           # Toplam gönderilen istek sayısı
         self.requests_successful: int = 0     # Başarılı (2xx, 3xx) dönen istek sayısı
         self.requests_failed: int = 0         # Başarısız (hata veya 4xx, 5xx) istek sayısı
         self.response_times: List[float] = [] # Başarılı isteklerin yanıt süreleri (saniye)
+        self.histogram: LatencyHistogram = LatencyHistogram() # Başarılı isteklerin kompakt gecikme histogramı (baseline için)
+        # Koordineli ihmal düzeltmesi: worker başına beklenen istek aralığı (0 = düzeltme yok)
+        self.expected_interval: float = expected_interval
+        self.corrected_histogram: LatencyHistogram = LatencyHistogram() # Düzeltilmiş gecikmeler (sentetik değerler dahil)
+        self.uncorrected_histogram: LatencyHistogram = LatencyHistogram() # Aynı isteklerin düzeltmesiz gecikmeleri (karşılaştırma için)
         self.status_codes: Dict[int, int] = defaultdict(int) # Alınan HTTP durum kodları ve sayıları
-        self.errors: Dict[str, int] = defaultdict(int) # Oluşan hata türleri (örn. TimeoutError) ve sayıları
+        self.error_counts: List[int] = [0] * len(ErrorCode) # ErrorCode değeri -> oluşma sayısı
+        self.error_samples: Dict[ErrorCode, List[str]] = defaultdict(list) # Kategori başına ilk birkaç tam hata mesajı
+        # Uç nokta bazlı istatistikler (URL dosyası modunda, gruplama açıksa)
+        self.endpoint_grouper: Optional[EndpointGrouper] = endpoint_grouper
+        self.endpoint_stats: Dict[str, EndpointStats] = {}
         self._lock = asyncio.Lock()           # Eş zamanlı erişimde veri tutarlılığını sağlamak için kilit
         # TestRunner tarafından test bittiğinde ayarlanacak olan gerçek test süresi
         self.actual_test_duration: float = 0.0
 
-    async def add_result(self, status_code: Optional[int], response_time: float, error: Optional[str]):
-        """Bir isteğin sonucunu (durum kodu, süre, hata) asenkron olarak kaydeder."""
+    async def add_result(
+        self,
+        status_code: Optional[int],
+        response_time: float,
+        error: Optional[ErrorCode],
+        url: Optional[str] = None,
+        exception: Optional[BaseException] = None,
+        started_at: Optional[float] = None
+    ):
+        """
+        Bir isteğin sonucunu (durum kodu, süre, hata kodu) asenkron olarak kaydeder.
+        Hata mesajı yalnızca kategori başına ilk ERROR_SAMPLES_PER_CODE hata için biçimlendirilir.
+        Başlangıç zamanı (started_at) verilirse, yalnızca ölçüm penceresi içinde başlayan istekler sayılır.
+        """
         async with self._lock: # Kilit alarak sayaçları güvenli bir şekilde artır
+            if started_at is not None and (started_at < self.start_time or (self.window_end is not None and started_at >= self.window_end)):
+                self.requests_outside_window += 1
+                return
+
+            endpoint = None
+            if self.endpoint_grouper is not None and url is not None:
+                group = self.endpoint_grouper.group_for(url)
+                endpoint = self.endpoint_stats.get(group)
+                if endpoint is None:
+                    endpoint = self.endpoint_stats[group] = EndpointStats()
+                endpoint.requests_sent += 1
+
             self.requests_sent += 1
-            if error:
-                # Eğer bir hata mesajı varsa (örn. timeout, bağlantı hatası, SSL hatası)
+            if self.expected_interval > 0:
+                # Düzeltme sonucu ne olursa olsun her tamamlanan isteğe uygulanır: koordineli ihmalden en çok
+                # etkilenen istekler zaman aşımına uğrayan ve hata alan yavaş isteklerdir
+                self.uncorrected_histogram.record(response_time)
+                self.corrected_histogram.record_with_expected_interval(response_time, self.expected_interval)
+            if error is not None:
+                # Eğer bir hata oluştuysa (örn. timeout, bağlantı hatası, SSL hatası)
                 self.requests_failed += 1
-                # Hatanın genel türünü al (örn. 'TimeoutError', 'ConnectionError', 'SSLError')
-                error_type = error.split(':')[0]
-                # SSLError'ları daha belirgin hale getirelim
-                if "SSL" in error or "certificate verify failed" in error:
-                    error_type = "SSLError" # Genel SSL hatası olarak grupla
-                self.errors[error_type] += 1
-                log.debug(f"İstek hatası kaydedildi: {error}")
+                self.error_counts[error] += 1
+                # Yalnızca kategori başına sınırlı sayıda hata biçimlendirilir; farklı mesajlar örnek olarak saklanır
+                if self.error_counts[error] <= ERROR_SAMPLE_ATTEMPTS_PER_CODE:
+                    samples = self.error_samples[error]
+                    if len(samples) < ERROR_SAMPLES_PER_CODE:
+                        message = f"{type(exception).__name__}: {exception}" if exception is not None else error.name
+                        if message not in samples:
+                            samples.append(message)
+                if endpoint is not None:
+                    endpoint.requests_failed += 1
+                    endpoint.errors[error] += 1
+                if status_code is not None:
+                    # Yanıt alındı ama sonradan başarısız sayıldı (örn. doğrulama hatası); durum kodu yine dağılıma girer
+                    self.status_codes[status_code] += 1
+                    if endpoint is not None:
+                        endpoint.status_codes[status_code] += 1
             elif status_code is not None:
                 # Eğer durum kodu alındıysa
                 self.status_codes[status_code] += 1
+                if endpoint is not None:
+                    endpoint.status_codes[status_code] += 1
                 if 200 <= status_code < 400:
                     # 2xx (Başarılı) veya 3xx (Yönlendirme) durum kodları başarılı sayılır
                     self.requests_successful += 1
                     # Sadece başarılı isteklerin yanıt sürelerini kaydet
                     self.response_times.append(response_time)
+                    self.histogram.record(response_time)
+                    if endpoint is not None:
+                        endpoint.histogram.record(response_time)
                 else:
                     # 4xx (İstemci Hatası) veya 5xx (Sunucu Hatası) durum kodları başarısız sayılır
                     self.requests_failed += 1
-                    log.debug(f"Başarısız durum kodu alındı: {status_code}")
+                    if endpoint is not None:
+                        endpoint.requests_failed += 1
+                    log.debug("Başarısız durum kodu alındı: %s", status_code)
 
     def calculate_summary(self) -> Dict[str, Any]:
         """Toplanan verilere dayanarak özet istatistikleri hesaplar ve döndürür."""
@@ -252,7 +717,9 @@ class StatsCollector:
             "requests_per_second": rps,
             "failure_rate_percent": failure_rate, # Assertion kontrolü için kullanılır
             "status_code_distribution": dict(self.status_codes), # defaultdict'u normal dict'e çevir
-            "error_distribution": dict(self.errors)             # defaultdict'u normal dict'e çevir
+            "error_distribution": {code.name: count for code, count in zip(ErrorCode, self.error_counts) if count},
+            "error_samples": {code.name: list(samples) for code, samples in self.error_samples.items()},
+            "requests_outside_window": self.requests_outside_window
         }
 
         if self.response_times:
@@ -264,22 +731,47 @@ class StatsCollector:
                 # Medyan hesaplamak için en az 2 veri noktası gerekir
                 if len(self.response_times) > 1:
                    summary["median_response_time"] = statistics.median(self.response_times)
-                # Yüzdelikler hesaplamak için daha fazla veri gerekebilir
-                # Örnek: 95. yüzdelik (en az 10-20 veri noktası önerilir)
-                # if len(self.response_times) >= 20:
-                #     summary["95th_percentile_response_time"] = statistics.quantiles(self.response_times, n=100)[94]
             except statistics.StatisticsError:
                 # Hesaplama sırasında hata olursa (örn. tek veri ile median) atla
                 pass
+            # Yüzdelikler (kuyruk gecikmesi) - kapasite araması ve SLO kontrolleri bunları kullanır
+            sorted_times = sorted(self.response_times)
+            for pct in SUMMARY_PERCENTILES:
+                summary[f"p{pct}_response_time"] = _percentile(sorted_times, pct)
         else:
             # Başarılı istek yoksa, yanıt süresi metriklerini 0 olarak ayarla
             summary["average_response_time"] = 0.0
             summary["min_response_time"] = 0.0
             summary["max_response_time"] = 0.0
             summary["median_response_time"] = 0.0
+            for pct in SUMMARY_PERCENTILES:
+                summary[f"p{pct}_response_time"] = 0.0
+
+        if self.expected_interval > 0:
+            # Düzeltmesiz değerlerle yan yana gösterilecek koordineli ihmal düzeltmeli yüzdelikler; ikisi de
+            # başarılı/başarısız tüm tamamlanan istekleri kapsar
+            summary["co_expected_interval"] = self.expected_interval
+            summary["co_uncorrected_count"] = self.uncorrected_histogram.total_count
+            summary["co_uncorrected_percentiles"] = {
+                pct: self.uncorrected_histogram.percentile(pct) for pct in SUMMARY_PERCENTILES + (99.9,)
+            }
+            summary["co_uncorrected_max"] = self.uncorrected_histogram.max_value / LatencyHistogram.UNIT
+            summary["co_corrected_count"] = self.corrected_histogram.total_count
+            summary["co_corrected_percentiles"] = {
+                pct: self.corrected_histogram.percentile(pct) for pct in SUMMARY_PERCENTILES + (99.9,)
+            }
+            summary["co_corrected_max"] = self.corrected_histogram.max_value / LatencyHistogram.UNIT
+
+        if self.endpoint_stats:
+            summary["endpoints"] = [stats.to_summary(group) for group, stats in self.endpoint_stats.items()]
+            summary["endpoint_folded_groups"] = self.endpoint_grouper.folded_groups
 
         return summary
 
+    def get_percentile(self, pct: float) -> float:
+        """Başarılı isteklerin yanıt sürelerinden istenen yüzdeliği (0-100) hesaplar (veri yoksa 0.0)."""
+        return _percentile(sorted(self.response_times), pct)
+
     async def get_current_progress(self) -> Tuple[int, int, float]:
         """Test sırasında anlık ilerleme verilerini (gönderilen, hatalı, anlık RPS) döndürür."""
         async with self._lock:
@@ -287,95 +779,1522 @@ class StatsCollector:
             current_rps = self.requests_sent / current_duration if current_duration > 0 else 0
             return self.requests_sent, self.requests_failed, current_rps
 
+# --- Baseline Kaydetme ve Regresyon Karşılaştırması ---
+BASELINE_FORMAT_VERSION = 1
+# Baseline karşılaştırmasında regresyon için izlenen gecikme metrikleri
+BASELINE_LATENCY_KEYS = ("p50_response_time", "p95_response_time", "p99_response_time")
+
+def save_baseline(path: str, summary: Dict[str, Any], histogram: LatencyHistogram, config: TestConfig):
+    """Bir testin özetini ve gecikme histogramını kompakt bir JSON baseline dosyasına yazar."""
+    numeric_summary = {k: v for k, v in summary.items() if isinstance(v, (int, float)) and not isinstance(v, bool)}
+    data = {
+        "format_version": BASELINE_FORMAT_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "config": {
+            "target": config.url_file or config.target_url,
+            "http_method": config.http_method,
+            "concurrency": config.concurrency,
+            "target_rps": config.target_rps,
+        },
+        "summary": numeric_summary,
+        "histogram": histogram.to_dict(),
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+def load_baseline(path: str) -> Tuple[Dict[str, Any], LatencyHistogram]:
+    """Baseline dosyasını okur ve (özet, histogram) çiftini döndürür."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get("format_version") != BASELINE_FORMAT_VERSION:
+        raise ValueError(f"Desteklenmeyen baseline dosya sürümü: {data.get('format_version')}")
+    return data["summary"], LatencyHistogram.from_dict(data["histogram"])
+
+def ks_two_sample(first: LatencyHistogram, second: LatencyHistogram) -> Tuple[float, float]:
+    """
+    İki gecikme histogramı için iki örneklemli Kolmogorov-Smirnov testi uygular.
+    (D istatistiği, asimptotik p-değeri) döndürür; p küçükse dağılımlar anlamlı şekilde farklıdır.
+    """
+    n1, n2 = first.total_count, second.total_count
+    if n1 == 0 or n2 == 0:
+        return 0.0, 1.0
+    cdf1, cdf2 = dict(first.cdf_points()), dict(second.cdf_points())
+    d_stat = 0.0
+    f1 = f2 = 0.0
+    for index in sorted(set(cdf1) | set(cdf2)):
+        f1 = cdf1.get(index, f1)
+        f2 = cdf2.get(index, f2)
+        d_stat = max(d_stat, abs(f1 - f2))
+    # Kolmogorov dağılımının asimptotik kuyruğu (Numerical Recipes yaklaşımı)
+    en = math.sqrt(n1 * n2 / (n1 + n2))
+    lam = (en + 0.12 + 0.11 / en) * d_stat
+    if lam < 1e-3:
+        return d_stat, 1.0
+    p_value = 2 * sum((-1) ** (k - 1) * math.exp(-2 * k * k * lam * lam) for k in range(1, 101))
+    return d_stat, min(max(p_value, 0.0), 1.0)
+
+def compare_with_baseline(
+    summary: Dict[str, Any],
+    histogram: LatencyHistogram,
+    baseline_summary: Dict[str, Any],
+    baseline_histogram: LatencyHistogram,
+    max_regression_percent: float,
+    significance_level: float = 0.05,
+    max_failure_rate_increase: float = 1.0
+) -> Dict[str, Any]:
+    """
+    Mevcut testi baseline ile karşılaştırır: yüzdelik ve verim farkları, başarısızlık oranı
+    farkı ve KS anlamlılık testi. Gecikme artışı eşiği aşıp dağılım farkı istatistiksel olarak
+    anlamlıysa, verim eşikten fazla düştüyse veya başarısızlık oranı izin verilen yüzde
+    puanından fazla arttıysa 'regression' True olur.
+
+    KS testi yalnızca "fark gürültü olabilir mi" sorusunu yanıtlar: ölçüm sayısı büyüdükçe
+    (örn. yüz binlerce istek) çok küçük dağılım farklarında bile p-değeri ≈0 olur. Bu yüzden
+    büyük testlerde regresyon kararını asıl belirleyen, yüzdelik artışının etki büyüklüğü
+    eşiğidir (max_regression_percent); KS yalnızca küçük örneklemlerdeki gürültüyü eler.
+    """
+    def delta(current: float, previous: float) -> Dict[str, float]:
+        change = ((current - previous) / previous * 100) if previous > 0 else 0.0
+        return {"baseline": previous, "current": current, "change_percent": change}
+
+    latency_deltas = {key: delta(summary.get(key, 0.0), baseline_summary.get(key, 0.0)) for key in BASELINE_LATENCY_KEYS}
+    throughput = delta(summary.get("requests_per_second", 0.0), baseline_summary.get("requests_per_second", 0.0))
+    failure_rate = delta(summary.get("failure_rate_percent", 0.0), baseline_summary.get("failure_rate_percent", 0.0))
+    # Hata oranı 0'dan başlayabildiği için göreli yüzde yerine yüzde puanı farkı kullanılır
+    failure_rate["change_points"] = failure_rate["current"] - failure_rate["baseline"]
+    d_stat, p_value = ks_two_sample(histogram, baseline_histogram)
+    significant = p_value < significance_level
+
+    reasons = []
+    for key, values in latency_deltas.items():
+        if values["change_percent"] > max_regression_percent and significant:
+            reasons.append(f"{key} %{values['change_percent']:.1f} arttı")
+    if throughput["change_percent"] < -max_regression_percent:
+        reasons.append(f"RPS %{-throughput['change_percent']:.1f} düştü")
+    if failure_rate["change_points"] > max_failure_rate_increase:
+        reasons.append(f"başarısızlık oranı {failure_rate['change_points']:.1f} puan arttı")
+
+    return {
+        "latency": latency_deltas,
+        "throughput": throughput,
+        "failure_rate": failure_rate,
+        "ks_statistic": d_stat,
+        "ks_p_value": p_value,
+        "significant": significant,
+        "max_regression_percent": max_regression_percent,
+        "max_failure_rate_increase": max_failure_rate_increase,
+        "regression": bool(reasons),
+        "regression_reasons": reasons,
+    }
+
+# --- TLS: Paylaşılan SSLContext ve El Sıkışma Ölçümleri ---
+class _TrackedSSLObject(ssl.SSLObject):
+    """El sıkışmasının süresini ve oturumun devam ettirilip ettirilmediğini context'e bildiren SSLObject."""
+
+    def do_handshake(self):
+        # asyncio, el sıkışması bitene kadar do_handshake'i (yeni veri geldikçe) tekrar çağırır;
+        # süre ilk çağrıdan tamamlanmaya kadar ölçülür (TCP bağlantısı hariç, TLS gidiş-dönüşleri dahil)
+        started = self.__dict__.get("_handshake_started")
+        if started is None:
+            started = self._handshake_started = time.perf_counter()
+        super().do_handshake()
+        self.context.record_handshake(self, time.perf_counter() - started)
+
+
+class SharedSSLContext(ssl.SSLContext):
+    """
+    Test başında bir kez oluşturulup tüm motorlara (aiohttp, httpx, ham soket) verilen SSLContext.
+    Python istemci tarafında TLS oturumlarını kendiliğinden devam ettirmez; bu context her hedef
+    sunucu adı için son oturumu saklar ve yeni bağlantılarda (wrap_bio) sunar. Her tamamlanan
+    el sıkışmasının tam / devam ettirilmiş (resumed) olduğu, süresi, TLS sürümü, şifre takımı ve
+    ALPN protokolü sayılır.
+    """
+    sslobject_class = _TrackedSSLObject
+
+    def __init__(self, protocol=ssl.PROTOCOL_TLS_CLIENT):
+        self.session_resumption = True
+        self._sessions: Dict[Optional[str], ssl.SSLSession] = {}   # Sunucu adı -> devam ettirilecek oturum
+        self._latest: Dict[Optional[str], ssl.SSLObject] = {}      # Sunucu adı -> son el sıkışan SSLObject (bağlantı kapansa da oturumu okunabilir)
+        self.full_handshakes = 0
+        self.resumed_handshakes = 0
+        self._full_time = 0.0
+        self._resumed_time = 0.0
+        self._full_max = 0.0
+        self._resumed_max = 0.0
+        self._versions: Dict[str, int] = defaultdict(int)
+        self._ciphers: Dict[str, int] = defaultdict(int)
+        self._alpn: Dict[str, int] = defaultdict(int)
+
+    def wrap_bio(self, incoming, outgoing, server_side=False, server_hostname=None, session=None):
+        if session is None and self.session_resumption and not server_side:
+            # TLS 1.3'te oturum bileti el sıkışmasından sonra gelir; bu yüzden oturum, son
+            # bağlantıdan yeni bağlantı açılırken (bilet alınmış olarak) okunur
+            # anyio (httpx) sunucu adını IDNA ile kodlanmış bayt olarak verir; SSLObject.server_hostname ise str'dir
+            host = server_hostname.decode("ascii") if isinstance(server_hostname, bytes) else server_hostname
+            latest = self._latest.pop(host, None)
+            if latest is not None and latest.session is not None:
+                self._sessions[host] = latest.session
+            session = self._sessions.get(host)
+        return super().wrap_bio(incoming, outgoing, server_side=server_side, server_hostname=server_hostname, session=session)
+
+    def record_handshake(self, ssl_object: ssl.SSLObject, seconds: float):
+        if ssl_object.session_reused:
+            self.resumed_handshakes += 1
+            self._resumed_time += seconds
+            self._resumed_max = max(self._resumed_max, seconds)
+        else:
+            self.full_handshakes += 1
+            self._full_time += seconds
+            self._full_max = max(self._full_max, seconds)
+        self._versions[ssl_object.version() or "bilinmiyor"] += 1
+        cipher = ssl_object.cipher()
+        self._ciphers[cipher[0] if cipher else "bilinmiyor"] += 1
+        self._alpn[ssl_object.selected_alpn_protocol() or "yok"] += 1
+        if self.session_resumption:
+            self._latest[ssl_object.server_hostname] = ssl_object
+
+    def get_report(self) -> Dict[str, Any]:
+        full, resumed = self.full_handshakes, self.resumed_handshakes
+        return {
+            "session_resumption": self.session_resumption,
+            "full_handshakes": full,
+            "resumed_handshakes": resumed,
+            "resumption_rate_percent": resumed / (full + resumed) * 100 if full + resumed else 0.0,
+            "full_handshake_avg": self._full_time / full if full else 0.0,
+            "full_handshake_max": self._full_max,
+            "resumed_handshake_avg": self._resumed_time / resumed if resumed else 0.0,
+            "resumed_handshake_max": self._resumed_max,
+            "versions": dict(self._versions),
+            "ciphers": dict(self._ciphers),
+            "alpn": dict(self._alpn),
+        }
+
+
+def build_ssl_context(verify_ssl: bool, tls: TlsConfig) -> SharedSSLContext:
+    """TlsConfig'e göre paylaşılan SSLContext'i oluşturur (dosya/sürüm hataları testten önce fırlatılır)."""
+    context = SharedSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    if tls.ca_bundle:
+        context.load_verify_locations(cafile=tls.ca_bundle)
+    else:
+        context.load_default_certs(ssl.Purpose.SERVER_AUTH)
+    if not verify_ssl:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    if tls.client_cert:
+        context.load_cert_chain(tls.client_cert, tls.client_key)
+    if tls.min_version:
+        if tls.min_version not in TLS_MIN_VERSIONS:
+            raise ValueError(f"Geçersiz en düşük TLS sürümü: '{tls.min_version}' (seçenekler: {', '.join(TLS_MIN_VERSIONS)})")
+        context.minimum_version = TLS_MIN_VERSIONS[tls.min_version]
+    context.session_resumption = tls.session_resumption
+    if not tls.session_resumption:
+        context.options |= ssl.OP_NO_TICKET # Sunucudan oturum bileti istenmez
+    return context
+
+
+# --- Bağlantı Hedefi: Unix Domain Socket ve Adres Sabitleme ---
+def parse_address(text: str) -> Tuple[str, Optional[int]]:
+    """"host", "host:port", "[::1]:port" veya "::1" biçimindeki adresi (host, port) çiftine çevirir."""
+    text = text.strip()
+    if text.startswith("["):
+        host, _, rest = text[1:].partition("]")
+        port_text = rest[1:] if rest.startswith(":") else ""
+    elif text.count(":") == 1:
+        host, _, port_text = text.partition(":")
+    else:
+        host, port_text = text, ""
+    if not host:
+        raise ValueError(f"Geçersiz adres: '{text}'")
+    try:
+        port = int(port_text) if port_text else None
+    except ValueError:
+        raise ValueError(f"Geçersiz port: '{text}'")
+    if port is not None and not 0 < port < 65536:
+        raise ValueError(f"Geçersiz port: '{text}'")
+    return host.lower(), port
+
+
+class AddressPinning:
+    """
+    Host (ve isteğe bağlı port) -> sabit adres eşlemesi. DNS sorgusu yapılmadan bağlantı bu
+    adrese açılır; Host başlığı ve TLS sunucu adı (SNI) URL'deki host olarak kalır. Port
+    belirtilmeyen kurallar hostun tüm portları için geçerlidir ve URL'deki portu korur.
+    """
+
+    def __init__(self, overrides: Dict[str, str]):
+        self._rules: Dict[Tuple[str, Optional[int]], Tuple[str, Optional[int]]] = {}
+        for source, target in overrides.items():
+            self._rules[parse_address(source)] = parse_address(target)
+
+    def resolve(self, host: str, port: int) -> Optional[Tuple[str, int]]:
+        """Sabitlenmiş (adres, port) çiftini, kural yoksa None döndürür."""
+        host = host.lower()
+        target = self._rules.get((host, port)) or self._rules.get((host, None))
+        if target is None:
+            return None
+        address, target_port = target
+        return address, target_port or port
+
+    def describe(self) -> str:
+        def text(host, port):
+            host = f"[{host}]" if ":" in host else host
+            return f"{host}:{port}" if port else host
+        return ", ".join(f"{text(*source)} -> {text(*target)}" for source, target in self._rules.items())
+
+
+class PinnedResolver(aiohttp.abc.AbstractResolver):
+    """aiohttp için sabitlenmiş hostları doğrudan adrese çeviren, diğerlerini varsayılan çözümleyiciye bırakan çözümleyici."""
+
+    def __init__(self, pinning: AddressPinning):
+        self.pinning = pinning
+        self._fallback = aiohttp.DefaultResolver()
+
+    async def resolve(self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET) -> List[Dict[str, Any]]:
+        pinned = self.pinning.resolve(host, port)
+        if pinned is None:
+            return await self._fallback.resolve(host, port, family)
+        address, pinned_port = pinned
+        return [{
+            "hostname": host, "host": address, "port": pinned_port,
+            "family": socket.AF_INET6 if ":" in address else socket.AF_INET,
+            "proto": 0, "flags": socket.AI_NUMERICHOST,
+        }]
+
+    async def close(self):
+        await self._fallback.close()
+
+
+# --- HTTP İstemci Motorları (Transport) ---
+class CapturedResponse(NamedTuple):
+    """Yanıt doğrulaması için örneklenen isteklerde motorların döndürdüğü yanıt."""
+    status: int
+    headers: Any # Büyük/küçük harf duyarsız başlık eşlemesi (ham soket motorunda küçük harfli adlarla dict)
+    body: bytes
+
+class BaseTransport:
+    """
+    make_request'in istekleri gönderdiği HTTP istemci motoru arayüzü.
+    Motorlar kendi kütüphanelerinin istisnalarını olduğu gibi fırlatır;
+    classify_exception bunları (neden zinciri ve errno üzerinden) ortak
+    ErrorCode kategorilerine eşler, böylece StatsCollector tüm motorlar için aynı kalır.
+    """
+    name = "base"
+
+    async def start(self):
+        """Bağlantı havuzunu / oturumu hazırlar (test başlamadan önce bir kez çağrılır)."""
+
+    async def close(self):
+        """Açık bağlantıları kapatır (test bittiğinde bir kez çağrılır)."""
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        request_body: Optional[Union[str, Dict[str, Any]]],
+        is_json: bool,
+        timeout: float
+    ) -> int:
+        """İsteği gönderir, yanıt gövdesini tüketir ve HTTP durum kodunu döndürür."""
+        raise NotImplementedError
+
+    async def send_captured(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        request_body: Optional[Union[str, Dict[str, Any]]],
+        is_json: bool,
+        timeout: float
+    ) -> "CapturedResponse":
+        """send ile aynıdır ancak yanıt doğrulaması için başlıkları ve gövdeyi de döndürür."""
+        raise NotImplementedError
+
+    def get_report(self) -> Dict[str, Any]:
+        """Motora özgü istatistikleri (örn. bağlantı başına eşzamanlılık) döndürür."""
+        return {"engine": self.name}
+
+
+class AiohttpTransport(BaseTransport):
+    """aiohttp ClientSession üzerinden HTTP/1.1 istekleri gönderen varsayılan motor."""
+    name = "aiohttp"
+
+    def __init__(self, ssl_context: ssl.SSLContext, unix_socket: Optional[str] = None, pinning: Optional[AddressPinning] = None):
+        self.ssl_context = ssl_context
+        self.unix_socket = unix_socket # Verilirse bağlantılar TCP yerine bu Unix domain socket'e açılır
+        self.pinning = pinning         # Verilirse eşleşen hostlar DNS yerine sabit adrese bağlanır
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._timeouts: Dict[float, aiohttp.ClientTimeout] = {} # Süre başına tek ClientTimeout (her istekte yenisi oluşturulmaz)
+
+    async def start(self):
+        if self.unix_socket:
+            # Yerel servis / sidecar: bağlantılar Unix domain socket'e açılır (TLS yok)
+            connector = aiohttp.UnixConnector(path=self.unix_socket, limit=None, limit_per_host=0)
+        else:
+            # aiohttp için TCPConnector ayarları
+            # Paylaşılan SSLContext doğrulama, oturum devamı ve mTLS ayarlarını içerir
+            connector = aiohttp.TCPConnector(
+                limit=None,
+                limit_per_host=0,
+                enable_cleanup_closed=True,
+                ssl=self.ssl_context,
+                resolver=PinnedResolver(self.pinning) if self.pinning is not None else None
+            )
+        self.session = aiohttp.ClientSession(connector=connector)
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+
+    def _client_timeout(self, timeout: float) -> aiohttp.ClientTimeout:
+        client_timeout = self._timeouts.get(timeout)
+        if client_timeout is None:
+            client_timeout = self._timeouts[timeout] = aiohttp.ClientTimeout(total=timeout)
+        return client_timeout
+
+    async def send(self, method, url, headers, request_body, is_json, timeout) -> int:
+        client_timeout = self._client_timeout(timeout)
+
+        if not request_body:
+            # Gövdesiz istekler (en sık durum) için ara sözlük oluşturmadan gönder
+            async with self.session.request(method, url, headers=headers or None, timeout=client_timeout) as response:
+                await response.read() # Yanıtı tüket
+                return response.status
+
+        # aiohttp istek parametrelerini hazırla
+        request_kwargs = {
+            "headers": headers if headers else None,
+            "timeout": client_timeout,
+        }
+
+        # İstek gövdesini ekle
+        if is_json and isinstance(request_body, dict):
+            request_kwargs["json"] = request_body
+        else:
+            request_kwargs["data"] = request_body
+
+        async with self.session.request(method, url, **request_kwargs) as response:
+            await response.read() # Yanıtı tüket
+            return response.status
+
+    async def send_captured(self, method, url, headers, request_body, is_json, timeout) -> CapturedResponse:
+        request_kwargs: Dict[str, Any] = {"headers": headers if headers else None, "timeout": self._client_timeout(timeout)}
+        if request_body:
+            if is_json and isinstance(request_body, dict):
+                request_kwargs["json"] = request_body
+            else:
+                request_kwargs["data"] = request_body
+        async with self.session.request(method, url, **request_kwargs) as response:
+            body = await response.read()
+            return CapturedResponse(response.status, response.headers, body)
+
+
+class Http2Transport(BaseTransport):
+    """
+    httpx (h2) üzerinden HTTP/2 istekleri gönderen motor. Her biri tek bir bağlantı
+    tutan yapılandırılabilir sayıda istemci açar ve istekleri (stream'leri) en az
+    yüklü bağlantıya dağıtarak çoklar (multiplexing). Sunucu h2 müzakere etmezse
+    istemci tek HTTP/1.1 bağlantısına düşer ve istekler havuzda sıraya girer; bu
+    yanıtlar stream istatistiklerine katılmaz ve bir kez uyarı verilir.
+    """
+    name = "http2"
+
+    def __init__(self, ssl_context: ssl.SSLContext, connections: int, origin_count: int, prior_knowledge: bool,
+                 unix_socket: Optional[str] = None, pinning: Optional[AddressPinning] = None):
+        self.ssl_context = ssl_context
+        self.unix_socket = unix_socket
+        self.pinning = pinning
+        # Sabitlenmiş hedefler için URL -> (adrese yönlendirilmiş URL, Host başlığı, TLS sunucu adı); None = sabitleme yok
+        self._pinned_targets: Dict[str, Optional[Tuple[str, str, str]]] = {}
+        self.connections = max(connections, 1)
+        self.origin_count = max(origin_count, 1) # Her istemci, hedef başına tek bağlantı tutar
+        self.prior_knowledge = prior_knowledge   # http:// hedefler için HTTP/1.1'e düşmeden h2c kullan
+        self._clients: List[Any] = []
+        # Bağlantı başına sayaçlar (liste indeksleri istemci indeksleriyle eşleşir)
+        self._in_flight: List[int] = []
+        self._peak_streams: List[int] = []
+        self._streams: List[int] = []
+        self._concurrency_sum: List[int] = []    # Stream başlarken gözlenen eşzamanlılık toplamı (ortalama için)
+        self._latency_sum: List[float] = []
+        self._protocols: Dict[str, int] = defaultdict(int) # Müzakere edilen protokol -> yanıt sayısı
+        self._fallback_warned = False # HTTP/2 dışı yanıt uyarısı verildi mi?
+
+    async def start(self):
+        limits = httpx.Limits(max_connections=self.origin_count, max_keepalive_connections=self.origin_count)
+        if self.unix_socket:
+            self._clients = [
+                httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(
+                    uds=self.unix_socket, http2=True, http1=not self.prior_knowledge, verify=self.ssl_context, limits=limits), timeout=None)
+                for _ in range(self.connections)
+            ]
+        else:
+            self._clients = [
+                httpx.AsyncClient(http2=True, http1=not self.prior_knowledge, verify=self.ssl_context, limits=limits, timeout=None)
+                for _ in range(self.connections)
+            ]
+        self._in_flight = [0] * self.connections
+        self._peak_streams = [0] * self.connections
+        self._streams = [0] * self.connections
+        self._concurrency_sum = [0] * self.connections
+        self._latency_sum = [0.0] * self.connections
+
+    async def close(self):
+        await asyncio.gather(*(client.aclose() for client in self._clients), return_exceptions=True)
+
+    def _pinned_target(self, url: str) -> Optional[Tuple[str, str, str]]:
+        """httpx'te çözümleyici kancası olmadığından sabitleme, URL'yi adrese yönlendirip Host ve SNI'ı koruyarak yapılır."""
+        if url not in self._pinned_targets:
+            parts = urlsplit(url)
+            scheme = parts.scheme.lower()
+            pinned = self.pinning.resolve(parts.hostname or "", parts.port or (443 if scheme == "https" else 80))
+            if pinned is None:
+                self._pinned_targets[url] = None
+            else:
+                address, port = pinned
+                netloc = f"[{address}]:{port}" if ":" in address else f"{address}:{port}"
+                self._pinned_targets[url] = (parts._replace(netloc=netloc).geturl(), parts.netloc.rsplit("@", 1)[-1], parts.hostname)
+        return self._pinned_targets[url]
+
+    async def send(self, method, url, headers, request_body, is_json, timeout, capture: bool = False) -> Union[int, CapturedResponse]:
+        # En az aktif isteğe sahip bağlantıyı seç
+        index = min(range(self.connections), key=self._in_flight.__getitem__)
+        self._in_flight[index] += 1
+        current = self._in_flight[index]
+
+        request_kwargs: Dict[str, Any] = {"headers": headers if headers else None, "timeout": timeout}
+        if request_body:
+            if is_json and isinstance(request_body, dict):
+                request_kwargs["json"] = request_body
+            else:
+                request_kwargs["content"] = request_body
+        if self.pinning is not None:
+            pinned = self._pinned_target(url)
+            if pinned is not None:
+                url, host_header, server_name = pinned
+                request_kwargs["headers"] = {**(headers or {}), "Host": host_header}
+                request_kwargs["extensions"] = {"sni_hostname": server_name}
+
+        start_stream_time = time.monotonic()
+        try:
+            response = await self._clients[index].request(method, url, **request_kwargs)
+        finally:
+            self._in_flight[index] -= 1
+        self._protocols[response.http_version] += 1
+        if response.http_version == "HTTP/2":
+            # Yalnızca gerçekten çoklanan (HTTP/2) istekler stream olarak sayılır
+            self._streams[index] += 1
+            self._concurrency_sum[index] += current
+            if current > self._peak_streams[index]:
+                self._peak_streams[index] = current
+            self._latency_sum[index] += time.monotonic() - start_stream_time
+        elif not self._fallback_warned:
+            self._fallback_warned = True
+            log.warning("HTTP/2 motoru: sunucu h2 müzakere etmedi (%s); istekler istemci başına tek bağlantıda "
+                        "sıraya giriyor ve bu yanıtlar stream istatistiklerine dahil edilmiyor.", response.http_version)
+        if capture:
+            return CapturedResponse(response.status_code, response.headers, response.content)
+        return response.status_code
+
+    async def send_captured(self, method, url, headers, request_body, is_json, timeout) -> CapturedResponse:
+        return await self.send(method, url, headers, request_body, is_json, timeout, capture=True)
+
+    def get_report(self) -> Dict[str, Any]:
+        per_connection = []
+        for i in range(self.connections):
+            streams = self._streams[i]
+            per_connection.append({
+                "streams": streams,
+                "peak_concurrent_streams": self._peak_streams[i],
+                "avg_concurrent_streams": self._concurrency_sum[i] / streams if streams else 0.0,
+                "avg_stream_latency": self._latency_sum[i] / streams if streams else 0.0,
+            })
+        fallback = sum(count for proto, count in self._protocols.items() if proto != "HTTP/2")
+        return {"engine": self.name, "protocols": dict(self._protocols), "fallback_responses": fallback, "connections": per_connection}
+
+
+class _RawHttpConnection(asyncio.Protocol):
+    """
+    RawHttpTransport'un tek bir keep-alive bağlantısı. Gönderilen isteklerin yanıtlarını
+    artımlı olarak ayrıştırır (durum satırı, Content-Length / chunked / bağlantı kapanana
+    kadar gövde) ve sırayla bekleyen future'lara teslim eder; böylece pipelining'de
+    birden çok istek aynı bağlantıda yanıt bekleyebilir.
+    """
+    # Gövde okuma modları
+    _NONE, _LENGTH, _CHUNKED, _UNTIL_CLOSE = range(4)
+
+    def __init__(self, pool_key: Tuple[str, str, int]):
+        self.pool_key = pool_key
+        self.transport: Optional[asyncio.Transport] = None
+        self.closed = False
+        self.keep_alive = True
+        self.in_pool = False # Boş kapasiteyle havuzun 'available' kuyruğunda mı?
+        self._waiters: Deque[Tuple[asyncio.Future, bool, bool]] = deque() # (future, HEAD isteği mi?, yanıt saklanacak mı?)
+        self._buffer = bytearray()
+        self._reset_response()
+
+    @property
+    def pending(self) -> int:
+        return len(self._waiters)
+
+    def _reset_response(self):
+        self._status: Optional[int] = None
+        self._body_mode = self._NONE
+        self._remaining = 0      # Content-Length modunda kalan bayt / chunked modunda mevcut chunk'ın kalan baytı
+        self._chunk_state = 0    # 0: chunk boyut satırı, 1: chunk verisi, 2: chunk sonu CRLF, 3: trailer'lar
+        self._captured_headers: Optional[Dict[str, str]] = None # Yalnızca doğrulama için örneklenen yanıtlarda doldurulur
+        self._captured_body: Optional[bytearray] = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def connection_lost(self, exc):
+        self.closed = True
+        if self._status is not None and self._body_mode == self._UNTIL_CLOSE:
+            # Gövdesi bağlantı kapanınca biten yanıt tamamlandı
+            self._finish_response()
+        if self._waiters and (self._status is not None or self._buffer):
+            # Yanıtı yarıda kesilen istek gerçek bir bağlantı hatasıdır
+            future = self._waiters.popleft()[0]
+            if not future.done():
+                future.set_exception(ConnectionResetError(f"Bağlantı kapandı: {exc}" if exc else "Bağlantı sunucu tarafından kapatıldı"))
+        self._abandon_unanswered()
+
+    def _abandon_unanswered(self):
+        """Yanıtı hiç başlamamış (sırada bekleyen) istekleri, yeniden gönderilmeleri için UnansweredRequestError ile bırakır."""
+        error = UnansweredRequestError("İstek yanıtlanmadan bağlantı kapandı")
+        while self._waiters:
+            future = self._waiters.popleft()[0]
+            if not future.done():
+                future.set_exception(error)
+
+    def send(self, payload: bytes, is_head: bool, capture: bool = False) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((future, is_head, capture))
+        self.transport.write(payload)
+        return future
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.transport.close()
+
+    def _fail(self, message: str):
+        """Ayrıştırılamayan yanıtta bağlantıyı kapatır (sonraki yanıtlar artık senkron değildir)."""
+        error = HttpProtocolError(f"Geçersiz HTTP yanıtı: {message}")
+        while self._waiters:
+            future = self._waiters.popleft()[0]
+            if not future.done():
+                future.set_exception(error)
+        self.close()
+
+    def _finish_response(self):
+        result = self._status
+        if self._captured_body is not None:
+            result = CapturedResponse(result, self._captured_headers, bytes(self._captured_body))
+        self._reset_response()
+        if self._waiters:
+            future = self._waiters.popleft()[0]
+            if not future.done():
+                future.set_result(result)
+        if not self.keep_alive:
+            # "Connection: close" sonrası sunucu sıradaki isteklere yanıt vermez
+            self._abandon_unanswered()
+            self.close()
+
+    def data_received(self, data: bytes):
+        self._buffer += data
+        buffer = self._buffer
+        position = 0
+        while not self.closed:
+            if self._status is None:
+                # Durum satırı ve başlıklar
+                header_end = buffer.find(b"\r\n\r\n", position)
+                if header_end < 0:
+                    break
+                if not self._waiters:
+                    self._fail("beklenmeyen yanıt")
+                    return
+                if not self._parse_head(bytes(buffer[position:header_end])):
+                    return
+                position = header_end + 4
+                if self._status is None:
+                    # Ara (1xx) yanıt atlandı; asıl yanıtın durum satırı bekleniyor
+                    continue
+                if self._body_mode == self._NONE:
+                    self._finish_response()
+                    continue
+            if self._body_mode == self._LENGTH:
+                available = len(buffer) - position
+                if self._captured_body is not None:
+                    self._captured_body += buffer[position:position + min(available, self._remaining)]
+                if available < self._remaining:
+                    self._remaining -= available
+                    position = len(buffer)
+                    break
+                position += self._remaining
+                self._finish_response()
+            elif self._body_mode == self._CHUNKED:
+                position = self._parse_chunked(buffer, position)
+                if self._status is not None:
+                    break # Chunked gövde için daha fazla veri gerekiyor
+            else: # _UNTIL_CLOSE: gövde bağlantı kapanana kadar sürer
+                if self._captured_body is not None:
+                    self._captured_body += buffer[position:]
+                position = len(buffer)
+                break
+        del buffer[:position]
+
+    def _parse_head(self, head: bytes) -> bool:
+        lines = head.split(b"\r\n")
+        status_line = lines[0]
+        try:
+            self._status = int(status_line[9:12])
+        except ValueError:
+            self._fail(f"durum satırı okunamadı ({status_line[:40]!r})")
+            return False
+        if 100 <= self._status < 200 and self._status != 101:
+            # Ara yanıt (100 Continue, 103 Early Hints): gövdesi yoktur, isteğin asıl yanıtı arkasından gelir
+            self._status = None
+            return True
+        if status_line.startswith(b"HTTP/1.0"):
+            self.keep_alive = False
+        content_length = None
+        chunked = False
+        for line in lines[1:]:
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+            if name == b"content-length":
+                # Tekrarlanan veya virgülle listelenen değerler aynı olmalıdır (RFC 9112 §6.3)
+                values = {item.strip() for item in value.split(b",")}
+                try:
+                    length = int(values.pop()) if len(values) == 1 else -1
+                except ValueError:
+                    length = -1
+                if length < 0 or (content_length is not None and length != content_length):
+                    self._fail(f"Content-Length geçersiz veya çelişkili ({value.strip()[:20]!r})")
+                    return False
+                content_length = length
+            elif name == b"transfer-encoding":
+                chunked = b"chunked" in value.lower()
+            elif name == b"connection":
+                value = value.strip().lower()
+                if value == b"close":
+                    self.keep_alive = False
+                elif value == b"keep-alive":
+                    self.keep_alive = True
+        _, is_head, capture = self._waiters[0]
+        if capture:
+            self._captured_headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(b":")
+                self._captured_headers[name.strip().lower().decode("latin-1")] = value.strip().decode("latin-1")
+            self._captured_body = bytearray()
+        if is_head or self._status in (204, 304) or 100 <= self._status < 200:
+            self._body_mode = self._NONE
+        elif chunked:
+            self._body_mode = self._CHUNKED
+            self._chunk_state = 0
+        elif content_length is not None:
+            self._body_mode = self._LENGTH if content_length > 0 else self._NONE
+            self._remaining = content_length
+        else:
+            self._body_mode = self._UNTIL_CLOSE
+            self.keep_alive = False
+        return True
+
+    def _parse_chunked(self, buffer: bytearray, position: int) -> int:
+        """Chunked gövdeyi mümkün olduğunca ilerletir; yeni okuma konumunu döndürür."""
+        while True:
+            if self._chunk_state == 0: # Chunk boyut satırı
+                line_end = buffer.find(b"\r\n", position)
+                if line_end < 0:
+                    return position
+                size_field = bytes(buffer[position:line_end]).split(b";", 1)[0]
+                try:
+                    self._remaining = int(size_field, 16)
+                except ValueError:
+                    self._fail(f"chunk boyutu okunamadı ({size_field[:20]!r})")
+                    return len(buffer)
+                position = line_end + 2
+                self._chunk_state = 1 if self._remaining > 0 else 3
+            elif self._chunk_state == 1: # Chunk verisi
+                available = len(buffer) - position
+                if self._captured_body is not None:
+                    self._captured_body += buffer[position:position + min(available, self._remaining)]
+                if available < self._remaining:
+                    self._remaining -= available
+                    return len(buffer)
+                position += self._remaining
+                self._chunk_state = 2
+            elif self._chunk_state == 2: # Chunk sonundaki CRLF
+                if len(buffer) - position < 2:
+                    return position
+                position += 2
+                self._chunk_state = 0
+            else: # Trailer satırları; boş satır gövdeyi bitirir
+                line_end = buffer.find(b"\r\n", position)
+                if line_end < 0:
+                    return position
+                is_last = line_end == position
+                position = line_end + 2
+                if is_last:
+                    self._finish_response()
+                    return position
+
+
+class RawHttpTransport(BaseTransport):
+    """
+    asyncio.Protocol tabanlı, düşük ek yüklü HTTP/1.1 motoru. İstek baytları (hedef, metot
+    ve başlıklar başına) bir kez serileştirilip önbelleğe alınır, bağlantılar keep-alive
+    ile yeniden kullanılır ve isteğe bağlı olarak bağlantı başına birden fazla istek
+    pipeline edilir. Yanıt gövdesi yalnızca çerçevelemesi için ayrıştırılır, saklanmaz.
+    """
+    name = "raw"
+    _NO_HEADERS: Dict[str, str] = {} # Başlıksız isteklerde paylaşılan boş sözlük (yalnızca okunur)
+
+    def __init__(self, ssl_context: ssl.SSLContext, pipeline_depth: int = 1,
+                 unix_socket: Optional[str] = None, pinning: Optional[AddressPinning] = None):
+        self.ssl_context = ssl_context
+        self.unix_socket = unix_socket
+        self.pinning = pinning
+        self.pipeline_depth = max(pipeline_depth, 1) # Bağlantı başına yanıt bekleyebilecek en fazla istek
+        # (metot, URL) -> (başlıklar, havuz anahtarı, istek baytları); başlıklar değişirse yeniden serileştirilir
+        self._payload_cache: Dict[Tuple[str, str], Tuple[Dict[str, str], Tuple[str, str, int], bytes]] = {}
+        self._available: Dict[Tuple[str, str, int], Deque[_RawHttpConnection]] = defaultdict(deque)
+        self._connections: set = set() # Açık bağlantılar (kapanırken temizlenir)
+        self.connections_opened = 0
+        self.requests_resent = 0 # Bağlantı yanıt vermeden kapandığı için yeni bağlantıda yeniden gönderilen istekler
+
+    async def close(self):
+        for connection in self._connections:
+            connection.close()
+        self._connections.clear()
+        self._available.clear()
+
+    def _serialize(self, method, url, headers, request_body, is_json) -> Tuple[Tuple[str, str, int], bytes]:
+        """İsteği bir kez HTTP/1.1 baytlarına çevirir: (havuz anahtarı, istek baytları)."""
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        host_header = parts.netloc.rsplit("@", 1)[-1]
+
+        body = b""
+        if request_body:
+            if is_json and isinstance(request_body, dict):
+                body = json.dumps(request_body).encode("utf-8")
+            elif isinstance(request_body, bytes):
+                body = request_body
+            else:
+                body = str(request_body).encode("utf-8")
+
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {host_header}"]
+        for name, value in (headers or {}).items():
+            if name.lower() not in ("host", "content-length"):
+                lines.append(f"{name}: {value}")
+        if body or method in ("POST", "PUT", "PATCH"):
+            lines.append(f"Content-Length: {len(body)}")
+        payload = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+        return (scheme, host, port), payload
+
+    async def _open_connection(self, pool_key: Tuple[str, str, int], timeout: float) -> _RawHttpConnection:
+        scheme, host, port = pool_key
+        loop = asyncio.get_running_loop()
+        if self.unix_socket:
+            connect = loop.create_unix_connection(lambda: _RawHttpConnection(pool_key), self.unix_socket)
+        else:
+            address, connect_port = (self.pinning.resolve(host, port) if self.pinning is not None else None) or (host, port)
+            use_tls = scheme == "https"
+            connect = loop.create_connection(
+                lambda: _RawHttpConnection(pool_key), address, connect_port,
+                ssl=self.ssl_context if use_tls else None,
+                server_hostname=host if use_tls else None, # Sabitlenmiş adreste de SNI/sertifika URL'deki hosta göre
+            )
+        _, connection = await asyncio.wait_for(connect, timeout)
+        self.connections_opened += 1
+        self._connections.add(connection)
+        return connection
+
+    def _release(self, connection: _RawHttpConnection):
+        """Boş kapasitesi olan canlı bağlantıyı tekrar kullanılabilir kuyruğuna koyar."""
+        if connection.closed or not connection.keep_alive:
+            if connection.closed:
+                self._connections.discard(connection)
+            return
+        if not connection.in_pool and connection.pending < self.pipeline_depth:
+            connection.in_pool = True
+            self._available[connection.pool_key].append(connection)
+
+    async def send(self, method, url, headers, request_body, is_json, timeout, capture: bool = False) -> Union[int, CapturedResponse]:
+        headers = headers or self._NO_HEADERS
+        cached = self._payload_cache.get((method, url))
+        if cached is None or cached[0] != headers: # Sözlük karşılaştırması, başlıklardan anahtar üretmekten ucuzdur
+            cached = self._payload_cache[(method, url)] = (dict(headers), *self._serialize(method, url, headers, request_body, is_json))
+        _, pool_key, payload = cached
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        # Boş kapasitesi olan bir bağlantı bul, yoksa yenisini aç
+        connection = None
+        available = self._available[pool_key]
+        while available:
+            candidate = available.popleft()
+            candidate.in_pool = False
+            if not candidate.closed and candidate.keep_alive and candidate.pending < self.pipeline_depth:
+                connection = candidate
+                break
+        if connection is None:
+            connection = await self._open_connection(pool_key, timeout)
+        try:
+            return await self._send_on(connection, payload, method == "HEAD", capture, deadline)
+        except UnansweredRequestError:
+            # Sunucu isteği hiç yanıtlamadan bağlantıyı kapattı (örn. pipeline'da "Connection: close" arkasında kaldı):
+            # istek bir kez, yeni bir bağlantıda tekrar gönderilir; orada da yanıtsız kalırsa hata sayılır
+            self.requests_resent += 1
+            connection = await self._open_connection(pool_key, max(deadline - loop.time(), 0.0))
+            return await self._send_on(connection, payload, method == "HEAD", capture, deadline)
+
+    async def _send_on(self, connection: _RawHttpConnection, payload: bytes, is_head: bool, capture: bool, deadline: float):
+        future = connection.send(payload, is_head, capture)
+        if connection.pending < self.pipeline_depth:
+            self._release(connection) # Pipelining: bağlantı yanıt beklerken başka isteklere de açık
+
+        # Zaman aşımında bağlantı kapatılır: sonraki yanıtların sırası artık güvenilir değildir
+        timeout_handle = asyncio.get_running_loop().call_at(deadline, self._expire, future, connection)
+        try:
+            return await future
+        finally:
+            timeout_handle.cancel()
+            self._release(connection)
+
+    async def send_captured(self, method, url, headers, request_body, is_json, timeout) -> CapturedResponse:
+        return await self.send(method, url, headers, request_body, is_json, timeout, capture=True)
+
+    @staticmethod
+    def _expire(future: asyncio.Future, connection: _RawHttpConnection):
+        if not future.done():
+            future.set_exception(asyncio.TimeoutError())
+            connection.close()
+
+    def get_report(self) -> Dict[str, Any]:
+        return {"engine": self.name, "pipeline_depth": self.pipeline_depth, "connections_opened": self.connections_opened,
+                "requests_resent": self.requests_resent}
+
+
+# Seçilebilir istemci motorları (TransportConfig.engine değerleri)
+TRANSPORT_ENGINES = ("aiohttp", "http2", "raw")
+
+# --- Örneklenmiş Yanıt Doğrulaması ---
+_JSON_PATH_TOKEN = re.compile(r"([^.\[\]]+)|\[(\d+)\]")
+_MISSING = object() # JSON yolunda bulunamayan alan
+
+def parse_json_path(path: str) -> List[Union[str, int]]:
+    """"data.items[0].status" biçimindeki yolu anahtar/indeks listesine çevirir (başta '$' olabilir)."""
+    path = path.strip()
+    if path.startswith("$"):
+        path = path[1:].lstrip(".")
+    steps: List[Union[str, int]] = []
+    position = 0
+    while position < len(path):
+        if path[position] == ".":
+            position += 1
+            continue
+        match = _JSON_PATH_TOKEN.match(path, position)
+        if match is None:
+            raise ValueError(f"Geçersiz JSON yolu: '{path}' (örn: data.items[0].status)")
+        steps.append(match.group(1) if match.group(1) is not None else int(match.group(2)))
+        position = match.end()
+    if not steps:
+        raise ValueError("JSON yolu boş olamaz.")
+    return steps
+
+class ResponseValidator:
+    """
+    ResponseCheckConfig'teki kontrolleri örneklenen yanıtlara uygular. Eşleştiriciler (düzenli
+    ifadeler, aranan baytlar, JSON yolu, durum kümesi) bir kez derlenir; kontroller ucuzdan
+    pahalıya sırayla çalışır ve ilk başarısızlıkta durur. Kontrollerin kendi CPU süresi ölçülür.
+    """
+
+    def __init__(self, config: ResponseCheckConfig):
+        if not 0 < config.sample_rate <= 1:
+            raise ValueError(f"Yanıt doğrulama örnekleme oranı 0 ile 1 arasında olmalıdır: {config.sample_rate}")
+        self.config = config
+        self.sample_rate = config.sample_rate
+        self._statuses = frozenset(config.expected_statuses) if config.expected_statuses else None
+        try:
+            self._headers = [(name.lower(), re.compile(pattern)) for name, pattern in (config.headers or {}).items()]
+            self._body_regex = re.compile(config.body_regex.encode("utf-8")) if config.body_regex else None
+        except re.error as e:
+            raise ValueError(f"Yanıt doğrulama düzenli ifadesi derlenemedi: {e}")
+        self._body_contains = config.body_contains.encode("utf-8") if config.body_contains else None
+        self._json_path = parse_json_path(config.json_path) if config.json_path else None
+        self.checked = 0
+        self.failed = 0
+        self.failures: Dict[str, int] = defaultdict(int) # Başarısız kontrol türü -> sayı
+        self.cpu_seconds = 0.0
+
+    def reset(self):
+        """Sayaçları sıfırlar (ısınma sonunda; ölçüm yalnızca kararlı durumu kapsasın diye)."""
+        self.checked = 0
+        self.failed = 0
+        self.failures = defaultdict(int)
+        self.cpu_seconds = 0.0
+
+    def should_sample(self) -> bool:
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def check(self, response: CapturedResponse) -> Optional[str]:
+        """Yanıtı kontrol eder; başarısızsa nedenini, geçerse None döndürür."""
+        cpu_start = time.thread_time()
+        kind, reason = self._first_failure(response)
+        self.cpu_seconds += time.thread_time() - cpu_start
+        self.checked += 1
+        if kind is None:
+            return None
+        self.failed += 1
+        self.failures[kind] += 1
+        return reason
+
+    def _first_failure(self, response: CapturedResponse) -> Tuple[Optional[str], Optional[str]]:
+        config = self.config
+        if self._statuses is not None and response.status not in self._statuses:
+            return "status", f"durum kodu {response.status} beklenenler arasında değil ({sorted(self._statuses)})"
+        body = response.body
+        if config.min_size is not None and len(body) < config.min_size:
+            return "size", f"gövde {len(body)} bayt < en az {config.min_size}"
+        if config.max_size is not None and len(body) > config.max_size:
+            return "size", f"gövde {len(body)} bayt > en fazla {config.max_size}"
+        for name, pattern in self._headers:
+            value = response.headers.get(name)
+            if value is None:
+                return f"header:{name}", f"'{name}' başlığı yok"
+            if pattern.search(value) is None:
+                return f"header:{name}", f"'{name}' başlığı eşleşmedi ({value[:60]!r})"
+        if self._body_contains is not None and self._body_contains not in body:
+            return "body_contains", f"gövde '{config.body_contains}' içermiyor"
+        if self._body_regex is not None and self._body_regex.search(body) is None:
+            return "body_regex", f"gövde /{config.body_regex}/ ile eşleşmedi"
+        if self._json_path is not None:
+            try:
+                value = json.loads(body)
+            except ValueError:
+                return "json_path", "gövde geçerli JSON değil"
+            for step in self._json_path:
+                if isinstance(step, int):
+                    value = value[step] if isinstance(value, list) and -len(value) <= step < len(value) else _MISSING
+                else:
+                    value = value.get(step, _MISSING) if isinstance(value, dict) else _MISSING
+                if value is _MISSING:
+                    return "json_path", f"JSON alanı '{config.json_path}' yok"
+            if config.json_value is not None:
+                actual = value if isinstance(value, str) else json.dumps(value)
+                if actual != config.json_value:
+                    return "json_path", f"'{config.json_path}' = {actual[:60]!r} (beklenen {config.json_value!r})"
+        return None, None
+
+    def get_report(self, duration: float) -> Dict[str, Any]:
+        return {
+            "sample_rate": self.sample_rate,
+            "checked": self.checked,
+            "failed": self.failed,
+            "failures": dict(self.failures),
+            "cpu_seconds": self.cpu_seconds,
+            "cpu_us_per_check": self.cpu_seconds / self.checked * 1e6 if self.checked else 0.0,
+            "cpu_percent": self.cpu_seconds / duration * 100 if duration > 0 else 0.0, # Tek çekirdeğin yüzdesi
+        }
+
+
 # --- HTTP İstek Fonksiyonu ---
+def _request_debug_logging() -> bool:
+    """
+    İstek başına DEBUG kaydının yazılacağı bir handler (örn. log dosyası) olup olmadığını döndürür.
+    Logger seviyesi her zaman DEBUG olduğundan, aksi halde her istek için boşa LogRecord oluşturulur.
+    """
+    for handler in log.handlers:
+        if handler.level <= logging.DEBUG:
+            return True
+    return False
+
 async def make_request(
-    session: aiohttp.ClientSession,
+    transport: BaseTransport, # İsteği gönderecek HTTP istemci motoru
     method: str,
     url: str,
     headers: Optional[Dict[str, str]], # Gönderilecek başlıklar (UA içerebilir veya None/"" olabilir)
     request_body: Optional[Union[str, Dict[str, Any]]], # Gönderilecek veri (varsa)
     is_json: bool, # Gönderilen veri JSON formatında mı?
     timeout: float, # İstek başına zaman aşımı süresi (saniye)
-    verify_ssl: bool, # SSL sertifikası doğrulanacak mı?
-    stats: StatsCollector # İstatistikleri kaydetmek için StatsCollector nesnesi
-) -> Tuple[float, Optional[int], Optional[str]]: # (süre, durum_kodu, hata_mesajı) döndürür
+    stats: StatsCollector, # İstatistikleri kaydetmek için StatsCollector nesnesi
+    validator: Optional[ResponseValidator] = None # Örneklenen yanıtları doğrulayan kontroller (varsa)
+) -> Tuple[float, Optional[int], Optional[ErrorCode]]: # (süre, durum_kodu, hata_kodu) döndürür
     """
     Belirtilen parametrelerle tek bir HTTP isteği yapar, sonucunu (başarı/hata/süre)
-    StatsCollector'a kaydeder ve sonucu (süre, durum kodu, hata mesajı) döndürür.
+    StatsCollector'a kaydeder ve sonucu (süre, durum kodu, hata kodu) döndürür.
+    Yanıt doğrulaması örneklemine düşen isteklerde gövde ve başlıklar da alınır; kontroller
+    yanıt süresi ölçüldükten sonra çalışır, böylece maliyetleri gecikmeye eklenmez.
     """
     start_req_time = time.monotonic() # İstek başlangıç zamanı
     status_code: Optional[int] = None # İstek sonucu alınan durum kodu
-    error_msg: Optional[str] = None   # İstek sırasında oluşan hata mesajı (varsa)
+    error_code: Optional[ErrorCode] = None     # İstek sırasında oluşan hatanın kategorisi (varsa)
+    error_exc: Optional[BaseException] = None  # Hatanın kendisi (mesaj örneklemesi için)
     response_time: float = 0.0        # İsteğin tamamlanma süresi
+    cancelled = False                 # İstek test sonunda iptal edildiyse sonucu kaydedilmez
+    captured: Optional[CapturedResponse] = None # Doğrulama için örneklenen yanıt (varsa)
 
-    # Gönderilecek başlıkları hazırla:
-    request_headers = headers.copy() if headers is not None else {}
+    # Gönderilecek başlıkları hazırla (çağıranın sözlüğü paylaşılır; yalnızca değişmesi gerekirse kopyalanır):
+    request_headers = headers if headers is not None else {}
 
     # User-Agent yönetimi:
     if request_headers.get('User-Agent') == "":
-        request_headers.pop('User-Agent', None)
-
-    # aiohttp istek parametrelerini hazırla
-    request_kwargs = {
-        "headers": request_headers if request_headers else None,
-        "timeout": aiohttp.ClientTimeout(total=timeout),
-        # SSL doğrulamasını yapılandırmadan gelen değere göre ayarla
-        # True ise None (varsayılan doğrulama), False ise False (doğrulama yok)
-        "ssl": None if verify_ssl else False
-    }
-
-    # İstek gövdesini (varsa) ekle
-    if request_body:
-        if is_json and isinstance(request_body, dict):
-            request_kwargs["json"] = request_body
-        else:
-            request_kwargs["data"] = request_body
+        request_headers = {name: value for name, value in request_headers.items() if name != 'User-Agent'}
 
     # HTTP isteğini yap ve olası hataları yakala
     try:
-        # SSL doğrulama kapalıysa ve URL HTTPS ise bir uyarı loglayalım (her istekte değil, belki bir kere başta?)
-        # Şimdilik burada loglayabiliriz ama çok fazla log üretebilir.
-        # if not verify_ssl and url.startswith("https://"):
-        #     log.debug(f"HTTPS isteği ({url}) SSL doğrulaması KAPALI olarak yapılıyor.")
-
-        async with session.request(method, url, **request_kwargs) as response:
-            status_code = response.status
-            await response.read() # Yanıtı tüket
-    except aiohttp.ClientConnectorSSLError as e:
-         # SSL ile ilgili spesifik hatalar (örn. sertifika doğrulama hatası)
-         error_msg = f"SSLError: Güvenli bağlantı hatası - {e}"
-         # Durum kodu bu durumda olmaz, hata mesajı yeterli.
-    except aiohttp.ClientConnectorError as e:
-        # Bağlantı kurulamadı (örn. DNS çözme hatası, sunucu kapalı)
-        error_msg = f"ConnectionError: Bağlantı hatası - {e}"
-    except asyncio.TimeoutError:
-        # Belirtilen `timeout` süresi içinde yanıt alınamadı
-        error_msg = f"TimeoutError: İstek {timeout:.1f} saniyede zaman aşımına uğradı."
+        if validator is not None and validator.should_sample():
+            captured = await transport.send_captured(method, url, request_headers, request_body, is_json, timeout)
+            status_code = captured.status
+        else:
+            status_code = await transport.send(method, url, request_headers, request_body, is_json, timeout)
+    except asyncio.CancelledError:
+        # Drenaj süresi içinde tamamlanamayan istek: yanıtı bilinmediği için ne başarı ne hata sayılır
+        cancelled = True
+        raise
     except aiohttp.ClientResponseError as e:
-        # Sunucudan bir hata yanıtı alındı (örn. 404 Not Found, 500 Internal Server Error)
-        error_msg = f"ClientResponseError: Sunucu hatası - Durum {e.status}: {e.message}"
-        status_code = e.status # Hata nesnesinden durum kodunu alıp kaydederiz
-    except aiohttp.ClientError as e:
-        # aiohttp kütüphanesinden kaynaklanan diğer genel istemci hataları
-        error_msg = f"ClientError: {type(e).__name__}: {e}"
+        # Sunucu yanıtı istemci tarafından işlenemedi (örn. çok fazla yönlendirme); durum kodunu da sakla
+        error_code = ErrorCode.CLIENT_ERROR
+        error_exc = e
+        status_code = e.status
     except Exception as e:
-        # Kodun beklemediği diğer tüm hatalar (programlama hatası vb.)
-        error_msg = f"UnexpectedError: Beklenmedik hata - {type(e).__name__}: {e}"
-        log.exception(f"make_request içinde beklenmedik hata ({url}):")
+        # Hata türü ve errno değerine göre sınıflandır; mesaj yalnızca örnek olarak saklanırsa biçimlendirilir
+        error_code = classify_exception(e)
+        error_exc = e
+        if error_code is ErrorCode.UNEXPECTED:
+            # Kodun beklemediği hatalar (programlama hatası vb.)
+            log.exception("make_request içinde beklenmedik hata (%s):", url)
     finally:
         # İstek başarıyla tamamlansa da, hata alsa da süre hesaplanır
         response_time = time.monotonic() - start_req_time
+        if captured is not None:
+            failure = validator.check(captured)
+            if failure is not None:
+                error_code = ErrorCode.VALIDATION_FAILED
+                error_exc = ResponseValidationError(failure)
         # Sonuç (durum kodu veya hata) istatistik toplayıcıya kaydedilir
-        await stats.add_result(status_code, response_time, error_msg)
-        # DEBUG seviyesinde her isteğin detaylı sonucunu logla
-        log.debug(
-            f"{method} {url} - Durum: {status_code if status_code else 'HATA'} "
-            f"- Süre: {response_time:.4f}s "
-            f"- Hata: {error_msg if error_msg else 'Yok'}"
-        )
+        if not cancelled:
+            await stats.add_result(status_code, response_time, error_code, url, error_exc, start_req_time)
+        # DEBUG seviyesinde her isteğin detaylı sonucunu logla (kayıt yalnızca DEBUG handler'ı varsa oluşturulur)
+        if not cancelled and _request_debug_logging():
+            log.debug(
+                "%s %s - Durum: %s - Süre: %.4fs - Hata: %s (%s)",
+                method, url, status_code if status_code else 'HATA', response_time,
+                error_code.name if error_code is not None else 'Yok', error_exc if error_exc is not None else '-'
+            )
+
+    # Hesaplanan süre, alınan durum kodu ve hata kodunu döndür
+    return response_time, status_code, error_code
+
+# --- Yük Üreticisi İzleme ---
+MONITOR_INTERVAL = 0.1              # Event loop gecikmesinin örneklenme aralığı (saniye)
+LOOP_LAG_WARNING_THRESHOLD = 0.010  # Bu değeri aşan p99 loop gecikmesi (saniye) sonuçları şüpheli kılar
+CPU_WARNING_THRESHOLD = 90.0        # Bu değeri aşan ortalama CPU kullanımı (%) sonuçları şüpheli kılar
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Sürecin anlık RSS değerini (bayt) döndürür; /proc yoksa tepe RSS'e, o da yoksa None'a düşer."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024 # Linux'ta KB, macOS'ta bayt
+
+
+class GeneratorMonitor:
+    """
+    Test sırasında yük üreticisinin kendi sağlığını izler: event loop zamanlama gecikmesi,
+    süreç CPU kullanımı, RSS ve GC duraklamaları. Üretici darboğaz olduğunda ölçülen
+    gecikmeler şişer; bu durumda sonuçlar geçersiz olarak işaretlenir.
+    """
+
+    def __init__(self, interval: float = MONITOR_INTERVAL):
+        self.interval = interval
+        self.lag_samples: List[float] = []  # Her örnekte beklenenden fazla uyunan süre (saniye)
+        self.cpu_samples: List[float] = []  # ~1 saniyelik pencerelerde CPU kullanımı (%)
+        self.current_lag = 0.0
+        self.current_cpu = 0.0
+        self.rss_start: Optional[int] = None
+        self.rss_peak: Optional[int] = None
+        self.rss_end: Optional[int] = None
+        self.gc_collections = [0, 0, 0]     # Nesil başına GC çalışma sayısı
+        self.gc_pause_total = 0.0
+        self.gc_pause_max = 0.0
+        self._gc_started: Optional[float] = None
+        self._wall_start = self._wall_end = 0.0
+        self._cpu_start = self._cpu_end = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def _on_gc(self, phase: str, info: Dict[str, Any]):
+        """gc.callbacks kancası: her toplama işleminin süresini ölçer."""
+        if phase == "start":
+            self._gc_started = time.perf_counter()
+        elif self._gc_started is not None:
+            pause = time.perf_counter() - self._gc_started
+            self._gc_started = None
+            self.gc_collections[info["generation"]] += 1
+            self.gc_pause_total += pause
+            if pause > self.gc_pause_max:
+                self.gc_pause_max = pause
+
+    def start(self):
+        self._wall_start = time.monotonic()
+        self._cpu_start = time.process_time()
+        self.rss_start = self.rss_peak = current_rss_bytes()
+        gc.callbacks.append(self._on_gc)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        self.rss_end = current_rss_bytes()
+        self._update_rss_peak(self.rss_end)
+        self._wall_end = time.monotonic()
+        self._cpu_end = time.process_time()
+
+    def _update_rss_peak(self, rss: Optional[int]):
+        if rss is not None and (self.rss_peak is None or rss > self.rss_peak):
+            self.rss_peak = rss
+
+    async def _run(self):
+        window_wall, window_cpu = time.monotonic(), time.process_time()
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self.current_lag = max(now - expected, 0.0)
+            self.lag_samples.append(self.current_lag)
+            if now - window_wall >= 1.0: # CPU ve RSS'i yaklaşık saniyede bir ölç
+                cpu_now = time.process_time()
+                self.current_cpu = (cpu_now - window_cpu) / (now - window_wall) * 100
+                self.cpu_samples.append(self.current_cpu)
+                window_wall, window_cpu = now, cpu_now
+                self._update_rss_peak(current_rss_bytes())
+
+    def progress_text(self) -> str:
+        """İlerleme satırına eklenecek kısa durum metni."""
+        return f"Loop: {self.current_lag * 1000:.1f}ms, CPU: {self.current_cpu:.0f}%"
+
+    def get_report(self) -> Dict[str, Any]:
+        """İzleme sonuçlarını ve üreticinin darboğaz olup olmadığını içeren sözlüğü döndürür."""
+        lags = sorted(self.lag_samples)
+        wall = self._wall_end - self._wall_start
+        cpu_average = (self._cpu_end - self._cpu_start) / wall * 100 if wall > 0 else 0.0
+        lag_p99 = _percentile(lags, 99)
+        warnings = []
+        if lag_p99 > LOOP_LAG_WARNING_THRESHOLD:
+            warnings.append(f"event loop gecikmesi p99 {lag_p99 * 1000:.1f}ms > {LOOP_LAG_WARNING_THRESHOLD * 1000:.0f}ms")
+        if cpu_average > CPU_WARNING_THRESHOLD:
+            warnings.append(f"ortalama CPU kullanımı %{cpu_average:.0f} > %{CPU_WARNING_THRESHOLD:.0f}")
+        return {
+            "loop_lag_mean": statistics.mean(lags) if lags else 0.0,
+            "loop_lag_p99": lag_p99,
+            "loop_lag_max": lags[-1] if lags else 0.0,
+            "cpu_percent_average": cpu_average,
+            "cpu_percent_peak": max(self.cpu_samples, default=cpu_average),
+            "rss_start_bytes": self.rss_start,
+            "rss_peak_bytes": self.rss_peak,
+            "rss_end_bytes": self.rss_end,
+            "gc_collections": list(self.gc_collections),
+            "gc_pause_total": self.gc_pause_total,
+            "gc_pause_max": self.gc_pause_max,
+            "overloaded": bool(warnings),
+            "warnings": warnings,
+        }
+
+
+class GcController:
+    """
+    Ölçüm süresince üreticinin çöp toplayıcısını yönetir: başlangıç nesnelerini dondurur,
+    nesil eşiklerini yükseltir veya otomatik GC'yi kapatıp toplamaları sabit aralıklarla
+    kontrollü yapar. İsteğe bağlı olarak kısa pencerelerde tracemalloc ile istek başına
+    tutulan (pencere sonunda serbest bırakılmamış) bellek bloklarını örnekler. Test bitince
+    önceki GC ayarlarını geri yükler.
+    """
+    ALLOCATION_TOP_SITES = 5 # Raporlanacak en çok ayırma yapan kod satırı sayısı
+
+    def __init__(self, config: GcTuningConfig, stats_source: Callable[[], StatsCollector]):
+        self.config = config
+        self.stats_source = stats_source # O an istekleri sayan StatsCollector'ı döndüren fonksiyon
+        self.frozen_objects = 0
+        self._generation = 0 # reset() ile artar; sıfırlamadan önce açılmış örnek pencereleri sayılmaz
+        self.reset()
+        self._saved_threshold: Tuple[int, ...] = gc.get_threshold()
+        self._was_enabled = gc.isenabled()
+        self._tasks: List[asyncio.Task] = []
+
+    def reset(self):
+        """Toplama ve örnekleme sayaçlarını sıfırlar (ısınma sonunda; ölçüm yalnızca kararlı durumu kapsasın diye)."""
+        self._generation += 1
+        self.controlled_collections = 0
+        self.controlled_pause_total = 0.0
+        self.controlled_pause_max = 0.0
+        self.sample_windows = 0
+        self.sample_requests = 0
+        self.sample_blocks = 0
+        self.sample_bytes = 0
+        self.sample_peak_bytes = 0
+        self.sample_sites: Dict[str, int] = defaultdict(int) # "dosya:satır" -> pencere sonunda tutulan blok sayısı
+
+    def start(self):
+        self._saved_threshold = gc.get_threshold()
+        self._was_enabled = gc.isenabled()
+        if self.config.freeze:
+            gc.collect() # Çöpleri dondurmamak için önce tam toplama
+            gc.freeze()
+            self.frozen_objects = gc.get_freeze_count()
+        if self.config.mode == "tuned":
+            gc.set_threshold(self.config.gen0_threshold, *self._saved_threshold[1:])
+        elif self.config.mode == "disabled":
+            gc.disable()
+            self._tasks.append(asyncio.create_task(self._collect_periodically()))
+        if self.config.allocation_sample_interval > 0:
+            if tracemalloc.is_tracing():
+                # tracemalloc dışarıda (örn. PYTHONTRACEMALLOC ile) açılmış; pencereler onu durdurmadan ayrıştırılamaz
+                log.warning("tracemalloc zaten açık olduğu için bellek ayırma örneklemesi atlandı.")
+            else:
+                self._tasks.append(asyncio.create_task(self._sample_allocations()))
+        log.info(f"GC ayarı: mod={self.config.mode}, dondurulan nesne={self.frozen_objects}, eşikler={gc.get_threshold()}")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear() # Örnekleme görevi iptal edilirken yalnızca kendi açtığı tracemalloc'u kapatır
+        gc.set_threshold(*self._saved_threshold)
+        if self._was_enabled:
+            gc.enable()
+        if self.config.freeze:
+            gc.unfreeze()
+
+    async def _collect_periodically(self):
+        """Otomatik GC kapalıyken genç nesilleri sabit aralıklarla, süresini ölçerek toplar."""
+        while True:
+            await asyncio.sleep(self.config.collect_interval)
+            started = time.perf_counter()
+            gc.collect(1)
+            pause = time.perf_counter() - started
+            self.controlled_collections += 1
+            self.controlled_pause_total += pause
+            if pause > self.controlled_pause_max:
+                self.controlled_pause_max = pause
+
+    async def _sample_allocations(self):
+        """
+        Belirli aralıklarla kısa bir süre tracemalloc açar; pencere sonunda hâlâ ayrılmış olan
+        (tutulan) blokları o penceredeki istek sayısına böler ve pencere içindeki bellek tepe
+        değerini kaydeder. Pencere içinde ayrılıp serbest bırakılan bloklar anlık görüntüde yer
+        almaz; bu nedenle değerler toplam ayırma sayısı değil, istek başına tutulan bellektir.
+        tracemalloc, açık olduğu pencerede istekleri yavaşlatır. Pencere arasında tracemalloc'u
+        başka biri açmışsa o pencere atlanır; durdurma yalnızca burada açılan izlemeye uygulanır.
+        İstek sayısı pencere başındaki StatsCollector'dan okunur; pencere sırasında istatistik
+        nesnesi değişirse (ısınma sonu, kapasite adımı) pencere sayılmaz.
+        """
+        while True:
+            await asyncio.sleep(self.config.allocation_sample_interval)
+            if tracemalloc.is_tracing():
+                continue
+            generation = self._generation
+            stats = self.stats_source()
+            requests_before = stats.requests_sent
+            tracemalloc.start()
+            try:
+                await asyncio.sleep(self.config.allocation_sample_window)
+                snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            requests = stats.requests_sent - requests_before
+            if requests <= 0 or generation != self._generation or self.stats_source() is not stats:
+                continue
+            self.sample_windows += 1
+            self.sample_requests += requests
+            self.sample_peak_bytes = max(self.sample_peak_bytes, peak)
+            for stat in snapshot.statistics("lineno"):
+                self.sample_blocks += stat.count
+                self.sample_bytes += stat.size
+                frame = stat.traceback[0]
+                self.sample_sites[f"{os.path.basename(frame.filename)}:{frame.lineno}"] += stat.count
+
+    def get_report(self) -> Dict[str, Any]:
+        report = {
+            "mode": self.config.mode,
+            "frozen_objects": self.frozen_objects,
+            "gen0_threshold": self.config.gen0_threshold if self.config.mode == "tuned" else self._saved_threshold[0],
+            "controlled_collections": self.controlled_collections,
+            "controlled_pause_total": self.controlled_pause_total,
+            "controlled_pause_max": self.controlled_pause_max,
+        }
+        if self.sample_windows:
+            report["allocation_sample_windows"] = self.sample_windows
+            report["allocation_sample_requests"] = self.sample_requests
+            report["retained_blocks_per_request"] = self.sample_blocks / self.sample_requests
+            report["retained_bytes_per_request"] = self.sample_bytes / self.sample_requests
+            report["allocation_peak_bytes"] = self.sample_peak_bytes
+            top_sites = sorted(self.sample_sites.items(), key=lambda item: item[1], reverse=True)[:self.ALLOCATION_TOP_SITES]
+            report["retention_top_sites"] = [
+                {"site": site, "retained_blocks_per_request": count / self.sample_requests} for site, count in top_sites
+            ]
+        return report
+
+
+class VirtualUserScheduler:
+    """
+    Sanal kullanıcıları (worker'ları) kullanıcı başına bir görev açmadan yürüten zamanlayıcı.
+
+    Yalnızca isteği süren (aktif) kullanıcılar için asyncio görevi vardır. Rate limit beklemesindeki
+    (boşta) kullanıcılar, uyanma zamanına göre sıralı bir heap'te (zaman, kullanıcı) çifti olarak
+    tutulur ve event loop'ta tek bir zamanlayıcı bulunur. Boştaki kullanıcı görev uyandırmaz, bellekte
+    yalnızca bir heap girdisi kadar yer kaplar. Rate limit aktifken kullanıcıların ilk istekleri tek
+    bir aralığa yayılır; böylece başlangıçta tüm kullanıcılar aynı anda istek göndermez. Başlatma ve
+    durdurma maliyeti aktif kullanıcı sayısıyla orantılıdır.
+    """
+    ERROR_BACKOFF = 0.1 # Beklenmedik hata sonrası kullanıcının tekrar denemeden önce beklediği süre (saniye)
+    # Boştaki bir kullanıcının heap'te kapladığı bellek: (zaman, kullanıcı no) tuple'ı ve içindeki float/int nesneleri
+    IDLE_ENTRY_BYTES = sys.getsizeof((0.0, 0)) + sys.getsizeof(0.0) + sys.getsizeof(2**20)
+
+    def __init__(self, users: int, pacing: float, send: Callable[[], Awaitable[Any]], stop_event: asyncio.Event):
+        self.users = users                  # Toplam sanal kullanıcı sayısı
+        self.pacing = pacing                # Kullanıcı başına iki isteğin başlangıcı arasındaki hedef süre (0 = limitsiz)
+        self._send = send                   # Tek bir isteği gönderip sonucunu kaydeden fonksiyon
+        self.stop_event = stop_event        # Ayarlandığında yeni istek başlatılmaz
+        self._heap: List[Tuple[float, int]] = [] # Boştaki kullanıcılar: (uyanma zamanı, kullanıcı no)
+        self._active: set = set()           # İsteği süren kullanıcıların görevleri
+        self._next_user = 0                 # Henüz ilk isteğini göndermemiş ilk kullanıcı
+        self._start_time = 0.0
+        self._stagger = 0.0                 # Ardışık kullanıcıların ilk istekleri arasındaki süre
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_when = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.peak_active = 0
+        self.stop_seconds = 0.0             # Durdurmanın (drenaj dahil) süresi
+        self.drained = 0                    # Durdurulurken süren ve drenaj süresinde tamamlanan istekler
+        self.abandoned = 0                  # Drenaj süresinde tamamlanamayıp iptal edilen istekler
+        self.idle_at_stop = 0               # Durdurulurken heap'te bekleyen (boştaki) kullanıcılar
+        self.heap_bytes_at_stop = 0         # O anda heap'in (liste + girdiler) kapladığı bellek
+
+    @property
+    def active_count(self) -> int:
+        return len(self._active)
+
+    @property
+    def started_users(self) -> int:
+        return self._next_user
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._start_time = self._loop.time()
+        self._stagger = self.pacing / self.users if self.pacing > 0 and self.users > 0 else 0.0
+        self._dispatch()
+
+    def _arm(self, when: float):
+        """Tek zamanlayıcıyı, mevcut planlanandan daha erken bir uyanma gerekiyorsa yeniden kurar."""
+        if self._timer is not None:
+            if self._timer_when <= when:
+                return
+            self._timer.cancel()
+        self._timer = self._loop.call_at(when, self._dispatch)
+        self._timer_when = when
+
+    def _dispatch(self):
+        """Zamanı gelen kullanıcıları başlatır ve zamanlayıcıyı bir sonraki uyanmaya kurar."""
+        self._timer = None
+        if self.stop_event.is_set():
+            return
+        now = self._loop.time()
+        while self._next_user < self.users and self._start_time + self._next_user * self._stagger <= now:
+            self._launch(self._next_user)
+            self._next_user += 1
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            self._launch(heapq.heappop(heap)[1])
+
+        next_wake = heap[0][0] if heap else None
+        if self._next_user < self.users:
+            first_start = self._start_time + self._next_user * self._stagger
+            next_wake = first_start if next_wake is None else min(next_wake, first_start)
+        if next_wake is not None:
+            self._arm(next_wake)
+
+    def _launch(self, user: int):
+        task = self._loop.create_task(self._run_user(user))
+        self._active.add(task)
+        task.add_done_callback(self._active.discard)
+        if len(self._active) > self.peak_active:
+            self.peak_active = len(self._active)
+
+    async def _run_user(self, user: int):
+        """Kullanıcının isteklerini, bir sonraki isteği beklemesi gerekene kadar art arda gönderir."""
+        loop = self._loop
+        while not self.stop_event.is_set():
+            cycle_start = loop.time()
+            try:
+                await self._send()
+                wake = cycle_start + self.pacing
+            except Exception as e:
+                log.error(f"Sanal kullanıcı {user + 1} döngüsünde beklenmedik hata: {e}")
+                wake = loop.time() + self.ERROR_BACKOFF
+            if wake > loop.time() and not self.stop_event.is_set():
+                # Rate limit beklemesi: görev biter, kullanıcı heap'te uyanma zamanını bekler
+                heapq.heappush(self._heap, (wake, user))
+                self._arm(wake)
+                return
+
+    async def stop(self, grace: float = 0.0) -> Tuple[int, int, int]:
+        """
+        Yeni istek başlatılmasını durdurur ve süren isteklerin tamamlanmasını en fazla 'grace' saniye
+        bekler (drenaj); süre dolunca kalanları iptal eder. (tamamlanan, iptal edilen, boştaki) döndürür.
+        """
+        stop_started = time.monotonic()
+        self.stop_event.set()
+        self.idle_at_stop = len(self._heap)
+        self.heap_bytes_at_stop = sys.getsizeof(self._heap) + self.idle_at_stop * self.IDLE_ENTRY_BYTES
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        idle = len(self._heap) + (self.users - self._next_user)
+        self._heap.clear()
+        active = list(self._active)
+        pending = active
+        if active and grace > 0:
+            _, pending = await asyncio.wait(active, timeout=grace)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*active, return_exceptions=True)
+        self.stop_seconds = time.monotonic() - stop_started
+        self.drained = len(active) - len(pending)
+        self.abandoned = len(pending)
+        return self.drained, self.abandoned, idle
+
+    def get_report(self) -> Dict[str, Any]:
+        return {
+            "virtual_users": self.users,
+            "started_users": self.started_users,
+            "peak_active": self.peak_active,
+            "idle_users_at_stop": self.idle_at_stop,
+            "heap_bytes_at_stop": self.heap_bytes_at_stop,
+            "stop_seconds": self.stop_seconds,
+            "drained_requests": self.drained,
+            "abandoned_requests": self.abandoned,
+        }
 
-    # Hesaplanan süre, alınan durum kodu ve hata mesajını döndür
-    return response_time, status_code, error_msg
 
 # --- Test Yürütücü Sınıfı ---
 class TestRunner:
@@ -383,10 +2302,14 @@ class TestRunner:
 
     def __init__(self, config: TestConfig):
         self.config: TestConfig = config              # Test parametreleri
-        self.stats: StatsCollector = StatsCollector() # İstatistik toplayıcı nesnesi
+        self.stats: StatsCollector # İstatistik toplayıcı nesnesi (URL'ler ve rate limit hesaplandıktan sonra oluşturulur)
         self.stop_event: asyncio.Event = asyncio.Event() # Testi durdurma sinyali
         self.url_list: List[str] = []                 # Hedef URL'lerin listesi
         self.target_delay_per_worker: float = 0.0     # Rate limiting için worker başına bekleme süresi (saniye)
+        self.monitor: Optional[GeneratorMonitor] = None # Yük üreticisinin kendi sağlığını izleyen görev (run içinde başlatılır)
+        self.gc_controller: Optional[GcController] = None # GC ayarı etkinse ölçüm süresince çöp toplayıcıyı yönetir
+        self.warming_up: bool = False                 # Isınma aşaması sürüyor mu (ilerleme satırı için)
+        self.warmup_report: Optional[Dict[str, Any]] = None # Tamamlanan ısınma aşamasının özeti
 
         # URL'leri yükle (dosyadan veya tek URL'den)
         if config.url_file:
@@ -413,99 +2336,153 @@ class TestRunner:
             # Bu durumun oluşmaması gerekir (main fonksiyonunda kontrol edilir)
             raise ValueError("Hata: Ne hedef URL ne de URL dosyası belirtilmedi!")
 
-        # Rate limiting için worker başına düşen hedef gecikmeyi hesapla
-        if config.target_rps > 0 and config.concurrency > 0:
-            try:
-                rps_per_worker = config.target_rps / config.concurrency
-                self.target_delay_per_worker = 1.0 / rps_per_worker
-                log.info(f"Rate Limit Aktif: Hedef {config.target_rps:.2f} RPS ({config.concurrency} worker ile worker başına ~{rps_per_worker:.2f} RPS => ~{self.target_delay_per_worker:.4f}s gecikme)")
-            except ZeroDivisionError:
-                 log.warning("Concurrency 0 olduğu için rate limiting hesaplanamadı/devre dışı.")
-                 self.target_delay_per_worker = 0.0
-        else:
-            log.info("Rate Limit Aktif Değil (Hedef RPS 0 veya belirtilmemiş). İstekler mümkün olduğunca hızlı gönderilecek.")
+        # Uç nokta bazlı istatistikler için URL -> grup eşlemesini bir kez hesapla
+        self.endpoint_grouper: Optional[EndpointGrouper] = None
+        if config.endpoint_stats:
+            stats_config = config.endpoint_stats
+            self.endpoint_grouper = EndpointGrouper(self.url_list, stats_config.grouping, stats_config.pattern, stats_config.max_groups)
+            log.info(f"Uç nokta istatistikleri aktif (gruplama: {stats_config.grouping}, en fazla {stats_config.max_groups} grup).")
 
+        # Seçilen istemci motorunun kullanılabilirliğini testten önce kontrol et
+        if config.transport.engine not in TRANSPORT_ENGINES:
+            raise ValueError(f"Bilinmeyen istemci motoru: '{config.transport.engine}' (seçenekler: {', '.join(TRANSPORT_ENGINES)})")
+        if config.transport.engine == "http2" and httpx is None:
+            raise ValueError("HTTP/2 motoru için 'httpx[http2]' paketi gerekli (pip install \"httpx[http2]\").")
 
-    async def _worker(self, worker_id: int, session: aiohttp.ClientSession):
-        """Tek bir worker'ın (eş zamanlı istek göndericinin) ana görev döngüsü."""
-        log.debug(f"Worker {worker_id} başlatıldı.")
-        while not self.stop_event.is_set(): # Durdurma sinyali gelene kadar çalış
-            start_cycle_time = time.monotonic() # Rate limiting için döngü başlangıç zamanı
-
-            if not self.url_list: # Ekstra güvenlik kontrolü
-                log.error(f"Worker {worker_id} için URL listesi boş! Worker durduruluyor.")
-                break
-            target_url = random.choice(self.url_list) # URL listesinden rastgele bir URL seç
-
-            # İstek başlıklarını hazırla
-            final_headers = self.config.custom_headers.copy()
-            ua_already_set_manually = any(k.lower() == 'user-agent' for k in self.config.custom_headers)
-
-            if not ua_already_set_manually:
-                ua_pref = self.config.user_agent_preference
-                actual_ua_to_send = None
-
-                if ua_pref is None: pass # aiohttp varsayılanı
-                elif ua_pref == "": pass # Gönderilmeyecek (make_request halleder)
-                # Rastgele seçildiyse (main'de tek seçildi), onu kullan
-                elif self.config.user_agent_preference in COMMON_USER_AGENTS:
-                     actual_ua_to_send = self.config.user_agent_preference
-                     # Alternatif: Her istekte farklı UA: actual_ua_to_send = random.choice(COMMON_USER_AGENTS)
-                else: # Özel girilen UA
-                     actual_ua_to_send = ua_pref
-
-                if actual_ua_to_send:
-                    final_headers['User-Agent'] = actual_ua_to_send
-                elif ua_pref == "":
-                     final_headers['User-Agent'] = "" # make_request'in anlaması için
-
+        # Tüm bağlantıların paylaşacağı SSLContext'i bir kez oluştur (sertifika/CA dosyası hataları hemen fark edilsin)
+        try:
+            self.ssl_context: SharedSSLContext = build_ssl_context(config.verify_ssl, config.tls)
+        except (OSError, ssl.SSLError) as e:
+            log.error(f"Hata: TLS ayarları yüklenemedi (CA/istemci sertifikası): {e}")
+            raise
+
+        # Unix domain socket / adres sabitleme: bağlantıların açılacağı yerel hedef
+        routing = config.routing or TargetRoutingConfig()
+        self.unix_socket: Optional[str] = routing.unix_socket
+        self.address_pinning: Optional[AddressPinning] = AddressPinning(routing.host_overrides) if routing.host_overrides else None
+        if self.unix_socket:
+            if self.address_pinning is not None:
+                raise ValueError("Unix domain socket ve adres sabitleme birlikte kullanılamaz.")
+            if any(url.startswith("https://") for url in self.url_list):
+                raise ValueError("Unix domain socket hedefi yalnızca http:// URL'lerle kullanılabilir (socket üzerinden TLS desteklenmez).")
+            log.info(f"Bağlantı hedefi: Unix domain socket '{self.unix_socket}' (URL'deki host yalnızca Host başlığı için kullanılır).")
+        elif self.address_pinning is not None:
+            log.info(f"Adres sabitleme aktif: {self.address_pinning.describe()} (Host başlığı ve SNI değişmez).")
+
+        # Örneklenmiş yanıt kontrollerini (düzenli ifadeler, JSON yolu) testten önce bir kez derle
+        self.validator: Optional[ResponseValidator] = None
+        if config.response_checks:
+            self.validator = ResponseValidator(config.response_checks)
+            log.info(f"Yanıt doğrulaması aktif: yanıtların %{config.response_checks.sample_rate * 100:g}'i kontrol edilecek.")
+
+        if config.gc_tuning and config.gc_tuning.mode not in GC_TUNING_MODES:
+            raise ValueError(f"Bilinmeyen GC modu: '{config.gc_tuning.mode}' (seçenekler: {', '.join(GC_TUNING_MODES)})")
+
+        # Karşılaştırılacak baseline'ı (varsa) testten önce yükle ki hatalı dosya hemen fark edilsin
+        self.baseline_data: Optional[Tuple[Dict[str, Any], LatencyHistogram]] = None
+        if config.baseline and config.baseline.compare_path:
             try:
-                # Asıl HTTP isteğini yap (verify_ssl bilgisini de geçirerek)
-                await make_request(
-                    session,
-                    self.config.http_method,
-                    target_url,
-                    final_headers,
-                    self.config.request_data,
-                    self.config.is_json_data,
-                    self.config.timeout_seconds,
-                    self.config.verify_ssl, # SSL doğrulama ayarını ilet
-                    self.stats
-                )
-
-                # Rate Limiting Uygulaması
-                if self.target_delay_per_worker > 0:
-                    elapsed_time = time.monotonic() - start_cycle_time
-                    sleep_duration = self.target_delay_per_worker - elapsed_time
-                    if sleep_duration > 0:
-                        await asyncio.sleep(sleep_duration)
+                self.baseline_data = load_baseline(config.baseline.compare_path)
+                log.info(f"Baseline '{config.baseline.compare_path}' yüklendi ({self.baseline_data[1].total_count} ölçüm).")
+            except FileNotFoundError:
+                log.error(f"Hata: Baseline dosyası bulunamadı: {config.baseline.compare_path}")
+                raise
+            except (KeyError, json.JSONDecodeError) as e:
+                raise ValueError(f"Baseline dosyası okunamadı ({config.baseline.compare_path}): {e}")
 
-            except Exception as e:
-                 log.error(f"Worker {worker_id} döngüsünde beklenmedik hata: {e}")
-                 await asyncio.sleep(0.1) # Hata durumunda kısa bekleme
+        # Rate limiting için worker başına düşen hedef gecikmeyi hesapla
+        if config.capacity_search:
+            log.info("Kapasite Arama Modu: Hedef RPS her adımda arama algoritması tarafından belirlenecek.")
+        elif config.target_rps > 0 and config.concurrency > 0:
+            self.target_delay_per_worker = self._calculate_worker_delay(config.target_rps)
+            rps_per_worker = config.target_rps / config.concurrency
+            log.info(f"Rate Limit Aktif: Hedef {config.target_rps:.2f} RPS ({config.concurrency} worker ile worker başına ~{rps_per_worker:.2f} RPS => ~{self.target_delay_per_worker:.4f}s gecikme)")
+        elif config.target_rps > 0:
+            log.warning("Concurrency 0 olduğu için rate limiting hesaplanamadı/devre dışı.")
+        else:
+            log.info("Rate Limit Aktif Değil (Hedef RPS 0 veya belirtilmemiş). İstekler mümkün olduğunca hızlı gönderilecek.")
 
-            # Rate limiting yoksa event loop'a kontrolü geri ver
-            if self.target_delay_per_worker <= 0:
-                  await asyncio.sleep(0)
+        if config.co_correction:
+            if self.target_delay_per_worker > 0:
+                log.info(f"Koordineli ihmal düzeltmesi aktif (beklenen aralık: {self.target_delay_per_worker:.4f}s).")
+            elif not config.capacity_search:
+                log.warning("Koordineli ihmal düzeltmesi yalnızca rate limit aktifken uygulanabilir; bu testte devre dışı.")
+        self.request_headers: Dict[str, str] = self._build_request_headers()
+        self.stats = self._new_stats()
 
-        log.debug(f"Worker {worker_id} durduruldu.")
+    def _build_request_headers(self) -> Dict[str, str]:
+        """Her istekte gönderilecek başlıkları (özel başlıklar + User-Agent tercihi) bir kez hazırlar."""
+        final_headers = self.config.custom_headers.copy()
+        ua_already_set_manually = any(k.lower() == 'user-agent' for k in self.config.custom_headers)
+
+        if not ua_already_set_manually:
+            ua_pref = self.config.user_agent_preference
+            actual_ua_to_send = None
+
+            if ua_pref is None: pass # aiohttp varsayılanı
+            elif ua_pref == "": pass # Gönderilmeyecek (make_request halleder)
+            # Rastgele seçildiyse (main'de tek seçildi), onu kullan
+            elif self.config.user_agent_preference in COMMON_USER_AGENTS:
+                 actual_ua_to_send = self.config.user_agent_preference
+                 # Alternatif: Her istekte farklı UA: actual_ua_to_send = random.choice(COMMON_USER_AGENTS)
+            else: # Özel girilen UA
+                 actual_ua_to_send = ua_pref
+
+            if actual_ua_to_send:
+                final_headers['User-Agent'] = actual_ua_to_send
+            elif ua_pref == "":
+                 final_headers['User-Agent'] = "" # make_request'in anlaması için
+        return final_headers
+
+    def _new_stats(self) -> StatsCollector:
+        """Mevcut rate limit ve yapılandırmaya göre yeni bir istatistik toplayıcı oluşturur."""
+        expected_interval = self.target_delay_per_worker if self.config.co_correction else 0.0
+        return StatsCollector(expected_interval, self.endpoint_grouper)
+
+    def _calculate_worker_delay(self, target_rps: float) -> float:
+        """Toplam hedef RPS için worker başına iki istek arasındaki hedef süreyi (saniye) hesaplar (0 = limitsiz)."""
+        if target_rps <= 0 or self.config.concurrency <= 0:
+            return 0.0
+        return self.config.concurrency / target_rps
+
+
+    async def _send_request(self, transport: BaseTransport):
+        """Rastgele seçilen hedefe tek bir istek gönderir ve sonucunu istatistiklere kaydeder."""
+        target_url = random.choice(self.url_list) # URL listesinden rastgele bir URL seç
+        # Asıl HTTP isteğini yap (SSL doğrulama ayarı transport'ta yapılandırılmıştır)
+        await make_request(
+            transport,
+            self.config.http_method,
+            target_url,
+            self.request_headers, # Bir kez hazırlanır, istekler arasında değiştirilmeden paylaşılır
+            self.config.request_data,
+            self.config.is_json_data,
+            self.config.timeout_seconds,
+            self.stats,
+            self.validator
+        )
 
     async def _progress_reporter(self, interval: int = 1):
         """Belirlenen aralıklarla anlık test ilerlemesini konsola yazdırır."""
         last_sent_count = 0
+        last_stats = self.stats
         while not self.stop_event.is_set():
             try:
                 await asyncio.wait_for(self.stop_event.wait(), timeout=interval)
                 break # Stop event geldi
             except asyncio.TimeoutError:
                 # Interval doldu, raporla
+                if self.stats is not last_stats: # Isınma bitti, ölçüm istatistikleri sıfırdan başladı
+                    last_stats, last_sent_count = self.stats, 0
                 sent, failed, rps = await self.stats.get_current_progress()
                 if sent > last_sent_count or last_sent_count == 0:
                     failure_rate = (failed / sent * 100) if sent > 0 else 0.0
                     rps_target_str = f"(Hedef: {self.config.target_rps:.1f} RPS)" if self.config.target_rps > 0 else "(Limitsiz)"
+                    monitor_str = f" | {self.monitor.progress_text()}" if self.monitor else ""
+                    phase_str = "[Isınma] " if self.warming_up else ""
                     print(
-                        f"\rİlerleme: {sent} istek ({failed} hatalı, Hata: {failure_rate:.1f}%), "
-                        f"Anlık RPS: {rps:.2f} {rps_target_str}      ", # Ekstra boşluklar temizler
+                        f"\r{phase_str}İlerleme: {sent} istek ({failed} hatalı, Hata: {failure_rate:.1f}%), "
+                        f"Anlık RPS: {rps:.2f} {rps_target_str}{monitor_str}      ", # Ekstra boşluklar temizler
                         end=""
                     )
                     sys.stdout.flush()
@@ -524,7 +2501,7 @@ class TestRunner:
         results = {}
         passed_all = True
         print("\n--- Assertion Kontrolü ---")
-        if not self.config.assertions:
+        if not self.config.assertions and 'baseline_comparison' not in summary:
             print("-> Hiç assertion tanımlanmamış.")
             return {}, True
 
@@ -557,6 +2534,15 @@ class TestRunner:
                 print(f" -> Max Başarısızlık Oranı <= {max_failure:.1f}%: HESAPLANAMADI (İstek gönderilemedi veya özet eksik)")
                 passed_all = False
 
+        # Baseline Regresyon Kontrolü
+        comparison = summary.get('baseline_comparison')
+        if comparison is not None:
+            passed = not comparison['regression']
+            results['baseline_regression'] = passed
+            detail = ", ".join(comparison['regression_reasons']) if comparison['regression_reasons'] else "eşik aşılmadı"
+            print(f" -> Baseline'a göre regresyon <= %{comparison['max_regression_percent']:.1f}: {'GEÇTİ' if passed else 'KALDI'} ({detail})")
+            if not passed: passed_all = False
+
         print(f"\n Assertion Sonucu: {'TÜMÜ BAŞARIYLA GEÇTİ' if passed_all else 'BAZI KONTROLLER BAŞARISIZ OLDU'}")
         return results, passed_all
 
@@ -587,6 +2573,18 @@ class TestRunner:
         elif summary.get('total_requests_sent', 0) > 0:
             print("\n* Hiç başarılı istek tamamlanmadı, yanıt süresi istatistikleri hesaplanamadı.")
 
+        corrected = summary.get('co_corrected_percentiles')
+        if corrected and summary['co_corrected_count']:
+            uncorrected = summary['co_uncorrected_percentiles']
+            print(f"\n* Yüzdelikler - Düzeltmesiz / Koordineli İhmal Düzeltmeli (beklenen aralık {summary['co_expected_interval']:.4f}s, "
+                  f"hatalı ve zaman aşımına uğrayanlar dahil tüm tamamlanan istekler):")
+            print(f"  {'':>8} {'Düzeltmesiz (s)':>16} {'Düzeltilmiş (s)':>16}")
+            for pct, value in corrected.items():
+                print(f"  {'p' + format(pct, 'g'):>8} {uncorrected[pct]:>16.4f} {value:>16.4f}")
+            print(f"  {'max':>8} {summary['co_uncorrected_max']:>16.4f} {summary['co_corrected_max']:>16.4f}")
+            print(f"  (Düzeltilmiş dağılım {summary['co_corrected_count']} ölçüm içerir; "
+                  f"{summary['co_corrected_count'] - summary['co_uncorrected_count']} tanesi gecikme nedeniyle gönderilemeyen isteklerdir.)")
+
         print("\n* Durum Kodu Dağılımı:")
         status_dist = summary.get('status_code_distribution', {})
         if status_dist:
@@ -601,14 +2599,97 @@ class TestRunner:
         print("\n* Hata Dağılımı (Bağlantı, Zaman Aşımı, SSL vb.):")
         error_dist = summary.get('error_distribution', {})
         if error_dist:
-            for error, count in sorted(error_dist.items()):
-                print(f"  - {error}: {count} kez")
+            error_samples = summary.get('error_samples', {})
+            for error, count in sorted(error_dist.items(), key=lambda item: item[1], reverse=True):
+                print(f"  - {error} ({ERROR_CODE_DESCRIPTIONS[ErrorCode[error]]}): {count} kez")
+                for sample in error_samples.get(error, []):
+                    print(f"      örnek: {sample[:200]}")
         elif summary.get('failed_requests', 0) > 0 and not status_dist:
              print(f"  - {summary.get('failed_requests', 0)} başarısız istek var ancak detaylı hata tipi kaydedilmedi.")
         elif summary.get('failed_requests', 0) == 0 and not error_dist:
              print("  - Bu türde hata kaydedilmedi.")
 
 
+        endpoints = summary.get('endpoints')
+        if endpoints:
+            top_n = self.config.endpoint_stats.top_n
+            grouping = self.config.endpoint_stats.grouping
+            folded = summary.get('endpoint_folded_groups', 0)
+            print(f"\n* Uç Nokta Bazlı Sonuçlar (gruplama: {grouping}, {len(endpoints)} grup"
+                  f"{f', {folded} nadir grup (diğer) kovasında' if folded else ''}):")
+            slowest = sorted((e for e in endpoints if e['requests_sent'] > e['failed_requests']), key=lambda e: e['p95_response_time'], reverse=True)[:top_n]
+            print(f"  En Yavaş {len(slowest)} Uç Nokta (p95'e göre):")
+            for e in slowest:
+                print(f"   - {e['group']}: p50 {e['p50_response_time']:.4f}s, p95 {e['p95_response_time']:.4f}s, "
+                      f"p99 {e['p99_response_time']:.4f}s, max {e['max_response_time']:.4f}s ({e['requests_sent']} istek)")
+            failing = sorted((e for e in endpoints if e['failed_requests'] > 0), key=lambda e: (e['failed_requests'], e['failure_rate_percent']), reverse=True)[:top_n]
+            if failing:
+                print(f"  En Çok Hata Alan {len(failing)} Uç Nokta:")
+                for e in failing:
+                    details = ", ".join([f"HTTP {code}: {count}" for code, count in sorted(e['status_code_distribution'].items()) if not 200 <= code < 400]
+                                        + [f"{name}: {count}" for name, count in sorted(e['error_distribution'].items())])
+                    print(f"   - {e['group']}: {e['failed_requests']}/{e['requests_sent']} başarısız (%{e['failure_rate_percent']:.1f}) [{details}]")
+            else:
+                print("  Hiçbir uç noktada hata kaydedilmedi.")
+
+        transport_report = summary.get('transport', {})
+        if transport_report.get('connections'):
+            protocols = ", ".join(f"{proto}: {count}" for proto, count in transport_report.get('protocols', {}).items()) or "yanıt yok"
+            print(f"\n* HTTP/2 Bağlantıları (Stream Çoklama) - Müzakere edilen protokoller: {protocols}")
+            for i, conn in enumerate(transport_report['connections'], start=1):
+                if not conn['streams']:
+                    continue # Bu bağlantıda HTTP/2 stream'i olmadı (örn. HTTP/1.1'e düşüldü)
+                print(f"  - Bağlantı {i}: {conn['streams']} stream, eşzamanlı stream ort. {conn['avg_concurrent_streams']:.1f} / "
+                      f"tepe {conn['peak_concurrent_streams']}, ort. stream gecikmesi {conn['avg_stream_latency']:.4f}s")
+            if transport_report.get('fallback_responses'):
+                print(f"  UYARI: {transport_report['fallback_responses']} yanıt HTTP/2 dışında alındı (h2 müzakere edilmedi); "
+                      f"bu istekler havuzda sıraya girdiği için stream istatistiklerine dahil edilmedi.")
+
+        if transport_report.get('engine') == "raw":
+            pipelining = f"pipeline derinliği {transport_report['pipeline_depth']}" if transport_report['pipeline_depth'] > 1 else "pipelining kapalı"
+            print(f"\n* Ham Soket Motoru: {transport_report['connections_opened']} bağlantı açıldı ({pipelining})")
+            if transport_report['requests_resent']:
+                print(f"  - Yanıt gelmeden kapanan bağlantılar nedeniyle yeniden gönderilen istek: {transport_report['requests_resent']}")
+
+        if 'tls' in summary:
+            self._print_tls_report(summary['tls'])
+
+        if 'response_validation' in summary:
+            self._print_validation_report(summary['response_validation'])
+
+        scheduler_report = summary.get('scheduler')
+        if scheduler_report is not None:
+            print(f"\n* Sanal Kullanıcılar (Worker): {scheduler_report['virtual_users']} "
+                  f"({scheduler_report['started_users']} başlatıldı, en fazla {scheduler_report['peak_active']} eşzamanlı aktif)")
+            print(f"  - Drenaj: test bitiminde süren {scheduler_report['drained_requests'] + scheduler_report['abandoned_requests']} istekten "
+                  f"{scheduler_report['drained_requests']} tanesi tamamlandı, {scheduler_report['abandoned_requests']} tanesi iptal edildi "
+                  f"({scheduler_report['stop_seconds']:.2f}s)")
+        warmup_report = summary.get('warmup')
+        if warmup_report is not None:
+            print(f"  - Isınma: {warmup_report['duration']:.1f}s, {warmup_report['requests_sent']} istek "
+                  f"({warmup_report['failed_requests']} hatalı) ölçüme dahil edilmedi")
+        if summary.get('requests_outside_window'):
+            print(f"  - Ölçüm penceresi dışında başladığı için sayılmayan istek: {summary['requests_outside_window']}")
+
+        if 'generator' in summary:
+            self._print_generator_report(summary['generator'], summary.get('gc_tuning'))
+
+        comparison = summary.get('baseline_comparison')
+        if comparison is not None:
+            print(f"\n* Baseline Karşılaştırması ({self.config.baseline.compare_path}):")
+            labels = {"p50_response_time": "p50", "p95_response_time": "p95", "p99_response_time": "p99"}
+            for key, values in comparison['latency'].items():
+                print(f"  - {labels.get(key, key)}: {values['baseline']:.4f}s -> {values['current']:.4f}s ({values['change_percent']:+.1f}%)")
+            tp = comparison['throughput']
+            print(f"  - RPS: {tp['baseline']:.2f} -> {tp['current']:.2f} ({tp['change_percent']:+.1f}%)")
+            fr = comparison['failure_rate']
+            print(f"  - Başarısızlık Oranı: {fr['baseline']:.2f}% -> {fr['current']:.2f}% ({fr['change_points']:+.2f} puan, "
+                  f"izin verilen en fazla +{comparison['max_failure_rate_increase']:g} puan)")
+            print(f"  - Gecikme dağılımı farkı (KS testi): D={comparison['ks_statistic']:.4f}, p={comparison['ks_p_value']:.4g} "
+                  f"({'anlamlı' if comparison['significant'] else 'anlamlı değil'}, alfa={self.config.baseline.significance_level}; "
+                  f"büyük örneklemde p hep ≈0 olur, kararı yüzdelik artış eşiği belirler)")
+            print(f"  - Sonuç: {'REGRESYON TESPİT EDİLDİ' if comparison['regression'] else 'Regresyon yok'}")
+
         print("\n--- Gizlilik ve Yapılandırma Notları ---")
         url_source = f"URL Dosyası: {self.config.url_file}" if self.config.url_file else f"Tek URL: {self.config.target_url}"
         print(f"- URL Kaynağı: {url_source}")
@@ -629,11 +2710,67 @@ class TestRunner:
         ssl_status = "AKTİF (Sertifikalar Doğrulanıyor)" if self.config.verify_ssl else "DEVRE DIŞI (Sertifikalar DOĞRULANMIYOR - Güvenlik Riski!)"
         print(f"- SSL/TLS Sertifika Doğrulaması: {ssl_status}")
 
-        print("- DNS sorguları sisteminizin varsayılan çözümleyicisine gönderildi (ISP tarafından izlenebilir).")
+        if self.unix_socket:
+            print(f"- Bağlantılar Unix domain socket '{self.unix_socket}' üzerinden yapıldı (DNS sorgusu yapılmadı).")
+        else:
+            if self.address_pinning is not None:
+                print(f"- Sabitlenmiş adresler (DNS sorgusu yapılmadı): {self.address_pinning.describe()}")
+            print("- DNS sorguları sisteminizin varsayılan çözümleyicisine gönderildi (ISP tarafından izlenebilir).")
         if self.config.log_filename:
             print(f"- Detaylı DEBUG seviyesi loglar '{self.config.log_filename}' dosyasına kaydedildi.")
 
 
+    def _print_validation_report(self, report: Dict[str, Any]):
+        """Örneklenmiş yanıt doğrulamasının sonuçlarını ve kontrollerin kendi CPU maliyetini yazdırır."""
+        print(f"\n* Yanıt Doğrulaması (örnekleme %{report['sample_rate'] * 100:g}): {report['checked']} yanıt kontrol edildi, "
+              f"{report['failed']} tanesi başarısız")
+        for kind, count in sorted(report['failures'].items(), key=lambda item: item[1], reverse=True):
+            print(f"  - {kind}: {count} kez")
+        print(f"  - Kontrollerin CPU maliyeti: toplam {report['cpu_seconds'] * 1000:.1f}ms, kontrol başına {report['cpu_us_per_check']:.1f}µs "
+              f"(tek çekirdeğin %{report['cpu_percent']:.2f}'i)")
+
+    def _print_tls_report(self, report: Dict[str, Any]):
+        """TLS el sıkışmalarını (tam / devam ettirilmiş), sürelerini ve müzakere edilen parametreleri yazdırır."""
+        resumption = "açık" if report['session_resumption'] else "kapalı"
+        print(f"\n* TLS El Sıkışmaları (oturum devamı {resumption}): {report['full_handshakes']} tam, "
+              f"{report['resumed_handshakes']} devam ettirilmiş (%{report['resumption_rate_percent']:.1f})")
+        if report['full_handshakes']:
+            print(f"  - Tam el sıkışma: ort. {report['full_handshake_avg'] * 1000:.2f}ms, max {report['full_handshake_max'] * 1000:.2f}ms")
+        if report['resumed_handshakes']:
+            print(f"  - Devam ettirilmiş: ort. {report['resumed_handshake_avg'] * 1000:.2f}ms, max {report['resumed_handshake_max'] * 1000:.2f}ms")
+        for key, label in (("versions", "Sürüm"), ("ciphers", "Şifre takımı"), ("alpn", "ALPN")):
+            print(f"  - {label}: {', '.join(f'{name}: {count}' for name, count in report[key].items())}")
+
+    def _print_generator_report(self, report: Dict[str, Any], gc_report: Optional[Dict[str, Any]] = None):
+        """Yük üreticisinin sağlık ölçümlerini, GC ayarı sonuçlarını ve darboğaz uyarısını yazdırır."""
+        print("\n* Yük Üreticisi Sağlığı:")
+        print(f"  - Event loop gecikmesi: ort. {report['loop_lag_mean'] * 1000:.2f}ms, p99 {report['loop_lag_p99'] * 1000:.2f}ms, "
+              f"max {report['loop_lag_max'] * 1000:.2f}ms")
+        print(f"  - CPU kullanımı: ort. %{report['cpu_percent_average']:.0f}, tepe %{report['cpu_percent_peak']:.0f} (tek çekirdek = %100)")
+        if report['rss_peak_bytes'] is not None:
+            mb = 2 ** 20
+            print(f"  - Bellek (RSS): başlangıç {report['rss_start_bytes'] / mb:.1f} MB, tepe {report['rss_peak_bytes'] / mb:.1f} MB, "
+                  f"bitiş {report['rss_end_bytes'] / mb:.1f} MB")
+        collections = report['gc_collections']
+        print(f"  - GC: {sum(collections)} toplama (nesil 0/1/2: {collections[0]}/{collections[1]}/{collections[2]}), "
+              f"toplam duraklama {report['gc_pause_total'] * 1000:.1f}ms, en uzun {report['gc_pause_max'] * 1000:.2f}ms")
+        if gc_report is not None:
+            mode_labels = {"default": "Python varsayılanı", "tuned": f"nesil-0 eşiği {gc_report['gen0_threshold']}", "disabled": "otomatik GC kapalı"}
+            print(f"  - GC ayarı: {mode_labels[gc_report['mode']]}, dondurulan başlangıç nesnesi: {gc_report['frozen_objects']}")
+            if gc_report['controlled_collections']:
+                print(f"    Kontrollü toplamalar: {gc_report['controlled_collections']} kez, toplam {gc_report['controlled_pause_total'] * 1000:.1f}ms, "
+                      f"en uzun {gc_report['controlled_pause_max'] * 1000:.2f}ms")
+            if 'retained_blocks_per_request' in gc_report:
+                print(f"  - Tutulan bellek (tracemalloc, {gc_report['allocation_sample_windows']} pencere, {gc_report['allocation_sample_requests']} istek): "
+                      f"pencere sonunda istek başına {gc_report['retained_blocks_per_request']:.1f} blok / {gc_report['retained_bytes_per_request']:.0f} bayt, "
+                      f"pencere tepe {gc_report['allocation_peak_bytes'] / 1024:.0f} KB")
+                for site in gc_report['retention_top_sites']:
+                    print(f"    {site['site']}: istek başına {site['retained_blocks_per_request']:.2f} tutulan blok")
+        if report['overloaded']:
+            print(f"  UYARI: Yük üreticisi darboğaz oldu ({'; '.join(report['warnings'])}). "
+                  "Ölçülen gecikmeler aracın kendi yükü nedeniyle şişmiş olabilir; sonuçlar GEÇERSİZ sayılmalıdır. "
+                  "Eşzamanlılığı/RPS'yi düşürün veya yükü birden fazla sürece/makineye dağıtın.")
+
     async def run(self):
         """Testi başlatır, worker'ları çalıştırır, süreyi/istek sayısını yönetir ve sonuçları raporlar."""
 
@@ -643,15 +2780,22 @@ class TestRunner:
         log.info(f"Eşzamanlılık Seviyesi (Worker): {self.config.concurrency}")
         if self.config.duration: log.info(f"Test Süresi: {self.config.duration} saniye")
         if self.config.total_requests: log.info(f"Toplam İstek Sayısı Hedefi: {self.config.total_requests}")
+        if self.config.capacity_search: log.info(f"Kapasite Arama: {self.config.capacity_search}")
         if self.config.target_rps > 0: log.info(f"Hedeflenen RPS: {self.config.target_rps:.2f} (Rate Limit Aktif)")
         else: log.info("Hedeflenen RPS: Limitsiz (Rate Limit Aktif Değil)")
         log.info(f"İstek Zaman Aşımı: {self.config.timeout_seconds} saniye")
+        drain_timeout = self.config.drain_timeout if self.config.drain_timeout is not None else self.config.timeout_seconds
+        log.info(f"Drenaj Süresi (test sonunda süren istekler için): {drain_timeout} saniye")
 
         # SSL Durumunu Logla
         ssl_log_status = "Aktif" if self.config.verify_ssl else "Devre Dışı"
         log.info(f"SSL Sertifika Doğrulaması: {ssl_log_status}")
         if not self.config.verify_ssl:
              log.warning("GÜVENLİK UYARISI: SSL/TLS Sertifika Doğrulaması DEVRE DIŞI!")
+        tls_config = self.config.tls
+        log.info(f"TLS Oturum Devamı: {'Açık' if tls_config.session_resumption else 'Kapalı'} | "
+                 f"En Düşük Sürüm: {tls_config.min_version or 'varsayılan'} | CA: {tls_config.ca_bundle or 'sistem'} | "
+                 f"İstemci Sertifikası (mTLS): {tls_config.client_cert or 'yok'}")
 
         # User-Agent loglaması
         ua_log_msg = "Belirtilmedi/Özel Header İçinde"
@@ -675,28 +2819,50 @@ class TestRunner:
         log.info(f"Assertions: {self.config.assertions if self.config.assertions else '(Yok)'}")
 
 
-        # aiohttp için TCPConnector ayarları
-        # SSL doğrulamasını yapılandırmaya göre ayarla
-        # verify_ssl True ise None (varsayılan context), False ise False (doğrulama yok)
-        connector = aiohttp.TCPConnector(
-            limit=None,
-            limit_per_host=0,
-            enable_cleanup_closed=True,
-            ssl=None if self.config.verify_ssl else False # Burası önemli
-        )
+        log.info(f"İstemci Motoru: {self.config.transport.engine}")
 
-        start_run_time = time.monotonic() # Gerçek testin başladığı an
-        async with aiohttp.ClientSession(connector=connector) as session:
-            worker_tasks = []
-            for i in range(self.config.concurrency):
-                task = asyncio.create_task(self._worker(worker_id=i + 1, session=session))
-                worker_tasks.append(task)
+        if self.config.capacity_search:
+            # Kapasite arama modu: tüm adımlar aynı oturumu ve bağlantı havuzunu paylaşır
+            async with self._open_transport() as transport, self._tune_gc(), self._monitor_generator():
+                if self.config.warmup:
+                    # Bağlantı havuzu ve hedef, aramanın başlangıç yüküyle ısıtılır
+                    self.target_delay_per_worker = self._calculate_worker_delay(self.config.capacity_search.start_rps)
+                    scheduler = self._spawn_workers(transport)
+                    try:
+                        await self._warm_up()
+                    finally:
+                        self.stop_event.set()
+                        await self._stop_workers(scheduler)
+                summary = await self._run_capacity_search(transport, self.config.capacity_search)
+            summary['transport'] = transport.get_report()
+            if self.ssl_context.full_handshakes + self.ssl_context.resumed_handshakes:
+                summary['tls'] = self.ssl_context.get_report()
+                self._print_tls_report(summary['tls'])
+            if self.validator is not None:
+                summary['response_validation'] = self.validator.get_report(len(summary['capacity_curve']) * self.config.capacity_search.step_duration)
+                self._print_validation_report(summary['response_validation'])
+            if self.warmup_report is not None:
+                summary['warmup'] = self.warmup_report
+            summary['generator'] = self.monitor.get_report()
+            if self.gc_controller is not None:
+                summary['gc_tuning'] = self.gc_controller.get_report()
+            self._print_generator_report(summary['generator'], summary.get('gc_tuning'))
+            return summary
+
+        async with self._open_transport() as transport, self._tune_gc(), self._monitor_generator():
+            scheduler = self._spawn_workers(transport)
 
             progress_task = asyncio.create_task(self._progress_reporter())
 
+            start_run_time = time.monotonic() # Gerçek testin başladığı an (ısınma varsa bittiğinde güncellenir)
             test_completed_normally = False
             try:
-                if self.config.duration:
+                if self.config.warmup:
+                    await self._warm_up()
+                    start_run_time = time.monotonic()
+                if self.stop_event.is_set():
+                    log.info("\nDurdurma sinyali ısınma sırasında algılandı.")
+                elif self.config.duration:
                     log.info(f"Test {self.config.duration} saniye boyunca çalışacak...")
                     await asyncio.sleep(self.config.duration)
                     log.info(f"\nBelirlenen test süresi ({self.config.duration}s) doldu.")
@@ -723,10 +2889,13 @@ class TestRunner:
 
                 if not self.stop_event.is_set():
                     log.info("Normal bitiş veya zaman aşımı. Durdurma sinyali worker'lara gönderiliyor...")
-                    self.stop_event.set()
 
                 print("\rGörevlerin tamamlanması bekleniyor..." + " " * 50)
-                log.debug("stop_event ayarlandı. Progress reporter ve worker task'larının bitmesi bekleniyor.")
+
+                # Ölçüm penceresini kapat ve worker'ları hemen durdur (stop_event burada ayarlanır); araya başka bir
+                # bekleme girerse süren istekler drenajdan önce tamamlanır ve drenaj raporu eksik sayar
+                await self._stop_workers(scheduler)
+                log.debug("Worker'lar durduruldu. Progress reporter task'ının bitmesi bekleniyor.")
 
                 # İlerleme raporlayıcının durmasını bekle
                 try:
@@ -738,36 +2907,265 @@ class TestRunner:
                 except asyncio.CancelledError:
                     log.debug("Progress reporter task zaten iptal edilmişti.")
 
-                # Worker görevlerinin durmasını bekle
-                log.debug(f"{len(worker_tasks)} worker task'ının iptali isteniyor ve tamamlanması bekleniyor...")
-                for task in worker_tasks:
-                     if not task.done(): task.cancel()
-
-                results = await asyncio.gather(*worker_tasks, return_exceptions=True)
-                log.debug("Tüm worker task'ları 'gather' ile beklendi.")
-
-                cancelled_count = sum(1 for r in results if isinstance(r, asyncio.CancelledError))
-                other_errors = [r for r in results if isinstance(r, Exception) and not isinstance(r, asyncio.CancelledError)]
-                successful_completions = len(results) - cancelled_count - len(other_errors)
-                log.info(f"{successful_completions} worker görevi normal tamamlandı, {cancelled_count} iptal edildi.")
-                if other_errors:
-                    log.warning(f"Worker görevlerinden {len(other_errors)} tanesi beklenmedik bir hata ile sonuçlandı.")
-                    for i, err in enumerate(other_errors): log.debug(f"  Worker Hata Detayı {i+1}: {err}")
-
                 print("\r" + " " * 80 + "\r", end="") # Konsolu temizle
                 log.info(f"Testin toplam efektif çalışma süresi: {actual_duration:.2f} saniye.")
 
         # --- Sonuçları Raporla ---
         summary = self.stats.calculate_summary()
+        summary['transport'] = transport.get_report()
+        if self.ssl_context.full_handshakes + self.ssl_context.resumed_handshakes:
+            summary['tls'] = self.ssl_context.get_report()
+        if self.validator is not None:
+            summary['response_validation'] = self.validator.get_report(self.stats.actual_test_duration)
+        summary['scheduler'] = scheduler.get_report()
+        if self.warmup_report is not None:
+            summary['warmup'] = self.warmup_report
+        summary['generator'] = self.monitor.get_report()
+        if self.gc_controller is not None:
+            summary['gc_tuning'] = self.gc_controller.get_report()
+        baseline_config = self.config.baseline
+        if self.baseline_data is not None:
+            baseline_summary, baseline_histogram = self.baseline_data
+            summary['baseline_comparison'] = compare_with_baseline(
+                summary, self.stats.histogram, baseline_summary, baseline_histogram,
+                baseline_config.max_regression_percent, baseline_config.significance_level,
+                baseline_config.max_failure_rate_increase
+            )
         assertion_results, all_assertions_passed = self._check_assertions(summary)
+        summary['assertions_passed'] = all_assertions_passed
         self._print_summary(summary, assertion_results)
 
-        if not all_assertions_passed and self.config.assertions:
+        if not all_assertions_passed:
             log.warning("Test tamamlandı ancak bazı assertion kontrolleri BAŞARISIZ oldu.")
 
+        if baseline_config and baseline_config.save_path:
+            try:
+                save_baseline(baseline_config.save_path, summary, self.stats.histogram, self.config)
+                log.info(f"Test sonucu baseline olarak '{baseline_config.save_path}' dosyasına kaydedildi.")
+            except OSError as e:
+                log.error(f"Baseline dosyası ('{baseline_config.save_path}') yazılamadı: {e}")
+        return summary
+
+    def _create_transport(self) -> BaseTransport:
+        """Yapılandırmaya göre HTTP istemci motorunu oluşturur."""
+        transport_config = self.config.transport
+        if transport_config.engine == "http2":
+            origins = {urlsplit(url)[:2] for url in self.url_list}
+            return Http2Transport(self.ssl_context, transport_config.http2_connections, len(origins), transport_config.http2_prior_knowledge,
+                                  self.unix_socket, self.address_pinning)
+        if transport_config.engine == "raw":
+            return RawHttpTransport(self.ssl_context, transport_config.raw_pipeline_depth, self.unix_socket, self.address_pinning)
+        return AiohttpTransport(self.ssl_context, self.unix_socket, self.address_pinning)
+
+    @contextlib.asynccontextmanager
+    async def _open_transport(self):
+        """Motoru başlatır ve blok bitince (hata olsa bile) bağlantılarını kapatır."""
+        transport = self._create_transport()
+        await transport.start()
+        try:
+            yield transport
+        finally:
+            await transport.close()
+
+    @contextlib.asynccontextmanager
+    async def _tune_gc(self):
+        """GC ayarı yapılandırıldıysa, motor ve worker'lar hazırlandıktan sonra ölçüm boyunca uygular."""
+        if self.config.gc_tuning is None:
+            yield None
+            return
+        self.gc_controller = GcController(self.config.gc_tuning, lambda: self.stats)
+        self.gc_controller.start()
+        try:
+            yield self.gc_controller
+        finally:
+            await self.gc_controller.stop()
+
+    @contextlib.asynccontextmanager
+    async def _monitor_generator(self):
+        """Blok süresince yük üreticisinin loop gecikmesini, CPU, bellek ve GC kullanımını izler."""
+        self.monitor = GeneratorMonitor()
+        self.monitor.start()
+        try:
+            yield self.monitor
+        finally:
+            await self.monitor.stop()
+
+    async def _warm_up(self):
+        """
+        Çalışan worker'larla ısınma aşamasını (süre veya istek sayısı kadar) bekler, ardından
+        istatistik toplayıcıyı yenisiyle değiştirir. Değişim tek adımda yapılır: ısınmada başlayıp
+        sonra biten istekler eski toplayıcıya yazılır, yeni toplayıcı yalnızca sonraki istekleri görür.
+        """
+        warmup = self.config.warmup
+        self.warming_up = True
+        warmup_started = time.monotonic()
+        try:
+            if warmup.requests > 0:
+                log.info(f"Isınma: {warmup.requests} istek gönderilene kadar sonuçlar ölçüme dahil edilmeyecek...")
+                while self.stats.requests_sent < warmup.requests and not self.stop_event.is_set():
+                    await asyncio.sleep(0.05)
+            else:
+                log.info(f"Isınma: ilk {warmup.duration:g} saniyenin sonuçları ölçüme dahil edilmeyecek...")
+                try:
+                    await asyncio.wait_for(self.stop_event.wait(), timeout=warmup.duration)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.warming_up = False
+        warmup_stats = self.stats
+        self.stats = self._new_stats()
+        if self.validator is not None:
+            self.validator.reset()
+        if self.gc_controller is not None:
+            self.gc_controller.reset()
+        self.warmup_report = {
+            "duration": time.monotonic() - warmup_started,
+            "requests_sent": warmup_stats.requests_sent,
+            "failed_requests": warmup_stats.requests_failed,
+        }
+        log.info(f"\nIsınma tamamlandı ({self.warmup_report['duration']:.1f}s): {warmup_stats.requests_sent} istek "
+                 f"({warmup_stats.requests_failed} hatalı) ölçüme dahil edilmedi. Ölçüm başlıyor.")
+
+    def _spawn_workers(self, transport: BaseTransport) -> VirtualUserScheduler:
+        """Yapılandırılan eşzamanlılık kadar sanal kullanıcıyı (worker) zamanlayıcı üzerinden başlatır."""
+        scheduler = VirtualUserScheduler(
+            self.config.concurrency, self.target_delay_per_worker,
+            lambda: self._send_request(transport), self.stop_event
+        )
+        scheduler.start()
+        return scheduler
+
+    async def _stop_workers(self, scheduler: VirtualUserScheduler):
+        """
+        Ölçüm penceresini kapatır, yeni istek başlatılmasını durdurur ve süren isteklerin
+        drenaj süresi içinde tamamlanmasını bekler; süre dolunca kalanlar iptal edilir.
+        Drenaj ölçümünün doğru olması için süre dolduktan hemen sonra, arada beklemeden çağrılmalıdır.
+        """
+        self.stats.window_end = time.monotonic()
+        grace = self.config.drain_timeout if self.config.drain_timeout is not None else self.config.timeout_seconds
+        log.debug(f"{scheduler.active_count} süren isteğin tamamlanması en fazla {grace:.1f}s bekleniyor (drenaj)...")
+        drained_count, abandoned_count, idle_count = await scheduler.stop(grace)
+        log.debug(f"Worker'lar {scheduler.stop_seconds:.3f}s içinde durduruldu.")
+        log.info(f"{scheduler.users} worker durduruldu: {drained_count} süren istek tamamlandı, {abandoned_count} istek drenaj süresinde "
+                 f"bitmediği için iptal edildi, {idle_count} worker boştaydı (en fazla {scheduler.peak_active} eşzamanlı aktif worker).")
+        if abandoned_count:
+            log.warning(f"{abandoned_count} istek drenaj süresi ({grace:.1f}s) içinde tamamlanmadı; bu istekler sonuçlara dahil edilmedi.")
+
+    # --- Kapasite Arama Modu ---
+    async def _run_capacity_step(self, transport: BaseTransport, step_rps: float, step_duration: int) -> Dict[str, Any]:
+        """Verilen hedef RPS ile tek bir yük adımı çalıştırır ve adımın özetini döndürür."""
+        # Her adım kendi istatistiklerini tutar; oturum ve bağlantı havuzu adımlar arasında paylaşılır
+        self.target_delay_per_worker = self._calculate_worker_delay(step_rps)
+        self.stats = self._new_stats()
+        self.stop_event = asyncio.Event()
+
+        scheduler = self._spawn_workers(transport)
+        try:
+            await asyncio.sleep(step_duration)
+        finally:
+            self.stats.actual_test_duration = time.monotonic() - self.stats.start_time
+            self.stop_event.set()
+            await self._stop_workers(scheduler)
+        return self.stats.calculate_summary()
+
+    def _evaluate_capacity_step(self, summary: Dict[str, Any], step_rps: float, search: CapacitySearchConfig) -> Tuple[bool, str]:
+        """Bir adımın SLO'yu (yüzdelik gecikme, hata oranı, gerçekleşen RPS) karşılayıp karşılamadığını döndürür."""
+        if summary.get('successful_requests', 0) == 0:
+            return False, "başarılı istek yok"
+        if summary['failure_rate_percent'] > search.slo_error_rate:
+            return False, f"hata oranı {summary['failure_rate_percent']:.2f}% > {search.slo_error_rate:.2f}%"
+        latency = self.stats.get_percentile(search.slo_percentile)
+        if latency > search.slo_latency:
+            return False, f"p{search.slo_percentile:g} {latency:.4f}s > {search.slo_latency:.4f}s"
+        achieved_ratio = summary['requests_per_second'] / step_rps if step_rps > 0 else 0.0
+        if achieved_ratio < search.min_achieved_ratio:
+            return False, f"gerçekleşen RPS hedefin %{achieved_ratio * 100:.1f}'i (yük sürdürülemiyor)"
+        return True, "SLO karşılandı"
+
+    async def _run_capacity_search(self, transport: BaseTransport, search: CapacitySearchConfig) -> Dict[str, Any]:
+        """
+        SLO ihlal edilene kadar yükü katsayı ile artırır, ardından son geçen ve ilk kalan
+        adım arasında ikili arama yaparak en yüksek sürdürülebilir RPS'yi bulur.
+        """
+        curve: List[Dict[str, Any]] = [] # Gecikme - verim eğrisi (her adım için bir satır)
+
+        async def probe(step_rps: float) -> bool:
+            log.info(f"Kapasite adımı: Hedef {step_rps:.2f} RPS, {search.step_duration}s çalıştırılıyor...")
+            step_summary = await self._run_capacity_step(transport, step_rps, search.step_duration)
+            passed, reason = self._evaluate_capacity_step(step_summary, step_rps, search)
+            curve.append({
+                "target_rps": step_rps,
+                "achieved_rps": step_summary['requests_per_second'],
+                "slo_latency": self.stats.get_percentile(search.slo_percentile),
+                "p50_response_time": step_summary['p50_response_time'],
+                "p99_response_time": step_summary['p99_response_time'],
+                "failure_rate_percent": step_summary['failure_rate_percent'],
+                "passed": passed,
+                "reason": reason,
+            })
+            log.info(f" -> {step_rps:.2f} RPS: {'GEÇTİ' if passed else 'KALDI'} ({reason})")
+            return passed
+
+        highest_passing = 0.0
+        lowest_failing: Optional[float] = None
+
+        # 1. Aşama: SLO ihlal edilene veya max_rps'ye ulaşılana kadar yükü artır
+        step_rps = search.start_rps
+        while True:
+            if await probe(step_rps):
+                highest_passing = step_rps
+                if step_rps >= search.max_rps:
+                    log.info(f"Maksimum hedef ({search.max_rps:.2f} RPS) SLO ihlali olmadan karşılandı.")
+                    break
+                step_rps = min(step_rps * search.growth_factor, search.max_rps)
+            else:
+                lowest_failing = step_rps
+                break
+
+        # 2. Aşama: Son geçen ve ilk kalan adım arasında ikili arama
+        if lowest_failing is not None:
+            low, high = highest_passing, lowest_failing
+            while high - low > search.resolution_rps:
+                mid = (low + high) / 2
+                if await probe(mid):
+                    low = mid
+                else:
+                    high = mid
+            highest_passing = low
+
+        summary = {
+            "max_sustainable_rps": highest_passing,
+            "first_failing_rps": lowest_failing,
+            "capacity_curve": curve,
+        }
+        self._print_capacity_summary(summary, search)
+        return summary
+
+    def _print_capacity_summary(self, summary: Dict[str, Any], search: CapacitySearchConfig):
+        """Kapasite arama sonucunu ve gecikme - verim eğrisini konsola yazdırır."""
+        print("\n--- Kapasite Arama Sonuçları ---")
+        print(f"* SLO: p{search.slo_percentile:g} <= {search.slo_latency:.3f}s, Hata Oranı <= {search.slo_error_rate:.2f}%")
+        print("\n* Gecikme - Verim Eğrisi (gerçekleşen RPS'ye göre sıralı):")
+        print(f"  {'Hedef RPS':>10} {'Gerçek RPS':>11} {'p50 (s)':>9} {'p' + format(search.slo_percentile, 'g') + ' (s)':>9} {'p99 (s)':>9} {'Hata %':>7}  Sonuç")
+        for row in sorted(summary['capacity_curve'], key=lambda r: r['achieved_rps']):
+            print(
+                f"  {row['target_rps']:>10.2f} {row['achieved_rps']:>11.2f} {row['p50_response_time']:>9.4f} "
+                f"{row['slo_latency']:>9.4f} {row['p99_response_time']:>9.4f} {row['failure_rate_percent']:>7.2f}  "
+                f"{'GEÇTİ' if row['passed'] else 'KALDI'} ({row['reason']})"
+            )
+        if summary['max_sustainable_rps'] > 0:
+            print(f"\n* En Yüksek Sürdürülebilir RPS: {summary['max_sustainable_rps']:.2f}")
+        else:
+            print(f"\n* SLO, başlangıç yükünde ({search.start_rps:.2f} RPS) bile karşılanamadı.")
+        if summary['first_failing_rps'] is None:
+            print(f"  (Arama üst sınırı {search.max_rps:.2f} RPS'ye ulaşıldı; gerçek kapasite daha yüksek olabilir.)")
+
 
 async def main():
-    """Scriptin ana giriş noktası. Kullanıcıdan parametreleri alır, TestConfig'i oluşturur ve TestRunner'ı başlatır."""
+    """
+    Scriptin ana giriş noktası. Kullanıcıdan parametreleri alır, TestConfig'i oluşturur ve TestRunner'ı başlatır.
+    Test tamamlanıp tüm kontroller geçtiyse True, kontrol başarısızsa False döndürür.
+    """
     print("--- Asenkron HTTP Yük Testi Aracı ---")
     print("UYARI: Bu araç, istekleri doğrudan sizin IP adresinizden gönderir.")
     print("       Yüksek hacimli testler hedef sunucuda veya ağınızda sorunlara yol açabilir.")
@@ -808,6 +3206,66 @@ async def main():
         else:
             print("Hata: Geçersiz seçim. Lütfen 'U' veya 'F' girin.")
 
+    # URL dosyası modunda uç nokta bazlı istatistikler
+    endpoint_stats: Optional[EndpointStatsConfig] = None
+    if url_file and get_yes_no_input("\nİstatistikleri uç nokta (endpoint) bazında da ayrıştırmak ister misiniz?", default_yes=True):
+        print(" Gruplama: 'url' (tam URL), 'path' (yol şablonu, sayısal/UUID segmentler {id} olur), 'host', 'regex' (ilk yakalama grubu)")
+        while True:
+            grouping = get_input(" Gruplama türü", default="path").lower()
+            if grouping not in ENDPOINT_GROUPINGS:
+                print(f" Hata: Geçersiz gruplama. Seçenekler: {', '.join(ENDPOINT_GROUPINGS)}")
+                continue
+            pattern = None
+            if grouping == "regex":
+                pattern = get_input(" Regex (örn: https?://[^/]+/(api/v\\d+/\\w+))")
+                try:
+                    re.compile(pattern)
+                except re.error as e:
+                    print(f" Hata: Geçersiz regex: {e}")
+                    continue
+            break
+        max_groups = get_positive_integer_input(" Ayrı tutulacak en fazla grup sayısı (fazlası '(diğer)' kovasına katlanır)", default=50)
+        endpoint_stats = EndpointStatsConfig(grouping=grouping, pattern=pattern, max_groups=max_groups)
+
+    # Bağlantı hedefi: Unix domain socket veya host -> yerel adres sabitleme (örn. Envoy sidecar)
+    routing: Optional[TargetRoutingConfig] = None
+    if get_yes_no_input("\nİstekler URL'deki host yerine yerel bir hedefe (Unix socket / sabit adres) mi gönderilsin?", default_yes=False):
+        print("  S. Unix domain socket (tüm istekler bu socket'e, yalnızca http:// URL'ler)")
+        print("  A. Host -> adres sabitleme (DNS yok; Host başlığı ve TLS sunucu adı değişmez)")
+        while True:
+            routing_choice = get_input("Seçiminiz", default='S').upper()
+            if routing_choice in ('S', 'A'):
+                break
+            print("Hata: Geçersiz seçim. Lütfen 'S' veya 'A' girin.")
+        if routing_choice == 'S':
+            while True:
+                unix_socket = get_input(" Unix domain socket yolu (örn: /var/run/envoy.sock)")
+                if unix_socket:
+                    break
+                print(" Hata: Socket yolu boş olamaz.")
+            if not os.path.exists(unix_socket):
+                log.warning(f"'{unix_socket}' şu anda mevcut değil; test başladığında bağlantılar başarısız olabilir.")
+            routing = TargetRoutingConfig(unix_socket=unix_socket)
+        else:
+            host_overrides: Dict[str, str] = {}
+            print(" Kuralları 'host[:port]=adres[:port]' formatında girin (örn: api.example.com:443=127.0.0.1:15001), bitirmek için boş bırakın:")
+            while True:
+                rule = get_input("  Kural", default="")
+                if not rule:
+                    break
+                source, separator, target = rule.partition("=")
+                try:
+                    if not separator:
+                        raise ValueError("'=' eksik")
+                    parse_address(source)
+                    parse_address(target)
+                except ValueError as e:
+                    print(f"  Hata: Geçersiz kural ({e}).")
+                    continue
+                host_overrides[source.strip()] = target.strip()
+            if host_overrides:
+                routing = TargetRoutingConfig(host_overrides=host_overrides)
+
     # 2. HTTP Metodu
     http_method = get_input("\nHTTP Metodu (GET, POST, PUT, DELETE vb.)", default="GET").upper()
     allowed_methods = {"GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "PATCH"}
@@ -820,22 +3278,117 @@ async def main():
     # 4. Test Modu (Süre veya İstek Sayısı)
     duration: Optional[int] = None
     total_requests: Optional[int] = None
+    capacity_search: Optional[CapacitySearchConfig] = None
     while True:
-        mode = get_input("\nTest modu: Belirli bir 'S'üre mi yoksa belirli 'I'stek sayısı mı?", default='S').upper()
+        mode = get_input("\nTest modu: Belirli bir 'S'üre mi, belirli 'I'stek sayısı mı, yoksa 'K'apasite arama mı?", default='S').upper()
         if mode == 'S':
             duration = get_positive_integer_input("Test süresi (saniye)", default=10)
             break
         elif mode == 'I':
             total_requests = get_positive_integer_input("Toplam gönderilecek istek sayısı", default=1000)
             break
+        elif mode == 'K':
+            print(" Kapasite arama modu, yükü adım adım artırarak SLO'yu ihlal etmeyen en yüksek RPS'yi bulur.")
+            defaults = CapacitySearchConfig()
+            start_rps = get_positive_float_input(" Başlangıç RPS", default=defaults.start_rps)
+            max_rps = get_positive_float_input(" Aranacak en yüksek RPS", default=defaults.max_rps)
+            if start_rps <= 0 or max_rps < start_rps:
+                print("Hata: Başlangıç RPS 0'dan büyük ve en yüksek RPS'den küçük/eşit olmalıdır.")
+                continue
+            capacity_search = CapacitySearchConfig(
+                start_rps=start_rps,
+                max_rps=max_rps,
+                step_duration=get_positive_integer_input(" Her adımın süresi (saniye)", default=defaults.step_duration),
+                slo_percentile=min(get_positive_float_input(" SLO gecikme yüzdeliği (örn: 95)", default=defaults.slo_percentile), 100.0),
+                slo_latency=get_positive_float_input(" Bu yüzdelik için max gecikme (saniye)", default=defaults.slo_latency),
+                slo_error_rate=get_positive_float_input(" Max başarısızlık oranı (%)", default=defaults.slo_error_rate),
+            )
+            break
         else:
-            print("Hata: Geçersiz mod. Lütfen 'S' veya 'I' girin.")
-
-    # Rate Limit (Hedef RPS)
-    target_rps = get_positive_float_input("\nHedeflenen saniye başına istek (RPS) (0 = limitsiz)", default=0.0)
+            print("Hata: Geçersiz mod. Lütfen 'S', 'I' veya 'K' girin.")
+
+    # Rate Limit (Hedef RPS) - kapasite modunda RPS'yi arama algoritması belirler
+    target_rps = 0.0
+    if not capacity_search:
+        target_rps = get_positive_float_input("\nHedeflenen saniye başına istek (RPS) (0 = limitsiz)", default=0.0)
+    co_correction = False
+    if target_rps > 0 or capacity_search:
+        print(" Rate limit aktifken, yavaşlayan yanıtlar o sürede gönderilmesi gereken istekleri gizler (koordineli ihmal).")
+        co_correction = get_yes_no_input(" Gecikmeleri koordineli ihmale karşı düzeltilmiş olarak da raporlamak ister misiniz?", default_yes=True)
+
+    # Isınma (Warm-up) Aşaması
+    warmup: Optional[WarmupConfig] = None
+    print("\nİlk saniyeler bağlantı kurulumu (TCP/TLS, DNS) ve sunucu tarafı ısınma nedeniyle sonuçları bozabilir.")
+    if get_yes_no_input("Ölçümden önce, sonuçlara dahil edilmeyen bir ısınma aşaması uygulansın mı?", default_yes=False):
+        while True:
+            warmup_mode = get_input(" Isınma: Belirli bir 'S'üre mi, belirli 'I'stek sayısı mı?", default='S').upper()
+            if warmup_mode == 'S':
+                warmup = WarmupConfig(duration=get_positive_float_input(" Isınma süresi (saniye)", default=WarmupConfig().duration))
+                break
+            elif warmup_mode == 'I':
+                warmup = WarmupConfig(requests=get_positive_integer_input(" Isınma istek sayısı", default=100))
+                break
+            print("Hata: Geçersiz seçim. Lütfen 'S' veya 'I' girin.")
 
     # 5. Zaman Aşımı
     timeout_seconds = get_positive_float_input("\nHer bir istek için zaman aşımı süresi (saniye)", default=10.0)
+    print(" Test bitiminde yeni istek gönderilmez; süren isteklerin tamamlanması (drenaj) beklenir ve sonuçlara dahil edilir.")
+    drain_timeout = get_positive_float_input(" Süren istekler için en fazla kaç saniye beklensin? (0 = hemen iptal et)", default=timeout_seconds)
+
+    # İstemci Motoru (Transport)
+    transport_config = TransportConfig()
+    print("\n--- İstemci Motoru ---")
+    print("  A. aiohttp (HTTP/1.1, eşzamanlı her istek için ayrı TCP bağlantısı) (Varsayılan)")
+    print(f"  H. HTTP/2 (httpx + h2, çok sayıda stream az sayıda bağlantı üzerinden çoklanır){'' if httpx else ' - httpx[http2] kurulu değil'}")
+    print("  R. Ham soket HTTP/1.1 (asyncio.Protocol, düşük ek yük, basit GET testlerinde en yüksek RPS)")
+    while True:
+        engine_choice = get_input("İstemci motoru seçiminiz", default='A').upper()
+        if engine_choice == 'A':
+            break
+        elif engine_choice == 'H':
+            if httpx is None:
+                print("Hata: HTTP/2 motoru için önce 'pip install \"httpx[http2]\"' ile httpx kurulmalıdır.")
+                continue
+            http2_connections = get_positive_integer_input(" HTTP/2 bağlantı sayısı (stream'ler bu bağlantılara dağıtılır)", default=1)
+            prior_knowledge = False
+            if (target_url or "").startswith("http://") or url_file:
+                prior_knowledge = get_yes_no_input(" http:// hedeflerde doğrudan HTTP/2 (h2c, prior knowledge) kullanılsın mı?", default_yes=False)
+            transport_config = TransportConfig(engine="http2", http2_connections=http2_connections, http2_prior_knowledge=prior_knowledge)
+            break
+        elif engine_choice == 'R':
+            print(" Pipelining, bir bağlantıda yanıt beklenmeden birden fazla istek gönderir (1 = kapalı).")
+            print(" Not: Zaman aşımına uğrayan istek, bağlantıdaki diğer pipeline edilmiş istekleri de bağlantı hatasıyla sonlandırır.")
+            pipeline_depth = get_positive_integer_input(" Bağlantı başına pipeline derinliği", default=1)
+            transport_config = TransportConfig(engine="raw", raw_pipeline_depth=pipeline_depth)
+            break
+        else:
+            print("Hata: Geçersiz seçim. Lütfen 'A', 'H' veya 'R' girin.")
+
+    # GC Ayarı (uzun ve yüksek RPS'li testlerde üreticiden kaynaklanan kuyruk gecikmesini azaltmak için)
+    gc_tuning_config: Optional[GcTuningConfig] = None
+    if get_yes_no_input("\nGC ayarı modu kullanılsın mı? (Üreticinin kendi GC duraklamalarını azaltır)", default_yes=False):
+        print("  V. Python varsayılan eşikleri (yalnızca başlangıç nesneleri dondurulur)")
+        print("  A. Yüksek nesil-0 eşiği (daha seyrek GC)")
+        print("  K. Otomatik GC kapalı, belirli aralıklarla kontrollü toplama")
+        gc_modes = {'V': "default", 'A': "tuned", 'K': "disabled"}
+        while True:
+            gc_choice = get_input("GC modu", default='A').upper()
+            if gc_choice in gc_modes:
+                break
+            print("Hata: Geçersiz seçim. Lütfen 'V', 'A' veya 'K' girin.")
+        gen0_threshold = GcTuningConfig().gen0_threshold
+        collect_interval = GcTuningConfig().collect_interval
+        if gc_choice == 'A':
+            gen0_threshold = get_positive_integer_input(" Nesil-0 eşiği", default=gen0_threshold)
+        elif gc_choice == 'K':
+            collect_interval = get_positive_float_input(" Kontrollü toplama aralığı (saniye)", default=collect_interval)
+        allocation_sample_interval = 0.0
+        if get_yes_no_input(" İstek başına bellek ayırma sayısı tracemalloc ile örneklensin mi? (örnekleme penceresinde istekler yavaşlar)", default_yes=False):
+            allocation_sample_interval = get_positive_float_input(" Örnekleme aralığı (saniye)", default=10.0)
+        gc_tuning_config = GcTuningConfig(
+            mode=gc_modes[gc_choice], gen0_threshold=gen0_threshold, collect_interval=collect_interval,
+            allocation_sample_interval=allocation_sample_interval,
+        )
 
     # YENİ: SSL Doğrulama Ayarı
     print("\n--- SSL/TLS Ayarları ---")
@@ -845,6 +3398,25 @@ async def main():
     print("karşı test yaparken kullanılmalıdır.")
     verify_ssl_choice = get_yes_no_input("SSL sertifika doğrulamasını etkinleştirmek ister misiniz? (E=Evet, Güvenli / H=Hayır, Güvensiz)", default_yes=True) # Varsayılan olarak güvenli (doğrulama açık)
 
+    # Paylaşılan SSLContext ayarları (oturum devamı, özel CA, mTLS, en düşük sürüm)
+    tls_config = TlsConfig()
+    if get_yes_no_input("Gelişmiş TLS ayarlarını (oturum devamı, özel CA, istemci sertifikası, en düşük sürüm) yapılandırmak ister misiniz?", default_yes=False):
+        print(" Oturum devamı açıkken yeni bağlantılar önceki TLS oturumunu kullanır (kısaltılmış el sıkışma);")
+        print(" kapatmak her bağlantıda tam el sıkışmasını ölçmenizi sağlar.")
+        session_resumption = get_yes_no_input(" TLS oturum devamı (session ticket) kullanılsın mı?", default_yes=True)
+        ca_bundle = get_input(" Özel CA dosyası (PEM, boş bırakırsanız sistem CA'ları)", default="") or None
+        client_cert = get_input(" mTLS istemci sertifikası (PEM, boş bırakırsanız yok)", default="") or None
+        client_key = None
+        if client_cert:
+            client_key = get_input(" İstemci özel anahtarı (boş bırakırsanız sertifika dosyasında)", default="") or None
+        while True:
+            min_version = get_input(f" En düşük TLS sürümü ({', '.join(TLS_MIN_VERSIONS)}, boş bırakırsanız varsayılan)", default="") or None
+            if min_version is None or min_version in TLS_MIN_VERSIONS:
+                break
+            print(f"Hata: Geçersiz sürüm. Lütfen {', '.join(TLS_MIN_VERSIONS)} değerlerinden birini girin.")
+        tls_config = TlsConfig(session_resumption=session_resumption, ca_bundle=ca_bundle, client_cert=client_cert,
+                               client_key=client_key, min_version=min_version)
+
 
     # 6. User-Agent (get_user_agent_preference fonksiyonu çağrılır)
     user_agent_preference = get_user_agent_preference() # None, "", veya seçilen/girilen UA döndürür
@@ -952,6 +3524,77 @@ async def main():
             else:
                  print(" Hata: Geçersiz assertion tipi. Lütfen 'latency' veya 'failure' girin ya da boş bırakın.")
 
+    # Yanıt Doğrulaması (durum kodu dışındaki başarı ölçütleri, örneklenmiş)
+    response_checks: Optional[ResponseCheckConfig] = None
+    print("\n--- Yanıt Doğrulaması ---")
+    print("Varsayılan olarak yalnızca durum kodu (200-399) başarı ölçütüdür. '200 OK' içinde hata döndüren")
+    print("servisler için yanıtların bir örneklemi gövde ve başlıklarıyla birlikte kontrol edilebilir.")
+    if get_yes_no_input("Yanıt doğrulama kontrolleri tanımlamak ister misiniz?", default_yes=False):
+        while True:
+            sample_percent = get_positive_float_input(" Kontrol edilecek yanıtların yüzdesi (1-100)", default=10.0)
+            if 0 < sample_percent <= 100:
+                break
+            print(" Hata: Yüzde 0'dan büyük ve 100'den küçük veya eşit olmalıdır.")
+        statuses_input = get_input(" Kabul edilen durum kodları (virgülle ayrılmış, örn: 200,204; boş = kontrol yok)", default="")
+        expected_statuses = None
+        if statuses_input:
+            try:
+                expected_statuses = tuple(int(code) for code in statuses_input.split(",") if code.strip())
+            except ValueError:
+                print(" Uyarı: Durum kodları okunamadı, durum kodu kontrolü yapılmayacak.")
+        check_headers: Dict[str, str] = {}
+        print(" Başlık kontrolleri ('İsim: düzenli ifade' formatında, bitirmek için boş bırakın):")
+        while True:
+            header_line = get_input("  Başlık kontrolü", default="")
+            if not header_line:
+                break
+            if ":" not in header_line:
+                print("  Hata: 'İsim: düzenli ifade' formatında girin.")
+                continue
+            name, pattern = header_line.split(":", 1)
+            check_headers[name.strip()] = pattern.strip()
+        body_contains = get_input(" Gövdede bulunması gereken metin (boş = kontrol yok)", default="") or None
+        body_regex = get_input(" Gövdenin eşleşmesi gereken düzenli ifade (boş = kontrol yok)", default="") or None
+        json_path = get_input(" JSON gövdede bulunması gereken alan (örn: data.status; boş = kontrol yok)", default="") or None
+        json_value = None
+        if json_path:
+            json_value = get_input(" Alanın beklenen değeri (örn: ok, true, 0; boş = yalnızca varlık)", default="") or None
+        min_size_input = get_input(" En küçük gövde boyutu (bayt, boş = sınır yok)", default="")
+        max_size_input = get_input(" En büyük gövde boyutu (bayt, boş = sınır yok)", default="")
+        response_checks = ResponseCheckConfig(
+            sample_rate=sample_percent / 100, expected_statuses=expected_statuses, headers=check_headers or None,
+            body_contains=body_contains, body_regex=body_regex, json_path=json_path, json_value=json_value,
+            min_size=int(min_size_input) if min_size_input.isdigit() else None,
+            max_size=int(max_size_input) if max_size_input.isdigit() else None,
+        )
+
+
+    # 11. Baseline (Önceki Testlerle Karşılaştırma)
+    baseline: Optional[BaselineConfig] = None
+    if not capacity_search:
+        print("\n--- Baseline Ayarları (Regresyon Tespiti) ---")
+        print("Test sonucunu bir baseline dosyasına kaydedebilir veya önceki bir baseline ile karşılaştırabilirsiniz.")
+        compare_path: Optional[str] = None
+        max_regression_percent = BaselineConfig().max_regression_percent
+        max_failure_rate_increase = BaselineConfig().max_failure_rate_increase
+        if get_yes_no_input("Sonuçları önceki bir baseline dosyası ile karşılaştırmak ister misiniz?", default_yes=False):
+            while True:
+                compare_input = get_input(" Baseline dosyasının yolu")
+                normalized_path = os.path.abspath(compare_input) if compare_input else ""
+                if normalized_path and os.path.isfile(normalized_path):
+                    compare_path = normalized_path
+                    break
+                print(f" Hata: Baseline dosyası bulunamadı: {normalized_path or '(boş)'}")
+            max_regression_percent = get_positive_float_input(" İzin verilen en yüksek regresyon (%)", default=max_regression_percent)
+            max_failure_rate_increase = get_positive_float_input(" Başarısızlık oranında izin verilen en yüksek artış (yüzde puanı)",
+                                                                 default=max_failure_rate_increase)
+        save_path: Optional[str] = None
+        if get_yes_no_input("Bu testin sonucunu baseline olarak kaydetmek ister misiniz?", default_yes=False):
+            default_baseline_name = f"baseline_{datetime.now():%Y%m%d_%H%M%S}.json"
+            save_path = get_input(" Baseline dosyasının adı", default=default_baseline_name)
+        if compare_path or save_path:
+            baseline = BaselineConfig(save_path=save_path, compare_path=compare_path, max_regression_percent=max_regression_percent,
+                                      max_failure_rate_increase=max_failure_rate_increase)
 
     # --- Log Dosyasını Ayarla (Eğer istendiyse) ---
     global file_handler
@@ -978,13 +3621,24 @@ async def main():
             total_requests=total_requests,
             timeout_seconds=timeout_seconds,
             verify_ssl=verify_ssl_choice, # SSL tercihini ekle
+            tls=tls_config,
+            response_checks=response_checks,
+            routing=routing,
             user_agent_preference=user_agent_preference,
             custom_headers=custom_headers,
             request_data=request_data,
             is_json_data=is_json_data,
             log_filename=log_filename,
             target_rps=target_rps,
-            assertions=assertions
+            assertions=assertions,
+            capacity_search=capacity_search,
+            baseline=baseline,
+            co_correction=co_correction,
+            transport=transport_config,
+            endpoint_stats=endpoint_stats,
+            gc_tuning=gc_tuning_config,
+            warmup=warmup,
+            drain_timeout=drain_timeout
         )
     except Exception as config_err:
          log.exception(f"Test yapılandırması oluşturulurken hata oluştu: {config_err}")
@@ -997,10 +3651,12 @@ async def main():
         print(" Test Ayarları Tamamlandı. Test Başlatılıyor...")
         print("="*40)
         runner = TestRunner(config)
-        await runner.run()
+        summary = await runner.run()
         print("\n" + "="*40)
         print(" Test Tamamlandı.")
         print("="*40)
+        # Assertion veya baseline regresyon kontrolü başarısızsa çağırana (örn. CI) bildir
+        return summary.get('assertions_passed', True)
 
     except ValueError as ve: # TestRunner __init__
         log.error(f"Test başlatılamadı (Yapılandırma Hatası): {ve}")
@@ -1016,8 +3672,14 @@ async def main():
 
 # --- Script Başlangıç Noktası ---
 if __name__ == "__main__":
+    exit_code = 0
     try:
-        asyncio.run(main())
+        # uvloop event loop oluşturulmadan önce kurulmalıdır
+        if uvloop is not None and get_yes_no_input("uvloop bulundu. Daha hızlı event loop olarak uvloop kullanılsın mı?", default_yes=False):
+            uvloop.install()
+            log.info("Event loop: uvloop")
+        if asyncio.run(main()) is False:
+            exit_code = 1 # Assertion/regresyon kontrolü başarısız
     except KeyboardInterrupt:
         log.info("\nKullanıcı tarafından iptal edildi (Ctrl+C algılandı). Program sonlandırılıyor.")
         print("\nTest kullanıcı tarafından iptal edildi.")
@@ -1042,3 +3704,4 @@ if __name__ == "__main__":
                     print(f"Program sonlanırken log dosyası kapatılırken bir hata oluştu: {close_err}", file=sys.stderr)
 
         print("\nHTTP Yük Testi Aracı sonlandırıldı.")
+    sys.exit(exit_code)
@@ -0,0 +1,240 @@
+"""
+Yük üreticisinin (TestRunner) kendi performansını ölçen benchmark paketi.
+
+Yerel hedef sunucuyu (stub_server.py) ayrı bir süreçte başlatır; böylece ölçülen CPU ve
+bellek yalnızca üreticiye aittir. Her senaryo da kendi taze sürecinde çalışır: önceki
+senaryoların ayırıp işletim sistemine geri vermediği bellek RSS ölçümünü etkilemez. RSS
+artışı, izleyicinin (GeneratorMonitor) tepe RSS değeri ile o süreçte test başlamadan önce
+alınan değer arasındaki farktır. Senaryolar:
+
+    max_rps_<motor>  Gecikmesiz sunucuya limitsiz yük: üreticinin ulaşabildiği en yüksek RPS,
+                     istek başına CPU süresi ve milyon istek başına RSS artışı.
+    overhead         Sabit 10 ms gecikmeli sunucuya düşük yük: ölçülen p50/p99 ile sunucu
+                     gecikmesi arasındaki fark (araç + yerel ağ ek yükü).
+    overhead_uds     Aynı ölçüm, sunucu Unix domain socket üzerinde: TCP yığınının ek yüke katkısı.
+    virtual_users_N  N sanal kullanıcı (varsayılan 10k ve 100k) ile sabit toplam RPS: kullanıcıların
+                     çoğu rate limit beklemesindedir. İlk istekler N / RPS saniyeye yayıldığından
+                     senaryo süresi bu kadar uzatılır ve tüm kullanıcıların başladığı doğrulanır;
+                     zamanlayıcının boştaki kullanıcı başına tuttuğu bellek, istek başına CPU ve
+                     durdurma süresi ölçülür.
+
+Sonuçlar sürüm bilgisiyle birlikte JSON olarak kaydedilir ve önceki bir sonuçla karşılaştırılabilir:
+
+    python benchmarks/self_benchmark.py [--duration 5] [--concurrency 64] [--compare eski.json]
+"""
+import argparse
+import asyncio
+import contextlib
+import gc
+import io
+import json
+import logging
+import math
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+import app  # noqa: E402
+from stub_server import StubServerConfig, serve_forever  # noqa: E402
+
+RESULTS_DIR = os.path.join(BENCHMARK_DIR, "results")
+OVERHEAD_SERVER_LATENCY = 0.010 # overhead senaryosunda sunucunun her yanıtta beklediği süre (saniye)
+VIRTUAL_USERS_RPS = 2000.0      # virtual_users senaryolarında uygulanan toplam hedef RPS
+
+
+def version_info() -> Dict[str, str]:
+    """Sonuçların hangi kod sürümüne ait olduğunu belirleyen bilgiler."""
+    try:
+        revision = subprocess.run(
+            ["git", "describe", "--always", "--dirty"], cwd=BENCHMARK_DIR,
+            capture_output=True, text=True, timeout=5,
+        ).stdout.strip() or "bilinmiyor"
+    except (OSError, subprocess.SubprocessError):
+        revision = "bilinmiyor"
+    return {
+        "revision": revision,
+        "python": platform.python_version(),
+        "aiohttp": aiohttp.__version__,
+        "platform": platform.platform(),
+    }
+
+
+@contextlib.contextmanager
+def stub_server_process(stub_config: StubServerConfig, unix_path: Optional[str] = None):
+    """Yerel hedef sunucuyu ayrı bir süreçte başlatır ve URL'sini döndürür."""
+    context = multiprocessing.get_context("spawn")
+    ready = context.Queue()
+    process = context.Process(target=serve_forever, args=(stub_config, "127.0.0.1", 0, unix_path, ready), daemon=True)
+    process.start()
+    try:
+        yield ready.get(timeout=30)
+    finally:
+        process.terminate()
+        process.join(timeout=5)
+
+
+async def run_scenario(url: str, concurrency: int, duration: int, target_rps: float = 0.0,
+                       transport: app.TransportConfig = app.TransportConfig(),
+                       routing: Optional[app.TargetRoutingConfig] = None) -> Dict[str, Any]:
+    """TestRunner'ı bir kez çalıştırır; RPS, gecikme, CPU ve RSS ölçümlerini döndürür (taze süreçte çağrılmalıdır)."""
+    config = app.TestConfig(
+        target_url=url, url_file=None, http_method="GET", concurrency=concurrency,
+        duration=duration, total_requests=None, timeout_seconds=10.0, user_agent_preference="",
+        custom_headers={}, request_data=None, is_json_data=False, log_filename=None,
+        target_rps=target_rps, verify_ssl=True, assertions={}, transport=transport, routing=routing,
+    )
+    gc.collect()
+    rss_before = app.current_rss_bytes()
+    cpu_before = time.process_time()
+    runner = app.TestRunner(config)
+    with contextlib.redirect_stdout(io.StringIO()): # Test özetini bastırma
+        summary = await runner.run()
+    cpu_used = time.process_time() - cpu_before
+    rss_peak = summary["generator"]["rss_peak_bytes"]
+    rss_growth = rss_peak - rss_before if rss_peak is not None and rss_before is not None else 0
+    sent = summary["total_requests_sent"]
+    return {
+        "requests": sent,
+        "failed": summary["failed_requests"],
+        "rps": summary["requests_per_second"],
+        "p50": summary["p50_response_time"],
+        "p99": summary["p99_response_time"],
+        "cpu_us_per_request": cpu_used / sent * 1e6 if sent else 0.0,
+        "cpu_utilization": cpu_used / summary["actual_test_duration"] if summary["actual_test_duration"] else 0.0,
+        "rss_growth_mb_per_million": rss_growth / sent * 1e6 / 2**20 if sent else 0.0,
+        "rss_growth_bytes": rss_growth,
+        "peak_active_users": summary["scheduler"]["peak_active"],
+        "started_users": summary["scheduler"]["started_users"],
+        "idle_users_at_stop": summary["scheduler"]["idle_users_at_stop"],
+        "scheduler_heap_bytes": summary["scheduler"]["heap_bytes_at_stop"],
+        "stop_ms": summary["scheduler"]["stop_seconds"] * 1000,
+    }
+
+
+def _scenario_process(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    app.log.setLevel(logging.WARNING)
+    return asyncio.run(run_scenario(**kwargs))
+
+
+def run_isolated(url: str, concurrency: int, duration: int, **kwargs) -> Dict[str, Any]:
+    """Senaryoyu yeni başlatılan (spawn) bir süreçte çalıştırır; böylece RSS ölçümü önceki senaryolardan etkilenmez."""
+    kwargs.update(url=url, concurrency=concurrency, duration=duration)
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(_scenario_process, kwargs).result()
+
+
+def run_suite(duration: int, concurrency: int, virtual_users: List[int]) -> Dict[str, Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {}
+    with stub_server_process(StubServerConfig(latency="none")) as url:
+        for engine in ("aiohttp", "raw"):
+            print(f"-> max_rps_{engine} çalışıyor ({duration}s)...")
+            results[f"max_rps_{engine}"] = run_isolated(url, concurrency, duration, transport=app.TransportConfig(engine=engine))
+        for users in virtual_users:
+            # İlk istekler bir pacing aralığına (users / RPS saniye) yayılır; ölçüm tüm kullanıcılar başladıktan sonra da sürsün
+            users_duration = duration + math.ceil(users / VIRTUAL_USERS_RPS)
+            print(f"-> virtual_users_{users} çalışıyor ({users_duration}s)...")
+            scenario = run_isolated(url, users, users_duration, target_rps=VIRTUAL_USERS_RPS)
+            if scenario["started_users"] < users:
+                raise RuntimeError(f"virtual_users_{users}: yalnızca {scenario['started_users']} kullanıcı başladı; "
+                                   f"senaryo zamanlayıcının tüm kullanıcıları tuttuğunu göstermiyor.")
+            idle = scenario["idle_users_at_stop"]
+            scenario["scheduler_bytes_per_idle_user"] = scenario["scheduler_heap_bytes"] / idle if idle else 0.0
+            scenario["scheduler_kb_per_1k_users"] = scenario["scheduler_heap_bytes"] / users * 1000 / 1024
+            results[f"virtual_users_{users}"] = scenario
+
+    with stub_server_process(StubServerConfig(latency=f"fixed:{OVERHEAD_SERVER_LATENCY}")) as url:
+        print(f"-> overhead çalışıyor ({duration}s)...")
+        overhead = run_isolated(url, 20, duration, target_rps=200.0)
+        overhead["p50_overhead_us"] = (overhead["p50"] - OVERHEAD_SERVER_LATENCY) * 1e6
+        overhead["p99_overhead_us"] = (overhead["p99"] - OVERHEAD_SERVER_LATENCY) * 1e6
+        results["overhead"] = overhead
+
+    with tempfile.TemporaryDirectory() as socket_dir:
+        socket_path = os.path.join(socket_dir, "stub.sock")
+        with stub_server_process(StubServerConfig(latency=f"fixed:{OVERHEAD_SERVER_LATENCY}"), socket_path) as url:
+            print(f"-> overhead_uds çalışıyor ({duration}s)...")
+            overhead = run_isolated(url, 20, duration, target_rps=200.0, routing=app.TargetRoutingConfig(unix_socket=socket_path))
+            overhead["p50_overhead_us"] = (overhead["p50"] - OVERHEAD_SERVER_LATENCY) * 1e6
+            overhead["p99_overhead_us"] = (overhead["p99"] - OVERHEAD_SERVER_LATENCY) * 1e6
+            results["overhead_uds"] = overhead
+    return results
+
+
+# Karşılaştırmada gösterilen metrikler: (anahtar, etiket, yüksek değer daha mı iyi?)
+REPORT_METRICS = [
+    ("rps", "RPS", True),
+    ("cpu_us_per_request", "CPU µs/istek", False),
+    ("rss_growth_mb_per_million", "RSS MB/milyon istek", False),
+    ("scheduler_kb_per_1k_users", "Heap KB/1000 kullanıcı", False),
+    ("scheduler_bytes_per_idle_user", "Bayt/boştaki kullanıcı", False),
+    ("stop_ms", "Durdurma (ms)", False),
+    ("p50_overhead_us", "p50 ek yük (µs)", False),
+    ("p99_overhead_us", "p99 ek yük (µs)", False),
+]
+
+
+def print_results(results: Dict[str, Dict[str, Any]], previous: Optional[Dict[str, Dict[str, Any]]] = None):
+    print(f"\n{'Senaryo':<18} {'Metrik':<22} {'Değer':>12} {'Önceki':>12} {'Fark':>9}")
+    for scenario, metrics in results.items():
+        for key, label, higher_is_better in REPORT_METRICS:
+            if key not in metrics:
+                continue
+            value = metrics[key]
+            line = f"{scenario:<18} {label:<22} {value:>12.2f}"
+            old = (previous or {}).get(scenario, {}).get(key)
+            if old is not None:
+                change = (value - old) / abs(old) * 100 if old else 0.0
+                worse = change < 0 if higher_is_better else change > 0
+                line += f" {old:>12.2f} {change:>+8.1f}%{' !' if worse and abs(change) > 5 else ''}"
+            print(line)
+    if previous:
+        print("('!' işareti %5'ten fazla kötüleşmeyi gösterir)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yük üreticisi self-benchmark paketi")
+    parser.add_argument("--duration", type=int, default=5, help="Her senaryonun süresi (saniye)")
+    parser.add_argument("--concurrency", type=int, default=64, help="max_rps senaryolarında worker sayısı")
+    parser.add_argument("--virtual-users", default="10000,100000", help="virtual_users senaryolarındaki kullanıcı sayıları (virgülle ayrılmış, boş = atla)")
+    parser.add_argument("--output", default=None, help="Sonuç dosyası (varsayılan: benchmarks/results/self_benchmark_<zaman>.json)")
+    parser.add_argument("--compare", default=None, help="Karşılaştırılacak önceki sonuç dosyası")
+    args = parser.parse_args()
+
+    app.log.setLevel(logging.WARNING)
+    previous = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            previous_data = json.load(f)
+        previous = previous_data["results"]
+        print(f"Karşılaştırma: {args.compare} (sürüm {previous_data['version']['revision']})")
+
+    virtual_users = [int(n) for n in args.virtual_users.split(",") if n.strip()]
+    results = run_suite(args.duration, args.concurrency, virtual_users)
+    data = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "version": version_info(),
+        "params": {"duration": args.duration, "concurrency": args.concurrency, "virtual_users": virtual_users},
+        "results": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"self_benchmark_{datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+    print_results(results, previous)
+    print(f"\nSonuçlar kaydedildi: {output} (sürüm {data['version']['revision']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Yük testi aracını yerel olarak denemek ve benchmark etmek için yapılandırılabilir hedef sunucu.
+
+Gecikme dağılımı, yanıt boyutu, hata oranı ve bağlantı kapatma davranışı ayarlanabilir.
+Hem kod içinden (StubServer) hem de komut satırından kullanılabilir:
+
+    python benchmarks/stub_server.py --port 8080 --latency exp:0.005 --payload 512 --error-rate 0.01
+
+TLS el sıkışmalarını ölçmek için --cert/--key ile HTTPS olarak dinleyebilir (örn. openssl ile üretilmiş
+kendinden imzalı sertifika; istemcide CA dosyası olarak aynı sertifika verilir).
+
+Gecikme dağılımı biçimleri (saniye):
+    none                   Bekleme yok
+    fixed:S                Her yanıt S saniye bekler
+    uniform:MIN,MAX        MIN ile MAX arasında düzgün dağılım
+    exp:MEAN               Ortalaması MEAN olan üstel dağılım
+    lognormal:MEDIAN,SIGMA Medyanı MEDIAN olan log-normal dağılım (uzun kuyruk)
+"""
+import argparse
+import asyncio
+import math
+import random
+import ssl
+from typing import Callable, NamedTuple, Optional
+
+from aiohttp import web
+
+
+def parse_latency(spec: str) -> Callable[[], float]:
+    """Gecikme dağılımı tanımını, her çağrıda bir bekleme süresi (saniye) üreten fonksiyona çevirir."""
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",")] if args else []
+    try:
+        if kind == "none":
+            return lambda: 0.0
+        if kind == "fixed":
+            return lambda: values[0]
+        if kind == "uniform":
+            low, high = values
+            return lambda: random.uniform(low, high)
+        if kind == "exp":
+            rate = 1.0 / values[0]
+            return lambda: random.expovariate(rate)
+        if kind == "lognormal":
+            mu, sigma = math.log(values[0]), values[1]
+            return lambda: random.lognormvariate(mu, sigma)
+    except (IndexError, ValueError, ZeroDivisionError):
+        pass
+    raise ValueError(f"Geçersiz gecikme dağılımı: '{spec}' (örn: none, fixed:0.01, uniform:0.001,0.02, exp:0.005, lognormal:0.005,0.8)")
+
+
+class StubServerConfig(NamedTuple):
+    """Yerel hedef sunucunun davranış ayarları."""
+    latency: str = "none"        # Gecikme dağılımı (parse_latency biçimi)
+    payload_size: int = 2        # Yanıt gövdesi boyutu (bayt)
+    error_rate: float = 0.0      # 500 döndürülecek isteklerin oranı (0-1)
+    close_rate: float = 0.0      # Yanıttan sonra bağlantının kapatılacağı isteklerin oranı (0-1, 1 = keep-alive yok)
+
+
+class StubServer:
+    """Yapılandırılabilir yerel aiohttp hedef sunucusu (TCP portu veya Unix domain socket)."""
+
+    def __init__(self, config: StubServerConfig = StubServerConfig(), host: str = "127.0.0.1", port: int = 0,
+                 unix_path: Optional[str] = None, ssl_context: Optional[ssl.SSLContext] = None):
+        self.config = config
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.ssl_context = ssl_context
+        self.requests_served = 0
+        self._latency = parse_latency(config.latency)
+        self._payload = b"x" * config.payload_size
+        self._runner: Optional[web.AppRunner] = None
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        self.requests_served += 1
+        delay = self._latency()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.config.error_rate and random.random() < self.config.error_rate:
+            response = web.Response(status=500, body=b"stub error")
+        else:
+            response = web.Response(body=self._payload)
+        if self.config.close_rate and random.random() < self.config.close_rate:
+            response.force_close()
+        return response
+
+    @property
+    def url(self) -> str:
+        """Sunucunun temel URL'si (Unix socket modunda Host başlığı için 'localhost' kullanılır)."""
+        scheme = "https" if self.ssl_context else "http"
+        return f"{scheme}://localhost/" if self.unix_path else f"{scheme}://{self.host}:{self.port}/"
+
+    async def start(self) -> "StubServer":
+        application = web.Application()
+        application.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(application, access_log=None)
+        await self._runner.setup()
+        if self.unix_path:
+            site = web.UnixSite(self._runner, self.unix_path, ssl_context=self.ssl_context)
+        else:
+            site = web.TCPSite(self._runner, self.host, self.port, ssl_context=self.ssl_context)
+        await site.start()
+        if not self.unix_path and self.port == 0:
+            self.port = site._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "StubServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+
+def server_ssl_context(certfile: str, keyfile: Optional[str] = None) -> ssl.SSLContext:
+    """Sertifika (ve anahtar) dosyasından sunucu tarafı SSLContext oluşturur."""
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(certfile, keyfile)
+    return context
+
+
+def serve_forever(config: StubServerConfig, host: str, port: int, unix_path: Optional[str] = None, ready=None,
+                  certfile: Optional[str] = None, keyfile: Optional[str] = None):
+    """Sunucuyu ayrı bir süreçte çalıştırmak için giriş noktası; hazır olunca adresini 'ready' kuyruğuna yazar."""
+    async def run():
+        ssl_context = server_ssl_context(certfile, keyfile) if certfile else None
+        async with StubServer(config, host, port, unix_path, ssl_context) as server:
+            if ready is not None:
+                ready.put(server.url)
+            await asyncio.Event().wait()
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Yük testi için yerel hedef sunucu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--unix", default=None, help="TCP yerine bu Unix domain socket yolunu dinle")
+    parser.add_argument("--latency", default="none", help="Gecikme dağılımı (örn: fixed:0.01, exp:0.005)")
+    parser.add_argument("--payload", type=int, default=2, help="Yanıt gövdesi boyutu (bayt)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 döndürme oranı (0-1)")
+    parser.add_argument("--close-rate", type=float, default=0.0, help="Bağlantı kapatma oranı (0-1)")
+    parser.add_argument("--cert", default=None, help="HTTPS için sunucu sertifikası (PEM)")
+    parser.add_argument("--key", default=None, help="Sertifikanın özel anahtarı (boşsa sertifika dosyasında)")
+    args = parser.parse_args()
+    stub_config = StubServerConfig(args.latency, args.payload, args.error_rate, args.close_rate)
+    parse_latency(stub_config.latency) # Geçersiz tanımda hemen hata ver
+    scheme = "https" if args.cert else "http"
+    print(f"Yerel hedef sunucu: {args.unix or f'{scheme}://{args.host}:{args.port}/'} ({stub_config})")
+    serve_forever(stub_config, args.host, args.port, args.unix, certfile=args.cert, keyfile=args.key)
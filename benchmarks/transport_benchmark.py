@@ -0,0 +1,75 @@
+"""
+İstemci motorlarının (aiohttp / ham soket / ham soket + pipelining) karşılaştırmalı benchmark'ı.
+
+Aynı süreçte yerel hedef sunucuyu (stub_server.py) başlatır, her motorla aynı yükü (limitsiz RPS, basit GET)
+uygular ve elde edilen RPS ile istek başına CPU süresini tablo halinde yazdırır.
+
+Kullanım:
+    python benchmarks/transport_benchmark.py [--duration 5] [--concurrency 64] [--uvloop]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import app  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+# Karşılaştırılacak motorlar: (etiket, TransportConfig)
+ENGINES = [
+    ("aiohttp", app.TransportConfig(engine="aiohttp")),
+    ("raw", app.TransportConfig(engine="raw")),
+    ("raw+pipeline(8)", app.TransportConfig(engine="raw", raw_pipeline_depth=8)),
+]
+
+
+async def _run_engine(url: str, transport: app.TransportConfig, duration: int, concurrency: int) -> dict:
+    config = app.TestConfig(
+        target_url=url, url_file=None, http_method="GET", concurrency=concurrency,
+        duration=duration, total_requests=None, timeout_seconds=10.0, user_agent_preference="",
+        custom_headers={}, request_data=None, is_json_data=False, log_filename=None,
+        target_rps=0.0, verify_ssl=True, assertions={}, transport=transport,
+    )
+    cpu_start = time.process_time()
+    with contextlib.redirect_stdout(io.StringIO()): # Test özetini bastırma
+        summary = await app.TestRunner(config).run()
+    cpu_used = time.process_time() - cpu_start
+    sent = summary["total_requests_sent"]
+    return {
+        "rps": summary["requests_per_second"],
+        "sent": sent,
+        "failed": summary["failed_requests"],
+        "p99": summary["p99_response_time"],
+        "cpu_us_per_request": cpu_used / sent * 1e6 if sent else 0.0,
+    }
+
+
+async def main(duration: int, concurrency: int):
+    app.log.setLevel(logging.WARNING)
+    async with StubServer() as server:
+        url = server.url
+        print(f"Hedef: {url} | Süre: {duration}s | Eşzamanlılık: {concurrency} | Loop: {type(asyncio.get_running_loop()).__module__}")
+        print("Not: Sunucu aynı süreçte çalışır; CPU süresi sunucu ve istemcinin toplamıdır.")
+        print(f"{'Motor':<18} {'RPS':>10} {'İstek':>9} {'Hatalı':>7} {'p99 (s)':>9} {'CPU µs/istek':>13}")
+        for label, transport in ENGINES:
+            result = await _run_engine(url, transport, duration, concurrency)
+            print(f"{label:<18} {result['rps']:>10.1f} {result['sent']:>9} {result['failed']:>7} "
+                  f"{result['p99']:>9.4f} {result['cpu_us_per_request']:>13.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="İstemci motorları benchmark'ı")
+    parser.add_argument("--duration", type=int, default=5, help="Her motor için test süresi (saniye)")
+    parser.add_argument("--concurrency", type=int, default=64, help="Eşzamanlı worker sayısı")
+    parser.add_argument("--uvloop", action="store_true", help="uvloop event loop'unu kullan (kuruluysa)")
+    args = parser.parse_args()
+    if args.uvloop:
+        if app.uvloop is None:
+            sys.exit("uvloop kurulu değil (pip install uvloop).")
+        app.uvloop.install()
+    asyncio.run(main(args.duration, args.concurrency))
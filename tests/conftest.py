@@ -0,0 +1,51 @@
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# app.py tek dosyalık bir betik, stub sunucu ise benchmarks/ altında; ikisi de paket değil
+for path in (ROOT, os.path.join(ROOT, "benchmarks")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import app  # noqa: E402
+from stub_server import StubServer, StubServerConfig  # noqa: E402
+
+
+def make_config(**overrides) -> app.TestConfig:
+    """Testler için kısa süreli, limitsiz bir TestConfig oluşturur."""
+    values = dict(
+        target_url="http://localhost/", url_file=None, http_method="GET", concurrency=4, duration=1,
+        total_requests=None, timeout_seconds=5.0, user_agent_preference="", custom_headers={},
+        request_data=None, is_json_data=False, log_filename=None, target_rps=0.0, verify_ssl=True, assertions={},
+    )
+    values.update(overrides)
+    return app.TestConfig(**values)
+
+
+@pytest.fixture
+def socket_path():
+    """Kısa bir Unix domain socket yolu (pytest'in tmp_path'i AF_UNIX yol sınırını aşabilir)."""
+    directory = tempfile.mkdtemp(prefix="lt-")
+    yield os.path.join(directory, "stub.sock")
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def run_against_stub(socket_path):
+    """
+    Stub sunucuyu Unix socket üzerinde başlatıp TestRunner'ı ona karşı çalıştıran fonksiyon döndürür;
+    fonksiyon (özet, sunucu) çiftini döndürür. Ağ ve DNS gerekmez.
+    """
+    def run(stub_config: StubServerConfig = StubServerConfig(), **overrides):
+        async def scenario():
+            async with StubServer(stub_config, unix_path=socket_path) as server:
+                overrides.setdefault("target_url", server.url)
+                config = make_config(routing=app.TargetRoutingConfig(unix_socket=socket_path), **overrides)
+                return await app.TestRunner(config).run(), server
+        return asyncio.run(scenario())
+    return run
@@ -0,0 +1,79 @@
+"""TestRunner'ın stub sunucuya karşı uçtan uca çalıştırılması (Unix domain socket veya sabitlenmiş host)."""
+import asyncio
+import importlib.util
+
+import pytest
+
+import app
+from conftest import make_config
+from stub_server import StubServer, StubServerConfig
+
+ENGINES = ["aiohttp", "raw", pytest.param("http2", marks=pytest.mark.skipif(
+    importlib.util.find_spec("httpx") is None or importlib.util.find_spec("h2") is None, reason="httpx[http2] kurulu değil"))]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engines_over_unix_socket(run_against_stub, engine):
+    summary, server = run_against_stub(StubServerConfig(payload_size=256), transport=app.TransportConfig(engine=engine))
+    assert summary["transport"]["engine"] == engine
+    assert summary["total_requests_sent"] > 0
+    assert summary["failed_requests"] == 0
+    assert summary["status_code_distribution"] == {200: summary["total_requests_sent"]}
+    assert server.requests_served >= summary["total_requests_sent"]
+
+
+def test_raw_pipelining_with_server_closes_over_unix_socket(run_against_stub):
+    summary, _ = run_against_stub(StubServerConfig(close_rate=0.1),
+                                  transport=app.TransportConfig(engine="raw", raw_pipeline_depth=4))
+    assert summary["failed_requests"] == 0
+    assert summary["transport"]["connections_opened"] > 1
+
+
+def test_stub_errors_are_counted(run_against_stub):
+    summary, _ = run_against_stub(StubServerConfig(error_rate=0.5), target_rps=200)
+    assert 0 < summary["failed_requests"] < summary["total_requests_sent"]
+    assert set(summary["status_code_distribution"]) == {200, 500}
+
+
+def test_response_validation_over_unix_socket(run_against_stub):
+    summary, _ = run_against_stub(StubServerConfig(payload_size=64), target_rps=100, response_checks=app.ResponseCheckConfig(
+        expected_statuses=(200,), min_size=64, json_path="data.status"))
+    validation = summary["response_validation"]
+    assert validation["checked"] == summary["total_requests_sent"] > 0
+    assert validation["failures"] == {"json_path": validation["checked"]} # Stub gövdesi JSON değil
+    assert summary["error_distribution"] == {"VALIDATION_FAILED": validation["checked"]}
+    assert summary["status_code_distribution"] == {200: validation["checked"]} # Durum kodu yine sayılır
+
+
+def test_co_correction_over_unix_socket(run_against_stub):
+    # 4 kullanıcı x 20 RPS = kullanıcı başına 0.2 s aralık; 0.5 s'lik yanıtlar gönderilemeyen istekleri gizler
+    summary, _ = run_against_stub(StubServerConfig(latency="fixed:0.5"), duration=2, target_rps=20, co_correction=True)
+    assert summary["co_expected_interval"] == pytest.approx(0.2)
+    assert summary["co_uncorrected_count"] == summary["total_requests_sent"] > 0
+    assert summary["co_corrected_count"] > summary["co_uncorrected_count"]
+    assert summary["co_corrected_percentiles"][50] < summary["co_uncorrected_percentiles"][50]
+
+
+def test_endpoint_stats_from_url_file(run_against_stub, tmp_path):
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text("".join(f"http://localhost/users/{n}\n" for n in range(1, 6)) + "http://localhost/health\n")
+    summary, _ = run_against_stub(target_url=None, url_file=str(url_file), target_rps=120,
+                                  endpoint_stats=app.EndpointStatsConfig(grouping="path"))
+    groups = {entry["group"]: entry for entry in summary["endpoints"]}
+    assert set(groups) == {"localhost/users/{id}", "localhost/health"}
+    assert sum(entry["requests_sent"] for entry in groups.values()) == summary["total_requests_sent"]
+    assert summary["endpoint_folded_groups"] == 0
+
+
+@pytest.mark.parametrize("engine", ["aiohttp", "raw"])
+def test_host_pinning_to_tcp_stub(engine):
+    async def scenario():
+        async with StubServer(StubServerConfig()) as server:
+            config = make_config(
+                target_url=f"http://api.example.test:{server.port}/", target_rps=50,
+                transport=app.TransportConfig(engine=engine),
+                routing=app.TargetRoutingConfig(host_overrides={"api.example.test": "127.0.0.1"}))
+            return await app.TestRunner(config).run(), server.requests_served
+    summary, served = asyncio.run(scenario())
+    assert summary["failed_requests"] == 0
+    assert served >= summary["total_requests_sent"] > 0
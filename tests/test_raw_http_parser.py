@@ -0,0 +1,174 @@
+"""Ham soket motorunun artımlı HTTP/1.1 yanıt ayrıştırıcısı (_RawHttpConnection) için testler."""
+import asyncio
+
+import pytest
+
+import app
+from stub_server import StubServer, StubServerConfig
+
+
+class FakeTransport:
+    """Yazılan baytları saklayan, kapatıldığını işaretleyen sahte asyncio.Transport."""
+
+    def __init__(self):
+        self.written = []
+        self.closed = False
+
+    def write(self, data):
+        self.written.append(data)
+
+    def close(self):
+        self.closed = True
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def make_connection():
+    connection = app._RawHttpConnection(("http", "example.com", 80))
+    connection.connection_made(FakeTransport())
+    return connection
+
+
+def feed(connection, data, step=None):
+    """Veriyi tek seferde veya 'step' baytlık parçalar halinde teslim eder."""
+    step = step or len(data)
+    for position in range(0, len(data), step):
+        connection.data_received(data[position:position + step])
+
+
+def test_content_length_body_split_byte_by_byte():
+    async def scenario():
+        connection = make_connection()
+        future = connection.send(b"GET / HTTP/1.1\r\n\r\n", False, capture=True)
+        feed(connection, b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\nX-Test: a\r\n\r\nhello", step=1)
+        response = await future
+        assert (response.status, response.body, response.headers["x-test"]) == (200, b"hello", "a")
+        assert connection.pending == 0 and not connection.closed
+    run(scenario())
+
+
+def test_chunked_body_with_extensions_and_trailers():
+    async def scenario():
+        connection = make_connection()
+        future = connection.send(b"GET / HTTP/1.1\r\n\r\n", False, capture=True)
+        data = (b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+                b"5;ext=1\r\nhello\r\n6\r\n world\r\n0\r\nX-Trailer: t\r\n\r\n")
+        feed(connection, data, step=3)
+        response = await future
+        assert (response.status, response.body) == (200, b"hello world")
+    run(scenario())
+
+
+def test_pipelined_responses_in_one_read():
+    async def scenario():
+        connection = make_connection()
+        futures = [connection.send(b"GET / HTTP/1.1\r\n\r\n", is_head) for is_head in (False, True, False)]
+        feed(connection, b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"
+                         b"HTTP/1.1 404 Not Found\r\nContent-Length: 9\r\n\r\n"  # HEAD: gövde yok
+                         b"HTTP/1.1 204 No Content\r\n\r\n")
+        assert await asyncio.gather(*futures) == [200, 404, 204]
+    run(scenario())
+
+
+@pytest.mark.parametrize("interim", [b"HTTP/1.1 100 Continue\r\n\r\n",
+                                     b"HTTP/1.1 103 Early Hints\r\nLink: </a.css>; rel=preload\r\n\r\n"])
+def test_interim_1xx_responses_are_skipped(interim):
+    async def scenario():
+        connection = make_connection()
+        future = connection.send(b"GET / HTTP/1.1\r\n\r\n", False)
+        feed(connection, interim)
+        assert not future.done()
+        feed(connection, b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+        assert await future == 200
+    run(scenario())
+
+
+def test_close_delimited_body_finishes_on_connection_lost():
+    async def scenario():
+        connection = make_connection()
+        future = connection.send(b"GET / HTTP/1.1\r\n\r\n", False, capture=True)
+        feed(connection, b"HTTP/1.0 200 OK\r\n\r\npart one, ")
+        feed(connection, b"part two")
+        assert not future.done() and not connection.keep_alive
+        connection.connection_lost(None)
+        response = await future
+        assert (response.status, response.body) == (200, b"part one, part two")
+    run(scenario())
+
+
+def test_requests_queued_behind_connection_close_are_unanswered():
+    async def scenario():
+        connection = make_connection()
+        futures = [connection.send(b"GET / HTTP/1.1\r\n\r\n", False) for _ in range(3)]
+        feed(connection, b"HTTP/1.1 200 OK\r\nConnection: close\r\nContent-Length: 2\r\n\r\nok")
+        assert await futures[0] == 200
+        assert connection.closed and connection.transport.closed
+        for future in futures[1:]:
+            with pytest.raises(app.UnansweredRequestError):
+                await future
+    run(scenario())
+
+
+def test_server_close_mid_response_is_a_reset_only_for_the_current_request():
+    async def scenario():
+        connection = make_connection()
+        futures = [connection.send(b"GET / HTTP/1.1\r\n\r\n", False) for _ in range(2)]
+        feed(connection, b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nabc")
+        connection.connection_lost(None)
+        first, second = await asyncio.gather(*futures, return_exceptions=True)
+        assert type(first) is ConnectionResetError
+        assert isinstance(second, app.UnansweredRequestError)
+        assert app.classify_exception(first) is app.ErrorCode.CONNECTION_RESET
+    run(scenario())
+
+
+@pytest.mark.parametrize("header, expected", [
+    (b"Content-Length: 2\r\nContent-Length: 2", 200),
+    (b"Content-Length: 2, 2", 200),
+    (b"Content-Length: 2\r\nContent-Length: 3", app.HttpProtocolError),
+    (b"Content-Length: 2, 3", app.HttpProtocolError),
+    (b"Content-Length: -1", app.HttpProtocolError),
+    (b"Content-Length: abc", app.HttpProtocolError),
+])
+def test_content_length_validation(header, expected):
+    async def scenario():
+        connection = make_connection()
+        future = connection.send(b"GET / HTTP/1.1\r\n\r\n", False)
+        feed(connection, b"HTTP/1.1 200 OK\r\n" + header + b"\r\n\r\nok")
+        if expected == 200:
+            assert await future == 200
+        else:
+            with pytest.raises(expected):
+                await future
+            assert connection.closed
+    run(scenario())
+
+
+def test_invalid_status_line_is_a_protocol_error():
+    async def scenario():
+        connection = make_connection()
+        future = connection.send(b"GET / HTTP/1.1\r\n\r\n", False)
+        feed(connection, b"garbage\r\n\r\n")
+        with pytest.raises(app.HttpProtocolError):
+            await future
+    run(scenario())
+
+
+def test_pipelined_requests_survive_server_closes(socket_path):
+    """Her yanıttan sonra bağlantıyı kapatan sunucuya karşı pipelining hatasız tamamlanır (UDS üzerinden)."""
+    async def scenario():
+        async with StubServer(StubServerConfig(latency="fixed:0.02", close_rate=1.0), unix_path=socket_path) as server:
+            transport = app.RawHttpTransport(None, pipeline_depth=4, unix_socket=socket_path)
+
+            async def request(index):
+                await asyncio.sleep(index * 0.002) # Yanıt beklenirken açık bağlantıya pipeline edilsin
+                return await transport.send("GET", server.url, {}, None, False, 5)
+            try:
+                results = await asyncio.gather(*[request(index) for index in range(40)])
+            finally:
+                await transport.close()
+            assert results == [200] * 40
+            assert transport.requests_resent > 0
+    run(scenario())
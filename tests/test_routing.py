@@ -0,0 +1,38 @@
+"""Hedef yönlendirme: adres ayrıştırma ve host -> adres sabitleme."""
+import pytest
+
+import app
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("example.com", ("example.com", None)),
+    ("Example.COM:8443", ("example.com", 8443)),
+    ("10.0.0.5", ("10.0.0.5", None)),
+    ("[::1]:8080", ("::1", 8080)),
+    ("[::1]", ("::1", None)),
+    ("::1", ("::1", None)),
+    (" api.test:80 ", ("api.test", 80)),
+])
+def test_parse_address(text, expected):
+    assert app.parse_address(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", ":80", "host:http", "host:0", "host:65536", "[::1]:x"])
+def test_parse_address_rejects_invalid(text):
+    with pytest.raises(ValueError):
+        app.parse_address(text)
+
+
+def test_address_pinning_prefers_port_specific_rule():
+    pinning = app.AddressPinning({"api.test": "10.0.0.1", "api.test:8443": "[::1]:9443", "Other.Test:80": "10.0.0.2:8080"})
+    assert pinning.resolve("API.test", 443) == ("10.0.0.1", 443) # Port belirtilmeyen kural URL'deki portu korur
+    assert pinning.resolve("api.test", 8443) == ("::1", 9443)
+    assert pinning.resolve("other.test", 80) == ("10.0.0.2", 8080)
+    assert pinning.resolve("other.test", 81) is None
+    assert pinning.resolve("unknown.test", 80) is None
+    assert pinning.describe() == "api.test -> 10.0.0.1, api.test:8443 -> [::1]:9443, other.test:80 -> 10.0.0.2:8080"
+
+
+def test_address_pinning_rejects_invalid_target():
+    with pytest.raises(ValueError):
+        app.AddressPinning({"api.test": "10.0.0.1:99999"})
@@ -0,0 +1,62 @@
+"""Sanal kullanıcı zamanlayıcısı: tüm kullanıcıların başlaması, boştaki kullanıcıların bellek ölçümü ve drenaj."""
+import asyncio
+
+import pytest
+
+import app
+
+
+def run_scheduler(users, pacing, send, run_for, grace=0.0):
+    async def scenario():
+        scheduler = app.VirtualUserScheduler(users, pacing, send, asyncio.Event())
+        scheduler.start()
+        await asyncio.sleep(run_for)
+        result = await scheduler.stop(grace)
+        return scheduler, result
+    return asyncio.run(scenario())
+
+
+def test_every_user_starts_and_waits_idle_in_heap():
+    sent = []
+
+    async def send():
+        sent.append(1)
+
+    scheduler, (drained, abandoned, idle) = run_scheduler(users=2000, pacing=0.2, send=send, run_for=0.5, grace=1.0)
+    assert scheduler.started_users == 2000
+    assert len(sent) >= 2000
+    assert abandoned == 0
+    report = scheduler.get_report()
+    assert report["idle_users_at_stop"] == idle > 0
+    assert report["heap_bytes_at_stop"] >= idle * app.VirtualUserScheduler.IDLE_ENTRY_BYTES
+    assert scheduler.peak_active < 2000 # Boştaki kullanıcılar görev tutmaz
+
+
+def test_users_not_yet_started_count_as_idle():
+    async def send():
+        pass
+
+    scheduler, (_, _, idle) = run_scheduler(users=100, pacing=10.0, send=send, run_for=0.05)
+    assert scheduler.started_users < 100
+    assert idle == 100 - scheduler.get_report()["drained_requests"] - scheduler.get_report()["abandoned_requests"]
+
+
+@pytest.mark.parametrize("latency, grace, expected", [(0.05, 1.0, (4, 0)), (5.0, 0.05, (0, 4))])
+def test_stop_drains_or_abandons_in_flight_requests(latency, grace, expected):
+    async def send():
+        await asyncio.sleep(latency)
+
+    scheduler, (drained, abandoned, _) = run_scheduler(users=4, pacing=0.0, send=send, run_for=0.02, grace=grace)
+    assert (drained, abandoned) == expected
+    assert scheduler.get_report()["drained_requests"] == drained
+
+
+def test_unexpected_error_backs_off_instead_of_spinning():
+    calls = []
+
+    async def send():
+        calls.append(1)
+        raise RuntimeError("boom")
+
+    run_scheduler(users=1, pacing=0.0, send=send, run_for=0.25)
+    assert 2 <= len(calls) <= 4 # ERROR_BACKOFF = 0.1 s
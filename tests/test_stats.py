@@ -0,0 +1,158 @@
+"""Gecikme histogramı, koordineli ihmal düzeltmesi, baseline karşılaştırması, uç nokta gruplama ve hata sınıflandırması."""
+import asyncio
+import errno
+import socket
+import ssl
+
+import pytest
+
+import app
+
+
+def histogram_of(values):
+    histogram = app.LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    return histogram
+
+
+def test_histogram_percentiles_within_relative_error():
+    values = [i / 10000 for i in range(1, 10001)] # 0.1 ms .. 1 s
+    histogram = histogram_of(values)
+    assert histogram.total_count == 10000
+    for pct in (50, 90, 99, 99.9):
+        exact = app._percentile(values, pct)
+        assert histogram.percentile(pct) == pytest.approx(exact, rel=0.035)
+    assert histogram.percentile(100) == pytest.approx(1.0)
+    assert app.LatencyHistogram().percentile(99) == 0.0
+
+
+def test_histogram_merge_and_round_trip():
+    first, second = histogram_of([0.001, 0.002]), histogram_of([0.5])
+    first.merge(second)
+    assert (first.total_count, first.max_value) == (3, 500000)
+    restored = app.LatencyHistogram.from_dict(first.to_dict())
+    assert restored.counts == first.counts and restored.max_value == first.max_value
+    with pytest.raises(ValueError):
+        app.LatencyHistogram.from_dict({**first.to_dict(), "sub_buckets": 16})
+
+
+def test_record_with_expected_interval_adds_missing_samples():
+    histogram = app.LatencyHistogram()
+    histogram.record_with_expected_interval(1.0, 0.1)
+    # 1.0 s'lik yanıt süresince gönderilemeyen 9 isteğin gecikmeleri: 0.9, 0.8, ..., 0.1
+    assert histogram.total_count == 10
+    assert histogram.percentile(0) == pytest.approx(0.1, rel=0.035)
+    fast = app.LatencyHistogram()
+    fast.record_with_expected_interval(0.05, 0.1)
+    assert fast.total_count == 1
+
+
+def test_co_correction_covers_failed_requests():
+    async def scenario():
+        stats = app.StatsCollector(expected_interval=0.1)
+        await stats.add_result(None, 0.45, app.ErrorCode.TIMEOUT)
+        await stats.add_result(500, 0.25, None)
+        await stats.add_result(200, 0.01, None)
+        return stats.calculate_summary()
+    summary = asyncio.run(scenario())
+    assert summary["co_uncorrected_count"] == 3
+    assert summary["co_corrected_count"] == 4 + 2 + 1 # Zaman aşımı ve 500 de düzeltilir
+    assert summary["co_uncorrected_max"] == pytest.approx(0.45)
+    assert summary["successful_requests"] == 1
+
+
+def test_validation_failure_keeps_status_code():
+    async def scenario():
+        stats = app.StatsCollector()
+        await stats.add_result(200, 0.01, app.ErrorCode.VALIDATION_FAILED, exception=app.ResponseValidationError("x"))
+        return stats.calculate_summary()
+    summary = asyncio.run(scenario())
+    assert summary["status_code_distribution"] == {200: 1}
+    assert summary["error_distribution"] == {"VALIDATION_FAILED": 1}
+    assert summary["successful_requests"] == 0
+
+
+def test_ks_two_sample():
+    same = histogram_of([i / 1000 for i in range(1, 501)])
+    assert app.ks_two_sample(same, same) == (0.0, 1.0)
+    slower = histogram_of([i / 1000 + 0.2 for i in range(1, 501)])
+    d_stat, p_value = app.ks_two_sample(same, slower)
+    assert d_stat > 0.3 and p_value < 0.001
+    assert app.ks_two_sample(same, app.LatencyHistogram()) == (0.0, 1.0)
+
+
+BASELINE_SUMMARY = {"p50_response_time": 0.010, "p95_response_time": 0.020, "p99_response_time": 0.030,
+                    "requests_per_second": 100.0, "failure_rate_percent": 0.0}
+
+
+@pytest.mark.parametrize("changes, current_shift, reason", [
+    ({}, 0.0, None),
+    ({"failure_rate_percent": 50.0}, 0.0, "başarısızlık oranı"),
+    ({"requests_per_second": 80.0}, 0.0, "RPS"),
+    ({"p99_response_time": 0.060}, 0.2, "p99_response_time"),
+])
+def test_compare_with_baseline(changes, current_shift, reason):
+    baseline_histogram = histogram_of([i / 1000 for i in range(1, 501)])
+    current_histogram = histogram_of([i / 1000 + current_shift for i in range(1, 501)])
+    comparison = app.compare_with_baseline({**BASELINE_SUMMARY, **changes}, current_histogram,
+                                           BASELINE_SUMMARY, baseline_histogram, max_regression_percent=10.0)
+    assert comparison["regression"] is (reason is not None)
+    if reason:
+        assert any(reason in text for text in comparison["regression_reasons"])
+
+
+def test_latency_increase_without_significant_distribution_change_is_not_a_regression():
+    histogram = histogram_of([i / 1000 for i in range(1, 501)])
+    comparison = app.compare_with_baseline({**BASELINE_SUMMARY, "p99_response_time": 0.060}, histogram,
+                                           BASELINE_SUMMARY, histogram, max_regression_percent=10.0)
+    assert not comparison["regression"]
+
+
+def test_endpoint_grouper_path_templates_and_folding():
+    urls = ["http://a.test/users/1", "http://a.test/users/2", "http://a.test/users/3",
+            "http://a.test/orders/550e8400-e29b-41d4-a716-446655440000", "http://b.test/rare", "http://c.test/rarer"]
+    grouper = app.EndpointGrouper(urls, grouping="path", max_groups=3)
+    assert grouper.group_for("http://a.test/users/2") == "a.test/users/{id}"
+    assert grouper.group_for("http://a.test/orders/550e8400-e29b-41d4-a716-446655440000") == "a.test/orders/{id}"
+    assert grouper.group_for("http://c.test/rarer") == app.OTHER_ENDPOINT_GROUP
+    assert grouper.group_for("http://unknown.test/") == app.OTHER_ENDPOINT_GROUP
+    assert grouper.folded_groups == 2
+
+
+def test_endpoint_grouper_host_and_regex():
+    urls = ["http://a.test/v1/x", "http://b.test/v2/y"]
+    assert app.EndpointGrouper(urls, grouping="host").group_for(urls[1]) == "b.test"
+    assert app.EndpointGrouper(urls, grouping="regex", pattern=r"/(v\d)/").group_for(urls[0]) == "v1"
+    with pytest.raises(ValueError):
+        app.EndpointGrouper(urls, grouping="regex", pattern="(")
+    with pytest.raises(ValueError):
+        app.EndpointGrouper(urls, grouping="nope")
+
+
+def chained(outer, cause):
+    try:
+        try:
+            raise cause
+        except BaseException as inner:
+            raise outer from inner
+    except BaseException as e:
+        return e
+
+
+@pytest.mark.parametrize("exc, expected", [
+    (asyncio.TimeoutError(), app.ErrorCode.TIMEOUT),
+    (ConnectionRefusedError(), app.ErrorCode.CONNECTION_REFUSED),
+    (OSError(errno.ECONNREFUSED, "refused"), app.ErrorCode.CONNECTION_REFUSED),
+    (ConnectionResetError(), app.ErrorCode.CONNECTION_RESET),
+    (app.UnansweredRequestError(), app.ErrorCode.CONNECTION_RESET),
+    (socket.gaierror(socket.EAI_NONAME, "no name"), app.ErrorCode.DNS_FAILURE),
+    (ssl.SSLCertVerificationError("bad cert"), app.ErrorCode.SSL_CERTIFICATE),
+    (ssl.SSLError("handshake"), app.ErrorCode.SSL_ERROR),
+    (app.HttpProtocolError("bad"), app.ErrorCode.PROTOCOL_ERROR),
+    (chained(RuntimeError("wrapper"), asyncio.TimeoutError()), app.ErrorCode.TIMEOUT),
+    (OSError(errno.EHOSTUNREACH, "unreachable"), app.ErrorCode.CONNECTION_ERROR),
+    (RuntimeError("bug"), app.ErrorCode.UNEXPECTED),
+])
+def test_classify_exception(exc, expected):
+    assert app.classify_exception(exc) is expected
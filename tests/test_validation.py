@@ -0,0 +1,75 @@
+"""Yanıt doğrulama: JSON yolu ayrıştırma ve ResponseValidator kontrolleri."""
+import json
+
+import pytest
+
+import app
+
+JSON_BODY = json.dumps({"data": {"items": [{"status": "ok", "count": 3}]}}).encode()
+
+
+def captured(status=200, headers=None, body=JSON_BODY):
+    return app.CapturedResponse(status, headers or {"content-type": "application/json"}, body)
+
+
+@pytest.mark.parametrize("text, steps", [
+    ("$.data.items[0].status", ["data", "items", 0, "status"]),
+    ("$.items", ["items"]),
+    ("items[2][0]", ["items", 2, 0]),
+])
+def test_parse_json_path(text, steps):
+    assert app.parse_json_path(text) == steps
+
+
+@pytest.mark.parametrize("text", ["", "$", "data[x]", "items[-1]", "a["])
+def test_parse_json_path_rejects_invalid(text):
+    with pytest.raises(ValueError):
+        app.parse_json_path(text)
+
+
+@pytest.mark.parametrize("config, response, kind", [
+    (app.ResponseCheckConfig(expected_statuses=(200,)), captured(), None),
+    (app.ResponseCheckConfig(expected_statuses=(200,)), captured(status=503), "status"),
+    (app.ResponseCheckConfig(min_size=1000), captured(), "size"),
+    (app.ResponseCheckConfig(max_size=10), captured(), "size"),
+    (app.ResponseCheckConfig(headers={"Content-Type": "json"}), captured(), None),
+    (app.ResponseCheckConfig(headers={"Content-Type": "xml"}), captured(), "header:content-type"),
+    (app.ResponseCheckConfig(headers={"X-Trace": "."}), captured(), "header:x-trace"),
+    (app.ResponseCheckConfig(body_contains="items"), captured(), None),
+    (app.ResponseCheckConfig(body_contains="error"), captured(), "body_contains"),
+    (app.ResponseCheckConfig(body_regex=r'"count": \d+'), captured(), None),
+    (app.ResponseCheckConfig(body_regex=r'"count": "'), captured(), "body_regex"),
+    (app.ResponseCheckConfig(json_path="data.items[0].status", json_value="ok"), captured(), None),
+    (app.ResponseCheckConfig(json_path="data.items[0].count", json_value="3"), captured(), None),
+    (app.ResponseCheckConfig(json_path="data.items[0].status", json_value="fail"), captured(), "json_path"),
+    (app.ResponseCheckConfig(json_path="data.items[1]"), captured(), "json_path"),
+    (app.ResponseCheckConfig(json_path="data.items[0]"), captured(body=b"not json"), "json_path"),
+])
+def test_validator_checks(config, response, kind):
+    validator = app.ResponseValidator(config)
+    reason = validator.check(response)
+    assert (reason is None) is (kind is None)
+    report = validator.get_report(duration=1.0)
+    assert report["checked"] == 1
+    assert report["failures"] == ({kind: 1} if kind else {})
+
+
+def test_validator_stops_at_first_failure_and_resets():
+    validator = app.ResponseValidator(app.ResponseCheckConfig(expected_statuses=(200,), body_contains="missing"))
+    validator.check(captured(status=500))
+    validator.check(captured())
+    assert validator.get_report(1.0)["failures"] == {"status": 1, "body_contains": 1}
+    validator.reset()
+    assert (validator.checked, validator.failed, dict(validator.failures)) == (0, 0, {})
+
+
+@pytest.mark.parametrize("config", [
+    app.ResponseCheckConfig(sample_rate=0.0),
+    app.ResponseCheckConfig(sample_rate=1.5),
+    app.ResponseCheckConfig(body_regex="("),
+    app.ResponseCheckConfig(headers={"x": "["}),
+    app.ResponseCheckConfig(json_path="a..[x"),
+])
+def test_validator_rejects_invalid_config(config):
+    with pytest.raises(ValueError):
+        app.ResponseValidator(config)